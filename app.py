@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import html
-import tempfile
-from pathlib import Path
+import os
 
 import streamlit as st
 
 from jobfit.analyze import analyze
+from jobfit.ingest.cache import content_hash
 from jobfit.ingest.pdf_extract import extract_text_from_pdf
+from jobfit.incremental import IncrementalProfiles
+from jobfit.result_cache import MemoryResultCache, SqliteResultCache, TieredResultCache
 
 
 # -----------------------------
@@ -155,6 +157,33 @@ st.markdown(
 )
 
 
+# -----------------------------
+# Cached work (keyed on content hashes, so widget reruns are free)
+# -----------------------------
+@st.cache_data(show_spinner=False, max_entries=256)
+def cached_pdf_text(resume_digest: str, _pdf_data) -> str:
+    return extract_text_from_pdf(_pdf_data)
+
+
+@st.cache_resource
+def result_cache() -> MemoryResultCache | TieredResultCache:
+    # Results hold resume-derived data, so by default they live in this
+    # process's memory only. Setting $JOBFIT_RESULT_CACHE to a SQLite file
+    # opts in to keeping them across restarts. Keys include the taxonomy
+    # version, so seed edits never serve stale results.
+    memory = MemoryResultCache(max_entries=256)
+    path = os.environ.get("JOBFIT_RESULT_CACHE")
+    return TieredResultCache(memory, SqliteResultCache(path)) if path else memory
+
+
+def session_profiles() -> IncrementalProfiles:
+    # Per session: re-analyzing after editing the JD (or uploading a revised
+    # resume) only re-extracts the changed lines; an unchanged side is reused.
+    if "profiles" not in st.session_state:
+        st.session_state["profiles"] = IncrementalProfiles()
+    return st.session_state["profiles"]
+
+
 # -----------------------------
 # Helpers
 # -----------------------------
@@ -243,12 +272,11 @@ with mid:
         if resume_file is None or not jd_text_input.strip():
             st.error("Please upload a resume and paste a job description.")
         else:
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-                tmp.write(resume_file.read())
-                pdf_path = Path(tmp.name)
-
-            resume_text = extract_text_from_pdf(pdf_path)
-            st.session_state["result"] = analyze(resume_text, jd_text_input)
+            pdf_data = resume_file.getbuffer()
+            resume_text = cached_pdf_text(content_hash(pdf_data), pdf_data)
+            st.session_state["result"] = analyze(
+                resume_text, jd_text_input, cache=result_cache(), profiles=session_profiles()
+            )
 
 with right:
     st.markdown("<div class='jf-card'>", unsafe_allow_html=True)
@@ -2,27 +2,86 @@
 
 from __future__ import annotations
 
-import json
-from pathlib import Path
-
-from jobfit.preprocess.normalize import normalize_text
-from jobfit.extract.skills import load_skills_seed, extract_skills
-from jobfit.extract.requirements import extract_requirement_lines
-from jobfit.extract.education import (
-    extract_education_block,
-    detect_degree_level,
-    detect_major_keywords,
-)
-from jobfit.extract.experience import extract_years_required, estimate_resume_years
-from jobfit.score.scoring import score_skills
-from jobfit.score.education_scoring import score_education
-from jobfit.score.experience_scoring import score_experience
-
-
-def analyze(resume_text: str, jd_text: str) -> dict:
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from jobfit.profile import CompactProfile, DocumentProfile, profile_jd, profile_resume, requirement_skills
+from jobfit.result_cache import ResultCache, result_key
+from jobfit.score.scoring import score_skills, skills_points_from_count
+from jobfit.score.education_scoring import education_points_from_matches, score_education
+from jobfit.score.experience_scoring import experience_points_from_years, score_experience
+from jobfit.taxonomy import Taxonomy, get_taxonomy
+from jobfit.timing import StageTimer, recording, stage
+
+if TYPE_CHECKING:
+    from jobfit.metrics import MetricsSink
+    from jobfit.profile_cache import ProfileCache
+
+SECTIONS = ("score", "skills", "education", "experience", "previews", "requirements")
+
+# Points available per component; part of every result-cache key.
+SKILLS_MAX = 50
+EDUCATION_MAX = 15
+EXPERIENCE_MAX = 35
+WEIGHTS = {"skills": SKILLS_MAX, "education": EDUCATION_MAX, "experience": EXPERIENCE_MAX}
+
+
+def resolve_sections(sections) -> frozenset[str]:
+    if sections is None:
+        return frozenset(SECTIONS)
+    sections = frozenset(sections)
+    unknown = sections - set(SECTIONS)
+    if unknown:
+        raise ValueError(f"Unknown sections: {sorted(unknown)} (choose from {', '.join(SECTIONS)})")
+    return sections
+
+
+def _profilers(profiles: ProfileCache | None):
+    if profiles is None:
+        return profile_resume, profile_jd
+    return profiles.profile_resume, profiles.profile_jd
+
+
+def analyze(
+    resume_text: str,
+    jd_text: str,
+    taxonomy: Taxonomy | None = None,
+    sections=None,
+    lazy: bool = False,
+    cache: ResultCache | None = None,
+    profiles: ProfileCache | None = None,
+    timings: bool | StageTimer = False,
+    metrics: MetricsSink | None = None,
+):
     """
     Shared analysis function used by both CLI and Streamlit.
 
+    `taxonomy` defaults to the process-wide one loaded from the bundled seeds.
+    `sections` limits the result to those top-level keys (default: all of
+    SECTIONS); sections that are not requested are not computed at all.
+    With lazy=True an AnalysisResult is returned instead of a dict and every
+    section is computed only when it is first read (so `sections`, `cache`,
+    `timings` and `metrics` cannot be combined with it).
+
+    With a `cache` (see jobfit.result_cache), results are looked up by the
+    hashes of both texts, the sections, the taxonomy version and WEIGHTS,
+    and only computed on a miss. Editing the seeds changes the version, so
+    stale entries are never returned.
+
+    With `profiles` (a ProfileCache), each document is only extracted the
+    first time it is seen, so a new pairing of known documents only runs the
+    scoring step. analyze_many() and analyze_matrix() accept it as well.
+    An IncrementalProfiles (see jobfit.incremental) can be passed instead,
+    so re-analyzing an edited resume or JD only re-extracts the edited lines.
+
+    With timings=True the result gets a "timings" section: total and
+    per-stage milliseconds (see jobfit.timing). Pass a StageTimer instead of
+    True to choose its options, e.g. StageTimer(allocations=True) for peak
+    allocations per stage. `metrics` is called with the same dict after
+    every analysis (see jobfit.metrics for JSONL and Prometheus sinks).
+    Stages are only timed when one of them is given.
+
     Returns a dict with:
     - score breakdown (skills + education + experience)
     - skills matched/missing
@@ -31,99 +90,291 @@ def analyze(resume_text: str, jd_text: str) -> dict:
     - previews (before/after normalize)
     - requirement coverage (skills-based)
     """
-    # Normalize text so matching is consistent
-    resume_norm = normalize_text(resume_text)
-    jd_norm = normalize_text(jd_text)
+    if taxonomy is None:
+        taxonomy = get_taxonomy()
+    resume_profile, jd_profile = _profilers(profiles)
+    if lazy:
+        if cache is not None:
+            raise ValueError("cache cannot be combined with lazy=True")
+        if timings or metrics is not None:
+            raise ValueError("timings and metrics cannot be combined with lazy=True")
+        if sections is not None:
+            # A lazy result computes only the sections that are read, so
+            # there is nothing to limit; silently ignoring them would mislead.
+            raise ValueError("sections cannot be combined with lazy=True; read only the sections you need")
+        return AnalysisResult(
+            resume_profile(resume_text, taxonomy),
+            jd_profile(jd_text, taxonomy, requirements=False),
+        )
+    sections = resolve_sections(sections)
 
-    # -------- Skills --------
-    seed = load_skills_seed(Path("src/data/skills_seed.json"))
+    if not timings and metrics is None:
+        return _analyze(resume_text, jd_text, taxonomy, sections, cache, resume_profile, jd_profile)
 
-    resume_skills = extract_skills(resume_norm, seed["skills"], seed["synonyms"])
-    jd_skills = extract_skills(jd_norm, seed["skills"], seed["synonyms"])
+    timer = timings if isinstance(timings, StageTimer) else StageTimer()
+    try:
+        with recording(timer):
+            result = _analyze(resume_text, jd_text, taxonomy, sections, cache, resume_profile, jd_profile)
+    finally:
+        if timer is not timings:
+            timer.close()
+    report = timer.to_dict()
+    if metrics is not None:
+        metrics(report)
+    if timings:
+        result = {**result, "timings": report}
+    return result
 
-    matched_skills = sorted(resume_skills & jd_skills)
-    missing_skills = sorted(jd_skills - resume_skills)
 
-    # Skills score (50 points)
-    skills_points = score_skills(jd_skills, resume_skills, max_points=50)
+def _analyze(resume_text, jd_text, taxonomy, sections, cache, resume_profile, jd_profile) -> dict:
+    if cache is not None:
+        with stage("cache.lookup"):
+            key = result_key(resume_text, jd_text, sections, taxonomy.version, WEIGHTS)
+            result = cache.get(key)
+        if result is not None:
+            return result
 
-    # -------- Education --------
-    majors_seed = json.loads(Path("src/data/majors_seed.json").read_text(encoding="utf-8"))
-    majors_list = majors_seed["majors"]
+    resume = resume_profile(resume_text, taxonomy)
+    jd = jd_profile(jd_text, taxonomy, requirements="requirements" in sections)
+    with stage("score"):
+        result = score_profiles(resume, jd, sections=sections)
+    if cache is not None:
+        with stage("cache.store"):
+            cache.put(key, result)
+    return result
 
-    jd_degree = detect_degree_level(jd_text)
-    jd_majors = detect_major_keywords(jd_text, majors_list)
 
-    resume_edu_block = extract_education_block(resume_text)
-    resume_degree = detect_degree_level(resume_edu_block)
-    resume_majors = detect_major_keywords(resume_edu_block, majors_list)
+def analyze_many(
+    resume_text: str,
+    jd_texts: list[str],
+    taxonomy: Taxonomy | None = None,
+    sections=None,
+    profiles: ProfileCache | None = None,
+) -> list[dict]:
+    """
+    Analyze one resume against many job descriptions.
 
-    edu = score_education(
-        jd_degree=jd_degree,
-        resume_degree=resume_degree,
-        jd_majors=jd_majors,
-        resume_majors=resume_majors,
-        max_points=15,
-    )
+    The resume is profiled once; results are in the same order as `jd_texts`.
+    """
+    if taxonomy is None:
+        taxonomy = get_taxonomy()
+    sections = resolve_sections(sections)
+    with_requirements = "requirements" in sections
+    resume_profile, jd_profile = _profilers(profiles)
 
-    # -------- Experience --------
-    jd_years_required = extract_years_required(jd_text)
-    resume_years_estimate = estimate_resume_years(resume_text)
+    resume = resume_profile(resume_text, taxonomy)
+    return [
+        score_profiles(resume, jd_profile(jd_text, taxonomy, with_requirements), sections)
+        for jd_text in jd_texts
+    ]
 
-    exp = score_experience(
-        jd_years_required=jd_years_required,
-        resume_years_estimate=resume_years_estimate,
-        max_points=35,
-    )
 
-    # -------- Requirement coverage (skills-based) --------
-    req_lines = extract_requirement_lines(jd_text)
-    coverage: list[dict] = []
-    for line in req_lines:
-        low = normalize_text(line)  # normalize line too
-        matched_in_line = [s for s in matched_skills if s in low]
-        missing_in_line = [s for s in missing_skills if s in low]
-        if matched_in_line or missing_in_line:
-            coverage.append(
-                {
-                    "line": line,
-                    "matched": matched_in_line,
-                    "missing": missing_in_line,
-                }
-            )
-
-    # -------- Total --------
-    total_points = skills_points + edu["education_total"] + exp["experience_total"]
-
-    return {
-        "score": {
-            "skills_points": skills_points,
-            "skills_max": 50,
-            "education_points": edu["education_total"],
-            "education_max": 15,
-            "experience_points": exp["experience_total"],
-            "experience_max": 35,
-            "total_points": total_points,
-            "total_max": 100,
+def analyze_matrix(
+    resume_texts: list[str],
+    jd_texts: list[str],
+    taxonomy: Taxonomy | None = None,
+    sections=None,
+    profiles: ProfileCache | None = None,
+) -> list[list[dict]]:
+    """
+    Analyze every resume against every job description.
+
+    Each document is profiled exactly once, so extraction costs O(M + N) and
+    only scoring runs M x N times. Returns one row per resume, one column per JD.
+    """
+    if taxonomy is None:
+        taxonomy = get_taxonomy()
+    sections = resolve_sections(sections)
+    with_requirements = "requirements" in sections
+    resume_profile, jd_profile = _profilers(profiles)
+
+    resumes = [resume_profile(text, taxonomy) for text in resume_texts]
+    jds = [jd_profile(text, taxonomy, with_requirements) for text in jd_texts]
+    return [[score_profiles(resume, jd, sections) for jd in jds] for resume in resumes]
+
+
+def score_profiles(resume: DocumentProfile, jd: DocumentProfile, sections=None) -> dict:
+    """Score a resume profile against a JD profile (the per-pair part of analyze)."""
+    return AnalysisResult(resume, jd).to_dict(sections)
+
+
+@dataclass(slots=True)
+class PairScore:
+    """Points of one resume/JD pair. to_dict() is the "score" section of analyze()."""
+
+    skills_points: int
+    education_points: int
+    experience_points: int
+
+    @property
+    def total_points(self) -> int:
+        return self.skills_points + self.education_points + self.experience_points
+
+    def to_dict(self) -> dict:
+        return {
+            "skills_points": self.skills_points,
+            "skills_max": SKILLS_MAX,
+            "education_points": self.education_points,
+            "education_max": EDUCATION_MAX,
+            "experience_points": self.experience_points,
+            "experience_max": EXPERIENCE_MAX,
+            "total_points": self.total_points,
+            "total_max": SKILLS_MAX + EDUCATION_MAX + EXPERIENCE_MAX,
             "note": "Total score includes skills + education + experience.",
-        },
-        "skills": {
-            "resume_skills": sorted(resume_skills),
-            "jd_skills": sorted(jd_skills),
-            "matched": matched_skills,
-            "missing": missing_skills,
-        },
-        "education": edu,
-        "experience": exp,
-        "previews": {
-            "resume_before": resume_text[:120],
-            "jd_before": jd_text[:120],
-            "resume_after": resume_norm[:120],
-            "jd_after": jd_norm[:120],
-            "resume_edu_block": resume_edu_block[:400],
-        },
-        "requirements": {
-            "lines": req_lines,
+        }
+
+
+def score_compact(resume: CompactProfile, jd: CompactProfile) -> PairScore:
+    """Same points as score_profiles(), from CompactProfile bitsets."""
+    return PairScore(
+        skills_points=skills_points_from_count((resume.skills & jd.skills).bit_count(), jd.n_skills, SKILLS_MAX),
+        education_points=education_points_from_matches(
+            degree_ok=jd.degree == 0 or resume.degree == jd.degree,
+            major_ok=not jd.majors or bool(resume.majors & jd.majors),
+            max_points=EDUCATION_MAX,
+        ),
+        experience_points=experience_points_from_years(jd.years, resume.years, EXPERIENCE_MAX),
+    )
+
+
+class AnalysisResult(Mapping):
+    """
+    Lazy analyze() result: each section is computed on first access and then
+    memoized. Reads like the plain result dict (`result["score"]`).
+
+    `total_points` only runs the three point functions, without building the
+    skill lists, coverage or previews. If the JD profile was built without
+    requirement lines, they are extracted when "requirements" is first read.
+    """
+
+    __slots__ = ("resume", "jd", "_cache")
+
+    def __init__(self, resume: DocumentProfile, jd: DocumentProfile):
+        self.resume = resume
+        self.jd = jd
+        self._cache: dict = {}
+
+    def __getitem__(self, key: str):
+        if key not in SECTIONS:
+            raise KeyError(key)
+        if key not in self._cache:
+            self._cache[key] = getattr(self, f"_build_{key}")()
+        return self._cache[key]
+
+    def __iter__(self):
+        return iter(SECTIONS)
+
+    def __len__(self) -> int:
+        return len(SECTIONS)
+
+    def to_dict(self, sections=None) -> dict:
+        sections = resolve_sections(sections)
+        return {key: self[key] for key in SECTIONS if key in sections}
+
+    # -------- Points (shared by every section) --------
+    def _memo(self, key: str, build):
+        if key not in self._cache:
+            self._cache[key] = build()
+        return self._cache[key]
+
+    @property
+    def skills_points(self) -> int:
+        # Skills score (50 points)
+        return self._memo("_skills_points", lambda: score_skills(self.jd.skills, self.resume.skills, max_points=SKILLS_MAX))
+
+    @property
+    def education(self) -> dict:
+        return self._memo(
+            "_education",
+            lambda: score_education(
+                jd_degree=self.jd.degree,
+                resume_degree=self.resume.degree,
+                jd_majors=self.jd.majors,
+                resume_majors=self.resume.majors,
+                max_points=EDUCATION_MAX,
+            ),
+        )
+
+    @property
+    def experience(self) -> dict:
+        return self._memo(
+            "_experience",
+            lambda: score_experience(
+                jd_years_required=self.jd.years,
+                resume_years_estimate=self.resume.years,
+                max_points=EXPERIENCE_MAX,
+            ),
+        )
+
+    @property
+    def total_points(self) -> int:
+        return self.skills_points + self.education["education_total"] + self.experience["experience_total"]
+
+    @property
+    def pair_score(self) -> PairScore:
+        return PairScore(
+            skills_points=self.skills_points,
+            education_points=self.education["education_total"],
+            experience_points=self.experience["experience_total"],
+        )
+
+    @property
+    def matched_skills(self) -> list[str]:
+        return self._memo("_matched", lambda: sorted(self.resume.skills & self.jd.skills))
+
+    @property
+    def missing_skills(self) -> list[str]:
+        return self._memo("_missing", lambda: sorted(self.jd.skills - self.resume.skills))
+
+    # -------- Sections --------
+    def _build_score(self) -> dict:
+        return self.pair_score.to_dict()
+
+    def _build_skills(self) -> dict:
+        return {
+            "resume_skills": sorted(self.resume.skills),
+            "jd_skills": sorted(self.jd.skills),
+            "matched": self.matched_skills,
+            "missing": self.missing_skills,
+        }
+
+    def _build_education(self) -> dict:
+        return self.education
+
+    def _build_experience(self) -> dict:
+        return self.experience
+
+    def _build_previews(self) -> dict:
+        return {
+            "resume_before": self.resume.text[:120],
+            "jd_before": self.jd.text[:120],
+            "resume_after": self.resume.norm[:120],
+            "jd_after": self.jd.norm[:120],
+            "resume_edu_block": self.resume.edu_block[:400],
+        }
+
+    def _build_requirements(self) -> dict:
+        jd = self.jd
+        if jd.requirement_lines is not None:
+            lines, line_skills = jd.requirement_lines, jd.requirement_skills
+        else:
+            lines, line_skills = requirement_skills(jd.text, jd.skill_spans)
+
+        # -------- Requirement coverage (skills-based) --------
+        # Built from the skill matches found while scanning the JD, so no
+        # per-line substring checks (which also made "r" match inside words).
+        resume_skills = self.resume.skills
+        coverage: list[dict] = []
+        for line, skills in zip(lines, line_skills):
+            if skills:
+                coverage.append(
+                    {
+                        "line": line,
+                        "matched": sorted(skills & resume_skills),
+                        "missing": sorted(skills - resume_skills),
+                    }
+                )
+        return {
+            "lines": list(lines),
             "coverage": coverage,
-        },
-    }
+        }
@@ -0,0 +1,3 @@
+from jobfit.bench.suite import main
+
+main()
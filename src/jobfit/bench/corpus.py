@@ -0,0 +1,189 @@
+# src/jobfit/bench/corpus.py
+"""
+Deterministic synthetic resumes and job descriptions for benchmarks.
+
+Documents are laid out like real ones (headers, bullets, date ranges,
+degree lines) and draw skills, aliases and majors from the seed taxonomy,
+so every extractor has realistic work to do. The same CorpusSpec always
+produces the same texts.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+
+from jobfit.taxonomy import Taxonomy, get_taxonomy
+
+DEGREE_PHRASES = {
+    "bachelors": ("B.S. in", "Bachelor of Science in", "BA,", "Bachelor's degree in"),
+    "masters": ("M.S. in", "Master of Science in", "MBA,", "Master's degree in"),
+    "phd": ("Ph.D. in", "PhD,", "Doctorate in"),
+    None: ("Coursework in", "Certificate program in"),
+}
+
+_FILLER = (
+    "team", "built", "delivered", "stakeholders", "reports", "weekly", "clients", "improved",
+    "process", "project", "launched", "across", "product", "partnered", "with", "owned",
+    "the", "and", "for", "our", "users", "growth", "quality", "customer", "operations",
+    "planning", "teams", "strategy", "daily", "new", "internal", "tools", "results",
+)
+_TITLES = ("Data Analyst", "Software Engineer", "Data Scientist", "Analytics Engineer", "Research Assistant")
+_COMPANIES = ("Acme Corp", "Globex", "Initech", "Umbrella Labs", "Stark Industries", "Hooli")
+_JD_CUES = ("Experience with", "Proficient in", "Knowledge of", "Must know", "Familiar with")
+LAST_YEAR = 2024
+
+
+@dataclass(frozen=True)
+class CorpusSpec:
+    """
+    What to generate. `skill_density` is the share of body words that are
+    skill mentions, `alias_rate` the share of those written as a synonym.
+    `degree_mix` weights the degree levels (None means no degree line);
+    `resume_years` and `jd_years` are inclusive ranges of career length and
+    required experience.
+    """
+
+    n_resumes: int = 200
+    n_jds: int = 10
+    resume_words: int = 350
+    jd_words: int = 250
+    skill_density: float = 0.08
+    alias_rate: float = 0.1
+    degree_mix: dict[str | None, float] = field(
+        default_factory=lambda: {None: 0.1, "bachelors": 0.5, "masters": 0.3, "phd": 0.1}
+    )
+    resume_years: tuple[int, int] = (0, 15)
+    jd_years: tuple[int, int] = (1, 8)
+    seed: int = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "n_resumes": self.n_resumes,
+            "n_jds": self.n_jds,
+            "resume_words": self.resume_words,
+            "jd_words": self.jd_words,
+            "skill_density": self.skill_density,
+            "alias_rate": self.alias_rate,
+            "degree_mix": {str(level): weight for level, weight in self.degree_mix.items()},
+            "resume_years": list(self.resume_years),
+            "jd_years": list(self.jd_years),
+            "seed": self.seed,
+        }
+
+
+@dataclass(frozen=True)
+class Corpus:
+    spec: CorpusSpec
+    resumes: list[str]
+    jds: list[str]
+
+    def pairs(self, limit: int | None = None) -> list[tuple[str, str]]:
+        """(resume, jd) pairs, every resume against the first JD, then the second, ..."""
+        pairs = [(resume, jd) for jd in self.jds for resume in self.resumes]
+        return pairs if limit is None else pairs[:limit]
+
+
+class _Writer:
+    def __init__(self, spec: CorpusSpec, taxonomy: Taxonomy, rng: random.Random):
+        self.spec = spec
+        self.rng = rng
+        self.skills = list(taxonomy.skills)
+        self.aliases: dict[str, list[str]] = {}
+        for alias, canonical in sorted(taxonomy.synonyms.items()):
+            self.aliases.setdefault(canonical, []).append(alias)
+        self.majors = list(taxonomy.majors)
+        self.levels = list(spec.degree_mix)
+        self.weights = [spec.degree_mix[level] for level in self.levels]
+
+    def mention(self, skill: str) -> str:
+        aliases = self.aliases.get(skill)
+        if aliases and self.rng.random() < self.spec.alias_rate:
+            return self.rng.choice(aliases)
+        return skill
+
+    def skill_sample(self, n_words: int) -> list[str]:
+        n = max(1, min(len(self.skills), round(n_words * self.spec.skill_density)))
+        return self.rng.sample(self.skills, n)
+
+    def sentence(self, skills: list[str], n_words: int) -> str:
+        words = [self.rng.choice(_FILLER) for _ in range(max(n_words - len(skills), 0))]
+        for skill in skills:
+            words.insert(self.rng.randint(0, len(words)), self.mention(skill))
+        return " ".join(words)
+
+    def degree_line(self) -> tuple[str | None, str]:
+        level = self.rng.choices(self.levels, self.weights)[0]
+        return level, f"{self.rng.choice(DEGREE_PHRASES[level])} {self.rng.choice(self.majors).title()}"
+
+    def resume(self) -> str:
+        rng = self.rng
+        skills = self.skill_sample(self.spec.resume_words)
+        listed, prose = skills[: len(skills) // 3], skills[len(skills) // 3 :]
+
+        career = rng.randint(*self.spec.resume_years)
+        n_jobs = min(max(1, career // 4 + rng.randint(0, 1)), 4) if career else 0
+        bullets = 3 * max(n_jobs, 1)
+        words_per_bullet = max(self.spec.resume_words // (bullets + 1), 4)
+
+        lines = [f"Candidate {rng.randint(1000, 9999)}", "Summary", self.sentence(prose[:2], words_per_bullet)]
+        prose = prose[2:]
+        lines.append("Experience")
+        end = LAST_YEAR
+        for job in range(n_jobs):
+            length = max(career // n_jobs - 1, 0)
+            start = end - length
+            until = "Present" if job == 0 and rng.random() < 0.5 else str(end)
+            lines.append(f"{rng.choice(_TITLES)}, {rng.choice(_COMPANIES)} {start}-{until}")
+            for b in range(3):
+                chunk = prose[b :: 3 * n_jobs] if job == 0 else prose[job * 3 + b :: 3 * n_jobs]
+                lines.append("- " + self.sentence(chunk, words_per_bullet))
+            end = start - 1
+        _, degree = self.degree_line()
+        lines += ["Education", f"{degree}, State University {end - rng.randint(0, 2)}"]
+        lines.append("Skills: " + ", ".join(self.mention(s) for s in listed))
+        return "\n".join(lines)
+
+    def jd(self) -> str:
+        rng = self.rng
+        skills = self.skill_sample(self.spec.jd_words)
+        required, preferred, about = skills[: len(skills) // 2], skills[len(skills) // 2 : -1], skills[-1:]
+        words = max(self.spec.jd_words // 8, 4)
+
+        low = rng.randint(*self.spec.jd_years)
+        years = f"{low}-{low + 2} years" if rng.random() < 0.5 else f"{low}+ years"
+        _, degree = self.degree_line()
+
+        lines = [rng.choice(_TITLES), "About the role", self.sentence(about, words * 2), "Requirements"]
+        lines.append(f"- {years} of experience in {self.sentence([], 3)}")
+        for i in range(0, len(required), 3):
+            lines.append(f"- {rng.choice(_JD_CUES)} {', '.join(self.mention(s) for s in required[i : i + 3])}")
+        lines.append(f"- {degree} or a related field")
+        lines.append("Nice to have")
+        for i in range(0, len(preferred), 3):
+            lines.append(f"- Familiar with {', '.join(self.mention(s) for s in preferred[i : i + 3])}")
+        lines.append("Responsibilities")
+        lines += ["- " + self.sentence([], words) for _ in range(3)]
+        lines.append("Benefits")
+        lines += ["- " + self.sentence([], words) for _ in range(2)]
+        return "\n".join(lines)
+
+
+def generate_corpus(spec: CorpusSpec | None = None, taxonomy: Taxonomy | None = None) -> Corpus:
+    if spec is None:
+        spec = CorpusSpec()
+    if taxonomy is None:
+        taxonomy = get_taxonomy()
+    if not spec.degree_mix or min(spec.degree_mix.values()) < 0 or not sum(spec.degree_mix.values()):
+        raise ValueError("degree_mix needs non-negative weights with a positive sum")
+    if not 0 <= spec.skill_density <= 1 or not 0 <= spec.alias_rate <= 1:
+        raise ValueError("skill_density and alias_rate must be between 0 and 1")
+
+    # Separate streams, so changing the number of JDs does not change the resumes.
+    resumes = _Writer(spec, taxonomy, random.Random(f"{spec.seed}:resumes"))
+    jds = _Writer(spec, taxonomy, random.Random(f"{spec.seed}:jds"))
+    return Corpus(
+        spec=spec,
+        resumes=[resumes.resume() for _ in range(spec.n_resumes)],
+        jds=[jds.jd() for _ in range(spec.n_jds)],
+    )
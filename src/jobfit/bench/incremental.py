@@ -0,0 +1,69 @@
+# src/jobfit/bench/incremental.py
+"""
+Re-profiling an edited document: profile_resume() / profile_jd() on the
+whole new version vs IncrementalProfiler.update() after a one-line edit.
+
+Every run edits a different line, so the incremental side always has work
+to do; both sides are checked to produce the same profile.
+
+Run from the repo root:
+    python -m jobfit.bench.incremental
+    python -m jobfit.bench.incremental --documents 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from jobfit.bench.corpus import CorpusSpec, generate_corpus
+from jobfit.incremental import IncrementalProfiler
+from jobfit.profile import profile_jd, profile_resume
+from jobfit.taxonomy import get_taxonomy
+
+
+def _median_ms(times: list[float]) -> float:
+    times = sorted(times)
+    return times[len(times) // 2] * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark incremental vs full re-profiling after an edit.")
+    parser.add_argument("--documents", type=int, default=40, help="Corpus documents joined into one long document.")
+    parser.add_argument("--edits", type=int, default=50)
+    args = parser.parse_args()
+
+    taxonomy = get_taxonomy()
+    corpus = generate_corpus(CorpusSpec(n_resumes=args.documents, n_jds=args.documents), taxonomy)
+
+    print(f"{'kind':<7} {'chars':>8} {'lines':>6} {'full ms':>8} {'incr ms':>8} {'speedup':>8}")
+    for kind, docs, full in (("resume", corpus.resumes, profile_resume), ("jd", corpus.jds, profile_jd)):
+        text = "\n".join(docs)
+        lines = text.splitlines(keepends=True)
+        profiler = IncrementalProfiler(kind)
+        profiler.update(text, taxonomy)
+
+        full_times, incremental_times = [], []
+        for i in range(args.edits):
+            k = (i * 37) % len(lines)
+            lines[k] = lines[k].rstrip("\n") + " and Python\n"
+            text = "".join(lines)
+
+            start = time.perf_counter()
+            incremental = profiler.update(text, taxonomy)
+            incremental_times.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            expected = full(text, taxonomy)
+            full_times.append(time.perf_counter() - start)
+            if incremental != expected:
+                raise SystemExit(f"incremental {kind} profile differs after edit {i}")
+
+        full_ms, incremental_ms = _median_ms(full_times), _median_ms(incremental_times)
+        print(
+            f"{kind:<7} {len(text):>8} {len(lines):>6} {full_ms:>8.2f} {incremental_ms:>8.2f} "
+            f"{full_ms / incremental_ms:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
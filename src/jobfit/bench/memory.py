@@ -0,0 +1,89 @@
+# src/jobfit/bench/memory.py
+"""
+Per-profile and per-result memory: string sets and dicts vs compact forms.
+
+Compares what ranking keeps per candidate (skills/majors as frozensets of
+names, the score section as a dict) with CompactProfile (int bitsets over
+the taxonomy's dense ids) and PairScore (a __slots__ dataclass). Sizes are
+measured with tracemalloc around building N objects.
+
+Run from the repo root:
+    python -m jobfit.bench.memory
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import tracemalloc
+
+from jobfit.analyze import AnalysisResult, score_compact
+from jobfit.profile import DocumentProfile, compact_profile
+from jobfit.taxonomy import get_taxonomy
+
+
+def synthetic_profiles(n: int, skills_per_resume: int, seed: int = 0) -> list[DocumentProfile]:
+    """Resume profiles with random canonical skills (no text, so only scoring fields count)."""
+    rng = random.Random(seed)
+    taxonomy = get_taxonomy()
+    degrees = [None, "bachelors", "masters", "phd"]
+    return [
+        DocumentProfile(
+            kind="resume",
+            text="",
+            norm="",
+            skills=frozenset(rng.sample(taxonomy.skills, skills_per_resume)),
+            degree=rng.choice(degrees),
+            majors=frozenset(rng.sample(taxonomy.majors, rng.randint(0, 2))),
+            years=float(rng.randint(0, 15)),
+        )
+        for _ in range(n)
+    ]
+
+
+def bytes_per_item(build) -> float:
+    """Bytes still allocated per item after build() returns its list."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    items = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / len(items)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark profile / result memory footprint.")
+    parser.add_argument("--n", type=int, default=50_000, help="Number of profiles.")
+    parser.add_argument("--skills", type=int, default=12, help="Skills per synthetic resume.")
+    args = parser.parse_args()
+
+    taxonomy = get_taxonomy()
+    profiles = synthetic_profiles(args.n, args.skills)
+    jd = profiles[0]
+    compact_jd = compact_profile(jd, taxonomy)
+
+    rows = [
+        (
+            "profile: frozensets of names",
+            bytes_per_item(
+                # frozenset(a_frozenset) returns the same object, so copy through a list.
+                lambda: [(frozenset(list(p.skills)), p.degree, frozenset(list(p.majors)), p.years) for p in profiles]
+            ),
+        ),
+        ("profile: CompactProfile", bytes_per_item(lambda: [compact_profile(p, taxonomy) for p in profiles])),
+        ("result: score dict", bytes_per_item(lambda: [AnalysisResult(p, jd)["score"] for p in profiles])),
+        (
+            "result: PairScore",
+            bytes_per_item(lambda: [score_compact(compact_profile(p, taxonomy), compact_jd) for p in profiles]),
+        ),
+    ]
+
+    print(f"{args.n} profiles, {args.skills} skills each")
+    for name, size in rows:
+        print(f"{name:<32} {size:>8.1f} bytes/item")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# src/jobfit/bench/normalize.py
+"""
+Normalizer throughput: the original lower + two re.sub passes vs the fused
+normalize_text, plus the cost of building the offset map.
+
+Run from the repo root:
+    python -m jobfit.bench.normalize
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import time
+
+from jobfit.preprocess.normalize import normalize_text, normalize_with_offsets
+
+
+def legacy_normalize_text(text: str) -> str:
+    text = text.lower()
+    text = re.sub(r"[^a-z0-9]+", " ", text)
+    text = re.sub(r"\s+", " ", text).strip()
+    return text
+
+
+def synthetic_document(n_chars: int, ascii_only: bool, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    words = ["Python", "SQL,", "(pandas)", "3-5 years", "B.S.", "•", "Data-Science", "\n", "2019–2022"]
+    if not ascii_only:
+        words += ["Café", "naïve", "“quoted”", "—"]
+    parts: list[str] = []
+    size = 0
+    while size < n_chars:
+        w = rng.choice(words)
+        parts.append(w)
+        size += len(w) + 1
+    return " ".join(parts)
+
+
+def _throughput(fn, text: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - start)
+    return len(text) / best / 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark text normalization throughput (MB/s).")
+    parser.add_argument("--chars", type=int, default=500_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'input':>10} {'legacy':>9} {'fused':>9} {'offsets':>9}  (MB/s)")
+    for label, ascii_only in (("ascii", True), ("unicode", False)):
+        text = synthetic_document(args.chars, ascii_only)
+        assert normalize_text(text) == legacy_normalize_text(text)
+        print(
+            f"{label:>10} "
+            f"{_throughput(legacy_normalize_text, text, args.repeat):>9.1f} "
+            f"{_throughput(normalize_text, text, args.repeat):>9.1f} "
+            f"{_throughput(normalize_with_offsets, text, args.repeat):>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
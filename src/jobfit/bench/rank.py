@@ -0,0 +1,75 @@
+# src/jobfit/bench/rank.py
+"""
+Top-k ranking: rank() with upper-bound pruning vs scoring every candidate
+with score_compact() and taking heapq.nlargest(), at several k, for an
+in-memory mapping of compact profiles and for a memory-mapped ProfileStore.
+
+Both sides are checked to return the same keys and scores in the same order.
+
+Run from the repo root:
+    python -m jobfit.bench.rank
+    python -m jobfit.bench.rank --profiles 1000000 --k 1 10 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import tempfile
+import time
+from pathlib import Path
+
+from jobfit.analyze import score_compact
+from jobfit.bench.store import JD, synthetic_profiles
+from jobfit.profile import compact_profile, profile_jd
+from jobfit.profile_store import ProfileStore, write_profile_store
+from jobfit.rank import RankedCandidate, RankStats, rank
+from jobfit.taxonomy import get_taxonomy
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    value = fn()
+    return value, (time.perf_counter() - start) * 1000
+
+
+def exhaustive(jd_compact, profiles: dict, k: int) -> list[RankedCandidate]:
+    scored = (RankedCandidate(key, score_compact(p, jd_compact)) for key, p in profiles.items())
+    return heapq.nlargest(k, scored, key=lambda c: c.score.total_points)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark pruned vs exhaustive top-k ranking.")
+    parser.add_argument("--profiles", type=int, default=200_000)
+    parser.add_argument("--skills-per-resume", type=int, default=15)
+    parser.add_argument("--k", type=int, nargs="+", default=[1, 10, 100, 1000])
+    args = parser.parse_args()
+
+    taxonomy = get_taxonomy()
+    jd = profile_jd(JD, taxonomy, requirements=False)
+    jd_compact = compact_profile(jd, taxonomy)
+    profiles = dict(
+        synthetic_profiles(args.profiles, args.skills_per_resume, len(taxonomy.skill_names), len(taxonomy.major_names))
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store_path = Path(tmp, "profiles.jfps")
+        write_profile_store(store_path, profiles.items(), taxonomy)
+        with ProfileStore(store_path) as store:
+            print(f"profiles: {args.profiles}, JD skills: {len(jd.skills)}")
+            print(f"{'k':>6} {'exhaustive ms':>14} {'mapping ms':>11} {'store ms':>9} {'scored':>8} {'speedup':>8}")
+            for k in args.k:
+                expected, exhaustive_ms = _timed(lambda: exhaustive(jd_compact, profiles, k))
+                stats = RankStats()
+                pruned, mapping_ms = _timed(lambda: rank(jd, profiles, k, taxonomy, stats))
+                from_store, store_ms = _timed(lambda: rank(jd, store, k, taxonomy))
+                if pruned != expected or from_store != expected:
+                    raise SystemExit(f"pruned ranking differs from exhaustive at k={k}")
+                print(
+                    f"{k:>6} {exhaustive_ms:>14.0f} {mapping_ms:>11.0f} {store_ms:>9.0f} "
+                    f"{stats.scored / stats.candidates:>7.1%} {exhaustive_ms / mapping_ms:>7.1f}x"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# src/jobfit/bench/sections.py
+"""
+Cost of a full analyze() vs score-only analysis.
+
+Measures end-to-end analyze() and, separately, the per-pair step for a
+profile shared across many JDs (score_profiles), which is where unrequested
+sections dominate.
+
+Run from the repo root:
+    python -m jobfit.bench.sections
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from jobfit.analyze import AnalysisResult, analyze, score_profiles
+from jobfit.profile import profile_jd, profile_resume
+from jobfit.taxonomy import get_taxonomy
+
+_CUES = ["Required:", "Must have", "Experience with", "Proficient in", "Knowledge of", "Nice to have:"]
+
+
+def synthetic_pair(n_lines: int, seed: int = 0) -> tuple[str, str]:
+    rng = random.Random(seed)
+    skills = get_taxonomy().skills
+
+    def lines(with_cues: bool) -> str:
+        out = []
+        for _ in range(n_lines):
+            picked = ", ".join(rng.sample(skills, 4))
+            prefix = rng.choice(_CUES) if with_cues else "Worked with"
+            out.append(f"- {prefix} {picked}")
+        return "\n".join(out)
+
+    resume = "Education: M.S. Statistics\n" + lines(False) + "\nAnalyst 2018-2023"
+    jd = "Requirements\n" + lines(True) + "\n3+ years of experience. Master's degree."
+    return resume, jd
+
+
+def _per_call(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark full vs score-only analysis.")
+    parser.add_argument("--lines", type=int, default=60, help="Lines per synthetic document.")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    resume_text, jd_text = synthetic_pair(args.lines)
+    resume, jd = profile_resume(resume_text), profile_jd(jd_text)
+    score = {"score"}
+
+    rows = [
+        ("analyze, all sections", _per_call(lambda: analyze(resume_text, jd_text), args.repeat)),
+        ("analyze, sections={score}", _per_call(lambda: analyze(resume_text, jd_text, sections=score), args.repeat)),
+        ("analyze(lazy).total_points", _per_call(lambda: analyze(resume_text, jd_text, lazy=True).total_points, args.repeat)),
+        ("score_profiles, all sections", _per_call(lambda: score_profiles(resume, jd), args.repeat)),
+        ("score_profiles, sections={score}", _per_call(lambda: score_profiles(resume, jd, score), args.repeat)),
+        ("AnalysisResult.total_points", _per_call(lambda: AnalysisResult(resume, jd).total_points, args.repeat)),
+    ]
+
+    baseline = {"analyze": rows[0][1], "score_profiles": rows[3][1]}
+    print(f"{'mode':<34} {'us/call':>10} {'vs full':>8}")
+    for label, seconds in rows:
+        full = baseline["score_profiles"] if label.startswith(("score_profiles", "AnalysisResult")) else baseline["analyze"]
+        print(f"{label:<34} {seconds * 1e6:>10.1f} {full / seconds:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# src/jobfit/bench/service.py
+"""
+Load test for `jobfit serve`: concurrent /analyze requests over keep-alive
+connections, reporting client-side throughput and p50/p99 latency next to
+the server's own /stats (including how well requests were batched).
+
+Without --port a server is started on a free port for the run.
+
+Run from the repo root:
+    python -m jobfit.bench.service
+    python -m jobfit.bench.service --port 8000 --requests 5000 --concurrency 64
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import signal
+import subprocess
+import sys
+import time
+
+from jobfit.service import LatencyStats, ServiceClient
+from jobfit.taxonomy import get_taxonomy
+
+
+def synthetic_documents(n_resumes: int, n_jds: int, seed: int = 0) -> tuple[list[str], list[str]]:
+    rng = random.Random(seed)
+    skills = get_taxonomy().skills
+    resumes = [
+        f"Education: B.S. Computer Science\nSkills: {', '.join(rng.sample(skills, 12))}\n"
+        f"Analyst {2024 - rng.randint(1, 10)}-2024"
+        for _ in range(n_resumes)
+    ]
+    jds = [
+        f"Requirements:\n- {rng.randint(1, 6)}+ years of experience\n"
+        f"- Experience with {', '.join(rng.sample(skills, 8))}\n- Bachelor's degree in computer science"
+        for _ in range(n_jds)
+    ]
+    return resumes, jds
+
+
+async def run_load(host: str, port: int, payloads: list[dict], concurrency: int) -> tuple[float, LatencyStats, dict]:
+    latency = LatencyStats(window=len(payloads))
+    queue = iter(payloads)
+    failures = 0
+
+    async def worker() -> None:
+        nonlocal failures
+        client = ServiceClient(host, port)
+        try:
+            for payload in queue:
+                start = time.perf_counter()
+                status, _ = await client.request("POST", "/analyze", payload)
+                latency.record("/analyze", time.perf_counter() - start)
+                failures += status != 200
+        finally:
+            await client.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    client = ServiceClient(host, port)
+    _, server_stats = await client.request("GET", "/stats")
+    await client.close()
+    if failures:
+        print(f"warning: {failures} requests failed", file=sys.stderr)
+    return elapsed, latency, server_stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load-test the jobfit HTTP service.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=None, help="Port of a running server (default: start one).")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes for the started server.")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--jds", type=int, default=4, help="Distinct JDs shared by the requests.")
+    parser.add_argument("--batch-window-ms", type=float, default=2.0, help="Batch window of the started server.")
+    args = parser.parse_args()
+
+    resumes, jds = synthetic_documents(500, args.jds)
+    rng = random.Random(1)
+    payloads = [{"resume": rng.choice(resumes), "jd": rng.choice(jds)} for _ in range(args.requests)]
+
+    server = None
+    port = args.port
+    if port is None:
+        cmd = [
+            sys.executable, "-m", "jobfit.cli", "serve", "--host", args.host, "--port", "0",
+            "--batch-window-ms", str(args.batch_window_ms),
+        ]
+        if args.workers:
+            cmd += ["--workers", str(args.workers)]
+        server = subprocess.Popen(cmd, stderr=subprocess.PIPE, text=True)
+        port = int(server.stderr.readline().rsplit(":", 1)[1])
+
+    try:
+        elapsed, latency, server_stats = asyncio.run(run_load(args.host, port, payloads, args.concurrency))
+    finally:
+        if server is not None:
+            server.send_signal(signal.SIGINT)
+            server.wait(timeout=30)
+
+    client = latency.summary()["/analyze"]
+    print(f"{args.requests} requests, concurrency {args.concurrency}, {args.jds} distinct JDs")
+    print(f"client: {args.requests / elapsed:>9.1f} req/s   p50 {client['p50_ms']} ms   p99 {client['p99_ms']} ms")
+    served = server_stats["latency"].get("/analyze", {})
+    print(f"server: p50 {served.get('p50_ms')} ms   p99 {served.get('p99_ms')} ms")
+    print(f"batches: {server_stats['batches']}   mean batch size {server_stats['mean_batch_size']}")
+
+
+if __name__ == "__main__":
+    main()
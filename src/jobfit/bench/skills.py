@@ -0,0 +1,101 @@
+# src/jobfit/bench/skills.py
+"""
+Skill matching benchmark: per-skill regex loop vs the compiled matcher.
+
+Run from the repo root:
+    python -m jobfit.bench.skills
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from jobfit.extract.matcher import SkillMatcher
+from jobfit.extract.skills import _contains
+
+
+def synthetic_vocabulary(size: int, seed: int = 0) -> tuple[list[str], dict[str, str]]:
+    """Mix of single-token, multiword and hyphenated skills plus ~20% aliases."""
+    rng = random.Random(seed)
+    skills: list[str] = []
+    for i in range(size):
+        kind = rng.random()
+        if kind < 0.6:
+            skills.append(f"tool{i}")
+        elif kind < 0.9:
+            skills.append(f"method {i} analysis")
+        else:
+            skills.append(f"multi-{i}")
+    synonyms = {f"alias{i}": rng.choice(skills) for i in range(size // 5)}
+    return skills, synonyms
+
+
+def synthetic_text(skills: list[str], n_words: int = 800, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    filler = ["experience", "with", "data", "team", "built", "the", "and", "models"]
+    words = [rng.choice(skills) if rng.random() < 0.05 else rng.choice(filler) for _ in range(n_words)]
+    return " ".join(words)
+
+
+def _loop_extract(text: str, skills: list[str], synonyms: dict[str, str]) -> set[str]:
+    found: set[str] = set()
+    for skill in skills:
+        if _contains(text, skill):
+            found.add(skill)
+    for alias, canonical in synonyms.items():
+        if _contains(text, alias):
+            found.add(canonical)
+    return found
+
+
+def _time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(sizes: list[int], n_words: int, repeat: int) -> list[dict]:
+    rows = []
+    for size in sizes:
+        skills, synonyms = synthetic_vocabulary(size)
+        text = synthetic_text(skills, n_words)
+
+        build = _time(lambda: SkillMatcher(skills, synonyms), 1)
+        matcher = SkillMatcher(skills, synonyms)
+        assert matcher.extract(text) == _loop_extract(text, skills, synonyms)
+
+        rows.append(
+            {
+                "vocabulary": size + len(synonyms),
+                "text_chars": len(text),
+                "loop_ms": _time(lambda: _loop_extract(text, skills, synonyms), repeat) * 1000,
+                "matcher_ms": _time(lambda: matcher.extract(text), repeat) * 1000,
+                "build_ms": build * 1000,
+            }
+        )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark skill extraction vs vocabulary size.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[300, 1000, 3000, 10000])
+    parser.add_argument("--words", type=int, default=800, help="Words per synthetic document.")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'vocab':>8} {'chars':>7} {'loop ms':>10} {'matcher ms':>11} {'speedup':>8} {'build ms':>9}")
+    for row in run(args.sizes, args.words, args.repeat):
+        speedup = row["loop_ms"] / row["matcher_ms"] if row["matcher_ms"] else float("inf")
+        print(
+            f"{row['vocabulary']:>8} {row['text_chars']:>7} {row['loop_ms']:>10.2f} "
+            f"{row['matcher_ms']:>11.2f} {speedup:>7.1f}x {row['build_ms']:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
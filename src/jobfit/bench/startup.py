@@ -0,0 +1,107 @@
+# src/jobfit/bench/startup.py
+"""
+CLI startup cost: `python -X importtime -c "import jobfit.cli"` in a fresh
+interpreter, plus the wall time of a whole small CLI run.
+
+The import time of jobfit.cli is checked against STARTUP_BUDGET_MS, and
+none of DEFERRED_MODULES may be imported by it. test_startup.py always
+checks the modules; it checks the time only when JOBFIT_STARTUP_BUDGET_MS
+is set, as a wall-clock limit is not reliable on shared CI machines.
+
+Run from the repo root:
+    python -m jobfit.bench.startup
+    python -m jobfit.bench.startup --budget-ms 120
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Best-of-N cumulative import time of jobfit.cli, as reported by -X importtime.
+STARTUP_BUDGET_MS = 150.0
+
+# Only some commands need these; importing jobfit.cli must not pull them in.
+DEFERRED_MODULES = (
+    "pypdf",
+    "asyncio",
+    "sqlite3",
+    "multiprocessing",
+    "concurrent.futures",
+    "tracemalloc",
+    "importlib.resources",
+    "tempfile",
+    "numpy",
+)
+
+
+def import_times(module: str = "jobfit.cli") -> dict[str, tuple[int, int]]:
+    """(self, cumulative) microseconds per module imported by `import module` in a fresh interpreter."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(own), int(cumulative))
+    return times
+
+
+def cli_wall_ms(repeat: int) -> float:
+    """Best wall time of `python -m jobfit.cli` on a small resume/JD pair."""
+    with tempfile.TemporaryDirectory() as tmp:
+        resume, jd = Path(tmp, "resume.txt"), Path(tmp, "jd.txt")
+        resume.write_text("Skills: Python, SQL\nEducation\nB.S. Statistics\nAnalyst 2019-2023", encoding="utf-8")
+        jd.write_text("Requirements: Python, SQL and Tableau\n2+ years of experience", encoding="utf-8")
+        cmd = [sys.executable, "-m", "jobfit.cli", "--resume", str(resume), "--jd", str(jd), "--no-pdf-cache"]
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            subprocess.run(cmd, stdout=subprocess.DEVNULL, check=True)
+            best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure jobfit CLI import time and startup.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="Slowest modules to list (by self time).")
+    parser.add_argument(
+        "--budget-ms", type=float,
+        default=float(os.environ.get("JOBFIT_STARTUP_BUDGET_MS", STARTUP_BUDGET_MS)),
+        help=f"Fail if importing jobfit.cli takes longer (default: {STARTUP_BUDGET_MS}).",
+    )
+    args = parser.parse_args()
+
+    runs = [import_times() for _ in range(args.repeat)]
+    best = min(runs, key=lambda times: times["jobfit.cli"][1])
+    import_ms = best["jobfit.cli"][1] / 1000
+
+    print(f"import jobfit.cli: {import_ms:.1f} ms (best of {args.repeat}, budget {args.budget_ms:.0f} ms)")
+    print(f"CLI run on a .txt pair: {cli_wall_ms(args.repeat):.1f} ms")
+    print(f"\n{'self ms':>8} {'cum ms':>8}  module")
+    for name, (own, cumulative) in sorted(best.items(), key=lambda kv: -kv[1][0])[: args.top]:
+        print(f"{own / 1000:>8.1f} {cumulative / 1000:>8.1f}  {name}")
+
+    failures = []
+    loaded = [m for m in DEFERRED_MODULES if m in best]
+    if loaded:
+        failures.append(f"imported at startup: {', '.join(loaded)}")
+    if import_ms > args.budget_ms:
+        failures.append(f"import time {import_ms:.1f} ms is over the {args.budget_ms:.0f} ms budget")
+    for failure in failures:
+        print(failure, file=sys.stderr)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# src/jobfit/bench/store.py
+"""
+Opening and scanning a memory-mapped ProfileStore vs unpickling the same
+profiles, on a synthetic pool of compact resume profiles.
+
+Run from the repo root:
+    python -m jobfit.bench.store
+    python -m jobfit.bench.store --profiles 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import pickle
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from jobfit.extract.patterns import DEGREE_CODES
+from jobfit.profile import CompactProfile, profile_jd
+from jobfit.profile_store import ProfileStore, write_profile_store
+from jobfit.score.vectorized import VectorScorer
+from jobfit.taxonomy import get_taxonomy
+
+JD = "Requirements: Python, SQL, Tableau, Spark and machine learning\n3+ years of experience\nMaster's degree"
+
+
+def synthetic_profiles(n: int, skills_per_resume: int, n_skills: int, n_majors: int, seed: int = 0):
+    rng = random.Random(seed)
+    degrees = list(DEGREE_CODES.values())
+    for i in range(n):
+        skills = 0
+        for skill in rng.sample(range(n_skills), skills_per_resume):
+            skills |= 1 << skill
+        yield f"resume-{i:07d}", CompactProfile(
+            skills=skills,
+            majors=1 << rng.randrange(n_majors),
+            degree=rng.choice(degrees),
+            years=float(rng.randint(0, 20)),
+        )
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    value = fn()
+    return value, (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the memory-mapped profile store.")
+    parser.add_argument("--profiles", type=int, default=1_000_000)
+    parser.add_argument("--skills-per-resume", type=int, default=15)
+    parser.add_argument("--chunk-size", type=int, default=65536, help="Rows scored per VectorScorer call.")
+    args = parser.parse_args()
+
+    taxonomy = get_taxonomy()
+    scorer = VectorScorer(taxonomy)
+    jd = profile_jd(JD, taxonomy)
+    profiles = list(
+        synthetic_profiles(args.profiles, args.skills_per_resume, len(taxonomy.skill_names), len(taxonomy.major_names))
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store_path, pickle_path = Path(tmp, "profiles.jfps"), Path(tmp, "profiles.pickle")
+        _, write_ms = _timed(lambda: write_profile_store(store_path, profiles, taxonomy))
+        pickle_path.write_bytes(pickle.dumps(profiles, protocol=pickle.HIGHEST_PROTOCOL))
+        del profiles
+
+        store, open_ms = _timed(lambda: ProfileStore(store_path))
+
+        def scan():
+            best = 0
+            for _, candidates in store.iter_candidates(args.chunk_size):
+                best = max(best, int(scorer.score(jd, candidates).total_points.max()))
+            return best
+
+        _, scan_ms = _timed(scan)
+        _, key_ms = _timed(lambda: store.key(len(store) - 1))
+        store.close()
+        _, unpickle_ms = _timed(lambda: pickle.loads(pickle_path.read_bytes()))
+
+        print(f"profiles:             {args.profiles}")
+        print(f"store size:           {store_path.stat().st_size / 2**20:.1f} MiB "
+              f"(pickle {pickle_path.stat().st_size / 2**20:.1f} MiB)")
+        print(f"write store:          {write_ms:.0f} ms")
+        print(f"open store:           {open_ms:.2f} ms")
+        print(f"look up last key:     {key_ms:.3f} ms")
+        print(f"score every profile:  {scan_ms:.0f} ms ({args.profiles / scan_ms * 1000:,.0f} profiles/s)")
+        print(f"unpickle profiles:    {unpickle_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+# src/jobfit/bench/suite.py
+"""
+Per-stage and end-to-end throughput on a synthetic corpus, saved as JSON so
+runs can be compared with a baseline.
+
+Each stage runs over the whole corpus `--repeat` times and the best run is
+kept. Stages get their inputs precomputed, so only the stage itself is timed.
+
+Run from the repo root:
+    python -m jobfit.bench.suite --output bench.json
+    python -m jobfit.bench.suite --baseline bench.json --max-regression 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+
+from jobfit.analyze import analyze, score_compact, score_profiles
+from jobfit.bench.corpus import Corpus, CorpusSpec, generate_corpus
+from jobfit.extract.education import detect_degree_level
+from jobfit.extract.experience import estimate_resume_years, extract_years_required
+from jobfit.extract.requirements import RELEVANT_SECTIONS, extract_requirement_spans
+from jobfit.preprocess.normalize import normalize_text
+from jobfit.profile import compact_profile, profile_jd, profile_resume
+from jobfit.taxonomy import get_taxonomy
+
+RESULT_SCHEMA = 1
+
+
+def _time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _stage(items: int, seconds: float, chars: int | None = None) -> dict:
+    # Rates are None when there is nothing to divide by (e.g. --pairs 0).
+    row = {
+        "items": items,
+        "seconds": round(seconds, 6),
+        "us_per_item": round(seconds / items * 1e6, 3) if items else None,
+        "items_per_sec": round(items / seconds, 1) if items and seconds else None,
+    }
+    if chars is not None:
+        row["mb_per_sec"] = round(chars / seconds / 1e6, 2) if seconds else None
+    return row
+
+
+def run_suite(corpus: Corpus, repeat: int = 5, max_pairs: int = 500) -> dict:
+    """Time every stage on `corpus`; returns {stage name: measurements}."""
+    taxonomy = get_taxonomy()
+    resumes, jds = corpus.resumes, corpus.jds
+    docs = resumes + jds
+    chars = sum(map(len, docs))
+
+    norms = [normalize_text(text) for text in docs]
+    resume_profiles = [profile_resume(text, taxonomy) for text in resumes]
+    jd_profiles = [profile_jd(text, taxonomy) for text in jds]
+    degree_inputs = [p.edu_block for p in resume_profiles] + jds
+    pairs = [(r, j) for j in jd_profiles for r in resume_profiles]
+    compact_resumes = [compact_profile(p, taxonomy) for p in resume_profiles]
+    compact_pairs = [(r, compact_profile(j, taxonomy)) for j in jd_profiles for r in compact_resumes]
+    text_pairs = corpus.pairs(max_pairs)
+
+    def years() -> None:
+        for text in resumes:
+            estimate_resume_years(text)
+        for text in jds:
+            extract_years_required(text)
+
+    stages = {
+        "normalize_text": (
+            lambda: [normalize_text(text) for text in docs], len(docs), chars,
+        ),
+        "extract_skills": (
+            lambda: [taxonomy.extract_skills(norm) for norm in norms], len(norms), sum(map(len, norms)),
+        ),
+        "detect_degree": (
+            lambda: [detect_degree_level(text) for text in degree_inputs], len(degree_inputs), None,
+        ),
+        "extract_years": (years, len(docs), chars),
+        "requirement_lines": (
+            lambda: [extract_requirement_spans(text, RELEVANT_SECTIONS) for text in jds], len(jds), None,
+        ),
+        "profile_resume": (
+            lambda: [profile_resume(text, taxonomy) for text in resumes], len(resumes), None,
+        ),
+        "profile_jd": (
+            lambda: [profile_jd(text, taxonomy) for text in jds], len(jds), None,
+        ),
+        "score_profiles": (
+            lambda: [score_profiles(r, j, ["score"]) for r, j in pairs], len(pairs), None,
+        ),
+        "score_compact": (
+            lambda: [score_compact(r, j) for r, j in compact_pairs], len(compact_pairs), None,
+        ),
+        "analyze_end_to_end": (
+            lambda: [analyze(r, j) for r, j in text_pairs], len(text_pairs), None,
+        ),
+    }
+    return {name: _stage(items, _time(fn, repeat), n_chars) for name, (fn, items, n_chars) in stages.items()}
+
+
+def run(spec: CorpusSpec, repeat: int = 5, max_pairs: int = 500) -> dict:
+    corpus = generate_corpus(spec)
+    stages = run_suite(corpus, repeat, max_pairs)
+    return {
+        "schema": RESULT_SCHEMA,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "machine": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+        },
+        "taxonomy_version": get_taxonomy().version,
+        "corpus": spec.to_dict(),
+        "max_pairs": max_pairs,
+        "repeat": repeat,
+        "stages": stages,
+        "pairs_per_sec": stages["analyze_end_to_end"]["items_per_sec"],
+    }
+
+
+def compare(current: dict, baseline: dict) -> list[dict]:
+    """
+    Per-stage change in time per item vs a baseline run (positive = slower).
+    Stages missing from either run are skipped; change_pct is None when
+    either run processed no items.
+    """
+    rows = []
+    for name, now in current["stages"].items():
+        before = baseline.get("stages", {}).get(name)
+        if before is None:
+            continue
+        if now["us_per_item"] is None or before["us_per_item"] is None:
+            change = None
+        elif before["us_per_item"]:
+            change = round((now["us_per_item"] / before["us_per_item"] - 1) * 100, 1)
+        else:
+            change = 0.0
+        rows.append(
+            {
+                "stage": name,
+                "baseline_us": before["us_per_item"],
+                "current_us": now["us_per_item"],
+                "change_pct": change,
+            }
+        )
+    return rows
+
+
+def _fmt(value: float | None, spec: str, suffix: str = "") -> str:
+    return "-" if value is None else format(value, spec) + suffix
+
+
+def main(argv: list[str] | None = None) -> None:
+    defaults = CorpusSpec()
+    parser = argparse.ArgumentParser(description="Benchmark every analysis stage on a synthetic corpus.")
+    parser.add_argument("--resumes", type=int, default=defaults.n_resumes)
+    parser.add_argument("--jds", type=int, default=defaults.n_jds)
+    parser.add_argument("--resume-words", type=int, default=defaults.resume_words)
+    parser.add_argument("--jd-words", type=int, default=defaults.jd_words)
+    parser.add_argument("--skill-density", type=float, default=defaults.skill_density)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per stage; the best is kept (default: 5).")
+    parser.add_argument("--pairs", type=int, default=500, help="Pairs for the end-to-end stage (default: 500).")
+    parser.add_argument("--output", type=Path, help="Write the results as JSON.")
+    parser.add_argument("--baseline", type=Path, help="Compare with a JSON file written by --output.")
+    parser.add_argument(
+        "--max-regression", type=float, default=None,
+        help="With --baseline: exit with status 1 if a stage is more than this many percent slower.",
+    )
+    args = parser.parse_args(argv)
+
+    spec = CorpusSpec(
+        n_resumes=args.resumes,
+        n_jds=args.jds,
+        resume_words=args.resume_words,
+        jd_words=args.jd_words,
+        skill_density=args.skill_density,
+        seed=args.seed,
+    )
+    result = run(spec, args.repeat, args.pairs)
+
+    print(f"{args.resumes} resumes x {args.jds} JDs, best of {args.repeat}")
+    print(f"{'stage':<20} {'items':>7} {'us/item':>11} {'items/s':>11}")
+    for name, row in result["stages"].items():
+        print(f"{name:<20} {row['items']:>7} {_fmt(row['us_per_item'], '.2f'):>11} {_fmt(row['items_per_sec'], '.1f'):>11}")
+    print(f"end to end: {_fmt(result['pairs_per_sec'], '.1f')} pairs/s")
+
+    if args.output:
+        args.output.write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        if baseline.get("corpus") != result["corpus"]:
+            print("warning: baseline was run on a different corpus", file=sys.stderr)
+        rows = compare(result, baseline)
+        print(f"\n{'stage':<20} {'baseline us':>12} {'current us':>11} {'change':>8}")
+        for row in rows:
+            print(
+                f"{row['stage']:<20} {_fmt(row['baseline_us'], '.2f'):>12} {_fmt(row['current_us'], '.2f'):>11} "
+                f"{_fmt(row['change_pct'], '+.1f', '%'):>8}"
+            )
+        if args.max_regression is not None:
+            slower = [row["stage"] for row in rows if (row["change_pct"] or 0.0) > args.max_regression]
+            if slower:
+                print(f"regressed by more than {args.max_regression}%: {', '.join(slower)}", file=sys.stderr)
+                sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
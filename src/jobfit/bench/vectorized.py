@@ -0,0 +1,103 @@
+# src/jobfit/bench/vectorized.py
+"""
+Scalar scoring loop vs the NumPy VectorScorer over synthetic candidate pools.
+
+Run from the repo root:
+    python -m jobfit.bench.vectorized
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from jobfit.profile import DocumentProfile
+from jobfit.score.education_scoring import score_education
+from jobfit.score.experience_scoring import score_experience
+from jobfit.score.scoring import score_skills
+from jobfit.score.vectorized import CandidateMatrix, VectorScorer
+from jobfit.taxonomy import get_taxonomy
+
+
+def synthetic_pool(scorer: VectorScorer, n: int, skills_per_resume: int, seed: int = 0):
+    """Random candidates as a CandidateMatrix plus the column indices used to build it."""
+    rng = np.random.default_rng(seed)
+    vocab = len(scorer.skills.vocabulary)
+    cols = rng.integers(0, vocab, size=(n, skills_per_resume))
+    rows = np.repeat(np.arange(n), skills_per_resume)
+
+    skills = np.zeros((n, scorer.skills.n_words), dtype=np.uint64)
+    flat = cols.ravel()
+    np.bitwise_or.at(skills, (rows, flat >> 6), np.left_shift(np.uint64(1), (flat & 63).astype(np.uint64)))
+
+    majors = np.zeros((n, scorer.majors.n_words), dtype=np.uint64)
+    major_cols = rng.integers(0, len(scorer.majors.vocabulary), size=n)
+    majors[np.arange(n), major_cols >> 6] = np.left_shift(np.uint64(1), (major_cols & 63).astype(np.uint64))
+
+    matrix = CandidateMatrix(
+        skills=skills,
+        majors=majors,
+        degree=rng.integers(0, 4, size=n).astype(np.uint8),
+        years=rng.integers(0, 12, size=n).astype(np.float64),
+    )
+    return matrix, cols, major_cols
+
+
+def scalar_totals(jd: DocumentProfile, scorer: VectorScorer, matrix: CandidateMatrix, cols, major_cols) -> list[int]:
+    skill_names = scorer.skills.vocabulary
+    major_names = scorer.majors.vocabulary
+    degree_names = {0: None, 1: "bachelors", 2: "masters", 3: "phd"}
+    totals = []
+    for i in range(len(matrix)):
+        skills = {skill_names[c] for c in cols[i]}
+        majors = {major_names[major_cols[i]]}
+        total = (
+            score_skills(jd.skills, skills, max_points=50)
+            + score_education(jd.degree, degree_names[int(matrix.degree[i])], jd.majors, majors, max_points=15)["education_total"]
+            + score_experience(jd.years, float(matrix.years[i]), max_points=35)["experience_total"]
+        )
+        totals.append(total)
+    return totals
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark batched NumPy scoring.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--skills", type=int, default=12, help="Skills per synthetic resume.")
+    parser.add_argument("--scalar-limit", type=int, default=100_000, help="Skip the scalar loop above this size.")
+    args = parser.parse_args()
+
+    taxonomy = get_taxonomy()
+    scorer = VectorScorer(taxonomy)
+    jd = DocumentProfile(
+        kind="jd", text="", norm="",
+        skills=frozenset(taxonomy.skills[:20]),
+        degree="masters",
+        majors=frozenset(taxonomy.majors[:3]),
+        years=3,
+    )
+
+    print(f"{'rows':>10} {'scalar s':>10} {'vector s':>10} {'speedup':>8} {'rows/s (vector)':>16}")
+    for n in args.sizes:
+        matrix, cols, major_cols = synthetic_pool(scorer, n, args.skills)
+
+        start = time.perf_counter()
+        totals = scorer.score(jd, matrix).total_points
+        vector = time.perf_counter() - start
+
+        if n <= args.scalar_limit:
+            start = time.perf_counter()
+            expected = scalar_totals(jd, scorer, matrix, cols, major_cols)
+            scalar = time.perf_counter() - start
+            assert totals.tolist() == expected
+            scalar_col, speedup = f"{scalar:>10.3f}", f"{scalar / vector:>7.1f}x"
+        else:
+            scalar_col, speedup = f"{'-':>10}", f"{'-':>8}"
+
+        print(f"{n:>10} {scalar_col} {vector:>10.3f} {speedup} {n / vector:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
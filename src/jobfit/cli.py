@@ -1,16 +1,38 @@
 from __future__ import annotations
 
 import argparse
+import os
+import sys
+import time
+from contextlib import closing, contextmanager, nullcontext
+from functools import partial
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from jobfit.analyze import analyze
-from jobfit.ingest.pdf_extract import extract_text_from_pdf
+from jobfit.ingest.cache import TextCache, default_cache_dir
+from jobfit.timing import StageTimer, recording
 
+if TYPE_CHECKING:
+    from jobfit.index import SkillIndex
 
-def read_input_file(path: Path) -> str:
+# The CLI is started once per file by shell pipelines, so the analysis code
+# and anything only some commands need (pypdf, the process pool, asyncio,
+# sqlite) is imported where it is used: `jobfit --daemon` only needs a
+# socket. test_startup.py keeps `import jobfit.cli` free of them.
+
+INPUT_SUFFIXES = (".txt", ".pdf")
+PROFILE_LINES = 40
+
+
+def read_input_file(path: Path, pdf_cache: TextCache | None = None) -> str:
     suffix = path.suffix.lower()
     if suffix == ".pdf":
-        return extract_text_from_pdf(path)
+        from jobfit.ingest.pdf_extract import extract_text_from_pdf
+
+        try:
+            return extract_text_from_pdf(path, cache=pdf_cache)
+        except FileNotFoundError as e:
+            raise SystemExit(f"File not found: {path}") from e
 
     try:
         return path.read_text(encoding="utf-8")
@@ -20,6 +42,77 @@ def read_input_file(path: Path) -> str:
         raise SystemExit(f"Could not read {path} as UTF-8 text.") from e
 
 
+def positive_int(value: str) -> int:
+    try:
+        n = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {n}")
+    return n
+
+
+def add_pdf_cache_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--pdf-cache", type=Path, nargs="?", const=True, default=None, metavar="DIR",
+        help="Cache text extracted from PDFs, in DIR (default: pdf_text/ under $JOBFIT_CACHE_DIR, "
+        "$XDG_CACHE_HOME/jobfit or ~/.cache/jobfit). Off unless given, as resumes are personal documents.",
+    )
+    parser.add_argument(
+        "--no-pdf-cache", action="store_true",
+        help="Do not cache PDF text (the default; overrides --pdf-cache).",
+    )
+
+
+def pdf_cache_from_args(args: argparse.Namespace) -> TextCache | None:
+    if args.no_pdf_cache or args.pdf_cache is None:
+        return None
+    return TextCache(default_cache_dir() / "pdf_text" if args.pdf_cache is True else args.pdf_cache)
+
+
+def add_profile_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--profile", action="store_true",
+        help=f"Run under cProfile and print the top {PROFILE_LINES} functions by cumulative time to stderr "
+        "(worker processes are not profiled; use --workers 1).",
+    )
+    parser.add_argument(
+        "--profile-out", type=Path, default=None,
+        help="Save the raw cProfile stats to this file (for pstats or snakeviz).",
+    )
+
+
+@contextmanager
+def profiled(args: argparse.Namespace):
+    if not (args.profile or args.profile_out):
+        yield
+        return
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        if args.profile_out:
+            profiler.dump_stats(args.profile_out)
+        if args.profile:
+            pstats.Stats(profiler, stream=sys.stderr).sort_stats("cumulative").print_stats(PROFILE_LINES)
+
+
+def expand_inputs(paths: list[Path]) -> list[Path]:
+    """Expand directories into their .txt/.pdf files (sorted); keep files as given."""
+    out: list[Path] = []
+    for path in paths:
+        if path.is_dir():
+            out.extend(sorted(p for p in path.iterdir() if p.suffix.lower() in INPUT_SUFFIXES))
+        else:
+            out.append(path)
+    return out
+
+
 def build_arg_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="jobfit",
@@ -27,52 +120,442 @@ def build_arg_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument("--resume", required=True, type=Path, help="Path to resume (.txt or .pdf).")
     parser.add_argument("--jd", required=True, type=Path, help="Path to job description (.txt).")
+    parser.add_argument(
+        "--result-cache", type=Path, default=None,
+        help="SQLite file caching analysis results across runs (default: no result cache).",
+    )
+    parser.add_argument(
+        "--daemon", type=Path, default=os.environ.get("JOBFIT_DAEMON") or None,
+        help="Unix socket of a `jobfit serve --socket` daemon to run the analysis in; "
+        "runs in-process if no daemon answers there (default: $JOBFIT_DAEMON).",
+    )
+    parser.add_argument(
+        "--timings", action="store_true",
+        help="Print how long each stage took (PDF extraction, normalization, skills, ...).",
+    )
+    add_pdf_cache_args(parser)
+    add_profile_args(parser)
     return parser
 
 
-def main() -> None:
-    parser = build_arg_parser()
-    args = parser.parse_args()
+def build_batch_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="jobfit batch",
+        description="Score every resume against every job description.",
+    )
+    parser.add_argument(
+        "--resume", required=True, type=Path, nargs="+",
+        help="Resume files or directories (.txt or .pdf).",
+    )
+    parser.add_argument(
+        "--jd", required=True, type=Path, nargs="+",
+        help="Job description files or directories (.txt or .pdf).",
+    )
+    parser.add_argument(
+        "--workers", type=positive_int, default=1,
+        help="Number of worker processes (default: 1, run in-process).",
+    )
+    parser.add_argument(
+        "--chunk-size", type=positive_int, default=64,
+        help="Resumes per task sent to a worker (default: 64).",
+    )
+    add_pdf_cache_args(parser)
+    add_profile_args(parser)
+    return parser
+
+
+def batch_main(argv: list[str]) -> None:
+    args = build_batch_arg_parser().parse_args(argv)
+    with profiled(args):
+        run_batch(args)
+
+
+def run_batch(args: argparse.Namespace) -> None:
+    from jobfit.parallel import score_files
+    from jobfit.profile import profile_jd
+    from jobfit.taxonomy import get_taxonomy
+
+    taxonomy = get_taxonomy()
+    load = partial(read_input_file, pdf_cache=pdf_cache_from_args(args))
+
+    # Each document is read and profiled once; only scoring runs per pair.
+    jds = [(str(path), profile_jd(load(path), taxonomy)) for path in expand_inputs(args.jd)]
+    resume_paths = expand_inputs(args.resume)
+
+    stats: dict = {}
+    start = time.perf_counter()
+    print("resume\tjd\ttotal\tskills\teducation\texperience")
+    rows = score_files(
+        resume_paths, jds, load,
+        workers=args.workers, chunk_size=args.chunk_size, stats=stats,
+    )
+    for resume_path, jd_path, s in rows:
+        print(
+            f"{resume_path}\t{jd_path}\t{s.total_points}\t{s.skills_points}"
+            f"\t{s.education_points}\t{s.experience_points}"
+        )
+    elapsed = time.perf_counter() - start
+
+    if args.workers > 1:
+        for w in sorted(stats.values(), key=lambda w: w.pid):
+            print(
+                f"worker {w.pid}: {w.resumes} resumes, {w.pairs} pairs, "
+                f"{w.busy_seconds:.2f}s busy ({w.resumes_per_second:.1f} resumes/s)",
+                file=sys.stderr,
+            )
+    rate = len(resume_paths) / elapsed if elapsed else 0.0
+    print(f"scored {len(resume_paths)} resumes x {len(jds)} JDs in {elapsed:.2f}s ({rate:.1f} resumes/s)", file=sys.stderr)
+
+
+def build_index_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="jobfit index",
+        description="Build and query a persistent skill index over resumes.",
+    )
+    sub = parser.add_subparsers(dest="action", required=True)
+
+    build = sub.add_parser("build", help="Add resumes to the index (created if missing).")
+    build.add_argument("--index", required=True, type=Path, help="Index file (.json).")
+    build.add_argument(
+        "--resume", required=True, type=Path, nargs="+",
+        help="Resume files or directories (.txt or .pdf).",
+    )
+    add_pdf_cache_args(build)
+
+    remove = sub.add_parser("remove", help="Remove resumes from the index.")
+    remove.add_argument("--index", required=True, type=Path, help="Index file (.json).")
+    remove.add_argument("keys", nargs="+", help="Resume keys (the paths they were added under).")
+
+    query = sub.add_parser("query", help="Top candidates for a job description.")
+    query.add_argument("--index", required=True, type=Path, help="Index file (.json).")
+    query.add_argument("--jd", required=True, type=Path, help="Path to job description (.txt or .pdf).")
+    query.add_argument("-k", "--top", type=positive_int, default=10, help="Number of candidates (default: 10).")
+    add_pdf_cache_args(query)
+    return parser
+
+
+def _open_index(path: Path, taxonomy_version: str, create: bool = False) -> SkillIndex:
+    from jobfit.index import SkillIndex
+
+    if not path.exists():
+        if create:
+            return SkillIndex(taxonomy_version=taxonomy_version)
+        raise SystemExit(f"Index not found: {path}")
+
+    index = SkillIndex.load(path)
+    if index.taxonomy_version != taxonomy_version:
+        print(
+            f"warning: {path} was built with taxonomy {index.taxonomy_version}, "
+            f"current is {taxonomy_version}; rebuild it to pick up seed changes.",
+            file=sys.stderr,
+        )
+    return index
+
+
+def index_main(argv: list[str]) -> None:
+    from jobfit.profile import profile_jd, profile_resume
+    from jobfit.taxonomy import get_taxonomy
+
+    args = build_index_arg_parser().parse_args(argv)
+    taxonomy = get_taxonomy()
+
+    if args.action == "build":
+        index = _open_index(args.index, taxonomy.version, create=True)
+        load = partial(read_input_file, pdf_cache=pdf_cache_from_args(args))
+        paths = expand_inputs(args.resume)
+        for path in paths:
+            index.add(str(path), profile_resume(load(path), taxonomy))
+        index.save(args.index)
+        print(f"indexed {len(paths)} resumes ({len(index)} total) in {args.index}")
+
+    elif args.action == "remove":
+        index = _open_index(args.index, taxonomy.version)
+        removed = sum(index.remove(key) for key in args.keys)
+        index.save(args.index)
+        print(f"removed {removed} resumes ({len(index)} left) from {args.index}")
+
+    else:
+        index = _open_index(args.index, taxonomy.version)
+        jd = profile_jd(read_input_file(args.jd, pdf_cache_from_args(args)), taxonomy)
+        print("rank\ttotal\tskills\teducation\texperience\tresume")
+        for rank, m in enumerate(index.query(jd, k=args.top), start=1):
+            print(
+                f"{rank}\t{m.total_points}\t{m.skills_points}\t{m.education_points}"
+                f"\t{m.experience_points}\t{m.key}"
+            )
+
 
-    resume_text = read_input_file(args.resume)
-    jd_text = read_input_file(args.jd)
+def build_store_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="jobfit store",
+        description="Build and query a memory-mapped columnar profile store over resumes.",
+    )
+    sub = parser.add_subparsers(dest="action", required=True)
+
+    build = sub.add_parser("build", help="Write a new store from resume files (replaces an existing one).")
+    build.add_argument("--store", required=True, type=Path, help="Store file (.jfps).")
+    build.add_argument(
+        "--resume", required=True, type=Path, nargs="+",
+        help="Resume files or directories (.txt or .pdf).",
+    )
+    add_pdf_cache_args(build)
+
+    query = sub.add_parser("query", help="Top candidates for a job description.")
+    query.add_argument("--store", required=True, type=Path, help="Store file (.jfps).")
+    query.add_argument("--jd", required=True, type=Path, help="Path to job description (.txt or .pdf).")
+    query.add_argument("-k", "--top", type=positive_int, default=10, help="Number of candidates (default: 10).")
+    add_pdf_cache_args(query)
+
+    info = sub.add_parser("info", help="Show the size and taxonomy version of a store.")
+    info.add_argument("--store", required=True, type=Path, help="Store file (.jfps).")
+    return parser
+
+
+def store_main(argv: list[str]) -> None:
+    from jobfit.profile import profile_jd, profile_resume
+    from jobfit.profile_store import ProfileStore, write_profile_store
+    from jobfit.taxonomy import get_taxonomy
+
+    args = build_store_arg_parser().parse_args(argv)
+    taxonomy = get_taxonomy()
+
+    if args.action == "build":
+        load = partial(read_input_file, pdf_cache=pdf_cache_from_args(args))
+        items = ((str(path), profile_resume(load(path), taxonomy)) for path in expand_inputs(args.resume))
+        n = write_profile_store(args.store, items, taxonomy)
+        print(f"stored {n} resumes in {args.store}")
+        return
+
+    if not args.store.exists():
+        raise SystemExit(f"Store not found: {args.store}")
+    with ProfileStore(args.store) as store:
+        if args.action == "info":
+            print(f"{args.store}: {len(store)} profiles, {args.store.stat().st_size} bytes")
+            print(f"taxonomy {store.taxonomy_version} (current {taxonomy.version})")
+            return
+
+        from jobfit.rank import rank
+
+        jd = profile_jd(read_input_file(args.jd, pdf_cache_from_args(args)), taxonomy, requirements=False)
+        try:
+            top = rank(jd, store, k=args.top, taxonomy=taxonomy)
+        except ValueError as e:
+            raise SystemExit(str(e))
+        print("rank\ttotal\tskills\teducation\texperience\tresume")
+        for i, c in enumerate(top, start=1):
+            s = c.score
+            print(f"{i}\t{s.total_points}\t{s.skills_points}\t{s.education_points}\t{s.experience_points}\t{c.key}")
+
+
+def parse_fields(value: str) -> list[str]:
+    from jobfit.analyze import SECTIONS
 
-    result = analyze(resume_text, jd_text)
+    fields = [f.strip() for f in value.split(",") if f.strip()]
+    unknown = [f for f in fields if f not in SECTIONS]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown field(s) {unknown}; choose from {', '.join(SECTIONS)}")
+    return fields
 
-    print("Loaded inputs successfully.")
-    print(f"Resume characters: {len(resume_text)}")
-    print(f"Job description characters: {len(jd_text)}")
 
-    print("\n--- Preview BEFORE normalize (first 120 chars) ---")
-    print("RESUME:", result["previews"]["resume_before"])
-    print("JD:", result["previews"]["jd_before"])
+def build_stream_arg_parser() -> argparse.ArgumentParser:
+    from jobfit.analyze import SECTIONS
+
+    parser = argparse.ArgumentParser(
+        prog="jobfit stream",
+        description=(
+            "Analyze JSONL records ({\"id\", \"resume\" or \"resume_path\", \"jd\" or \"jd_path\"}) "
+            "and write one JSON result per line."
+        ),
+    )
+    parser.add_argument("--input", default="-", help="JSONL input file (default: stdin).")
+    parser.add_argument("--output", default="-", help="JSONL output file (default: stdout).")
+    parser.add_argument(
+        "--fields", type=parse_fields, default=None,
+        help=f"Comma-separated sections to compute and emit (default: all of {','.join(SECTIONS)}).",
+    )
+    parser.add_argument(
+        "--line-buffered", action="store_true",
+        help="Flush after every result line (always on when writing to a terminal).",
+    )
+    add_pdf_cache_args(parser)
+    add_profile_args(parser)
+    return parser
+
+
+def stream_main(argv: list[str]) -> None:
+    from jobfit.stream import analyze_records, read_records, write_records
+
+    args = build_stream_arg_parser().parse_args(argv)
+    load = partial(read_input_file, pdf_cache=pdf_cache_from_args(args))
+
+    src = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    dst = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        with profiled(args):
+            results = analyze_records(read_records(src), load, sections=args.fields)
+            write_records(results, dst, line_buffered=args.line_buffered or dst.isatty())
+    except BrokenPipeError:
+        # Downstream stopped reading (e.g. `| head`): stop quietly.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if dst is not sys.stdout:
+            dst.close()
+
+
+def build_serve_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="jobfit serve",
+        description="Serve /analyze, /report and /rank over HTTP (JSON in, JSON out), on a TCP port "
+        "or, with --socket, as a resident daemon for `jobfit --daemon`.",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1).")
+    parser.add_argument("--port", type=int, default=8000, help="Port (default: 8000; 0 picks a free one).")
+    parser.add_argument(
+        "--socket", type=Path, default=None,
+        help="Listen on this Unix domain socket instead of --host/--port.",
+    )
+    parser.add_argument(
+        "--workers", type=positive_int, default=os.cpu_count() or 1,
+        help="Worker processes (default: number of CPUs).",
+    )
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds (default: 30).")
+    parser.add_argument(
+        "--batch-window-ms", type=float, default=None,
+        help="How long /analyze requests for the same JD are collected into one batch "
+        "(default: 2, or 0 with --socket so a lone CLI request is not held back).",
+    )
+    parser.add_argument("--max-batch", type=positive_int, default=32, help="Largest /analyze batch (default: 32).")
+    add_pdf_cache_args(parser)
+    return parser
 
-    print("\n--- Preview AFTER normalize (first 120 chars) ---")
-    print("RESUME:", result["previews"]["resume_after"])
-    print("JD:", result["previews"]["jd_after"])
 
-    print("\n--- Skill Matching ---")
-    print("Resume skills:", result["skills"]["resume_skills"])
-    print("JD skills:", result["skills"]["jd_skills"])
-    print("Matched skills:", result["skills"]["matched"])
-    print("Missing skills:", result["skills"]["missing"])
+async def _serve(args: argparse.Namespace) -> None:
+    import asyncio
 
-    print("\n--- Score ---")
-    s = result["score"]
-    print(f"Skills score: {s['skills_points']}/{s['skills_max']}")
-    print(f"Total score: {s['total_points']}/{s['total_max']} ({s['note']})")
+    from jobfit.service import ScoringService, start_server, start_unix_server
 
-    print("\n--- Requirement coverage (skills-based) ---")
-    cov = result["requirements"]["coverage"]
-    if not cov:
-        print("No requirement lines matched to known skills yet.")
+    batch_window_ms = args.batch_window_ms
+    if batch_window_ms is None:
+        batch_window_ms = 0.0 if args.socket else 2.0
+    service = ScoringService(
+        workers=args.workers,
+        timeout=args.timeout,
+        batch_window=batch_window_ms / 1000,
+        max_batch=args.max_batch,
+        pdf_cache=pdf_cache_from_args(args),
+    )
+    if args.socket:
+        server = await start_unix_server(service, args.socket)
+        print(f"serving on unix:{args.socket}", file=sys.stderr, flush=True)
     else:
-        for item in cov[:10]:
-            print(f"- {item['line']}")
-            if item["matched"]:
-                print(f"  matched: {item['matched']}")
-            if item["missing"]:
-                print(f"  missing: {item['missing']}")
+        server = await start_server(service, args.host, args.port)
+        host, port = server.sockets[0].getsockname()[:2]
+        print(f"serving on http://{host}:{port}", file=sys.stderr, flush=True)
+    try:
+        await server.serve_forever()
+    except asyncio.CancelledError:
+        pass
+    finally:
+        server.close()
+        service.close()
+        if args.socket:
+            args.socket.unlink(missing_ok=True)
+        for endpoint, row in service.stats()["latency"].items():
+            print(
+                f"{endpoint}: {row['count']} requests, p50 {row['p50_ms']} ms, p99 {row['p99_ms']} ms",
+                file=sys.stderr,
+            )
+
+
+def serve_main(argv: list[str]) -> None:
+    import asyncio
+
+    args = build_serve_arg_parser().parse_args(argv)
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+COMMANDS = {
+    "batch": batch_main,
+    "index": index_main,
+    "serve": serve_main,
+    "store": store_main,
+    "stream": stream_main,
+}
+
+
+def _daemon_document(path: Path, field: str) -> dict:
+    if path.suffix.lower() != ".pdf":
+        return {field: read_input_file(path)}
+    import base64
+
+    try:
+        return {f"{field}_pdf": base64.b64encode(path.read_bytes()).decode("ascii")}
+    except FileNotFoundError as e:
+        raise SystemExit(f"File not found: {path}") from e
+
+
+def daemon_report(socket_path: Path, resume: Path, jd: Path) -> str | None:
+    """The report for one pair rendered by a running daemon, or None if no daemon answered."""
+    from jobfit.client import DaemonUnavailable, unix_request
+
+    payload = {**_daemon_document(resume, "resume"), **_daemon_document(jd, "jd")}
+    try:
+        status, body = unix_request(socket_path, "POST", "/report", payload)
+    except DaemonUnavailable:
+        return None
+    if status != 200:
+        raise SystemExit(f"jobfit daemon: {body.get('error', status)}")
+    return body["report"]
+
+
+def main(argv: list[str] | None = None) -> None:
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] in COMMANDS:
+        COMMANDS[argv[0]](argv[1:])
+        return
+
+    parser = build_arg_parser()
+    args = parser.parse_args(argv)
+
+    # --timings, --profile and --result-cache are about this process, so they run in-process.
+    if args.daemon and not (args.timings or args.profile or args.profile_out or args.result_cache):
+        report = daemon_report(args.daemon, args.resume, args.jd)
+        if report is not None:
+            sys.stdout.write(report)
+            return
+
+    from jobfit.analyze import analyze
+    from jobfit.report import render_report
+
+    # The timer covers reading the inputs too, so PDF extraction shows up.
+    timer = StageTimer() if args.timings else None
+    with profiled(args), recording(timer) if timer else nullcontext():
+        pdf_cache = pdf_cache_from_args(args)
+        resume_text = read_input_file(args.resume, pdf_cache)
+        jd_text = read_input_file(args.jd, pdf_cache)
+
+        if args.result_cache:
+            from jobfit.result_cache import SqliteResultCache
+
+            with closing(SqliteResultCache(args.result_cache)) as result_cache:
+                result = analyze(resume_text, jd_text, cache=result_cache)
+        else:
+            result = analyze(resume_text, jd_text)
+
+    sys.stdout.write(render_report(result, len(resume_text), len(jd_text)))
+
+    if timer is not None:
+        report = timer.to_dict()
+        print("\n--- Timings ---")
+        for name, row in report["stages"].items():
+            print(f"{name:<20} {row['ms']:>9.3f} ms")
+        print(f"{'total':<20} {report['total_ms']:>9.3f} ms")
 
 
 if __name__ == "__main__":
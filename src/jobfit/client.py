@@ -0,0 +1,62 @@
+# src/jobfit/client.py
+"""
+Blocking client for a `jobfit serve --socket PATH` daemon.
+
+Only the standard library's socket and json are used, so a short-lived
+process (the CLI with --daemon) pays almost nothing beyond interpreter
+startup; the taxonomy, matchers and caches stay warm in the daemon.
+"""
+
+from __future__ import annotations
+
+import json
+import socket
+from pathlib import Path
+
+
+class DaemonUnavailable(ConnectionError):
+    """
+    No usable daemon on the socket: nothing listening (missing file,
+    refused, stale), or it timed out, hung up or sent back a broken response.
+    """
+
+
+def unix_request(
+    socket_path: Path | str,
+    method: str,
+    path: str,
+    payload=None,
+    timeout: float = 60.0,
+    connect_timeout: float = 1.0,
+) -> tuple[int, object]:
+    """
+    One HTTP/1.1 request over a Unix domain socket; returns (status, decoded JSON body).
+
+    Every failure to get a well-formed answer raises DaemonUnavailable, so
+    callers can fall back to doing the work themselves.
+    """
+    body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+    head = (
+        f"{method} {path} HTTP/1.1\r\nHost: jobfit\r\n"
+        f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n"
+    ).encode("latin-1")
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(connect_timeout)
+        sock.connect(str(socket_path))
+        sock.settimeout(timeout)
+        sock.sendall(head + body)
+        chunks = []
+        while chunk := sock.recv(65536):
+            chunks.append(chunk)
+
+        header, _, content = b"".join(chunks).partition(b"\r\n\r\n")
+        status_line = header.split(b"\r\n", 1)[0].split()
+        if len(status_line) < 2:
+            raise ValueError("malformed response")
+        return int(status_line[1]), json.loads(content)
+    except (OSError, ValueError) as e:
+        raise DaemonUnavailable(f"no usable jobfit daemon at {socket_path}: {e}") from e
+    finally:
+        sock.close()
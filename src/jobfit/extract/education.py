@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import re
+from jobfit.extract.patterns import DEGREE, DEGREE_LEVELS
 
 
 def extract_education_block(text: str) -> str:
@@ -19,39 +19,21 @@ def extract_education_block(text: str) -> str:
     return text[:800]
 
 
-import re
-
-
 def detect_degree_level(text: str) -> str | None:
     """
     Detect the highest degree level mentioned in text.
     Returns: 'phd', 'masters', 'bachelors', or None
-    """
-    t = text.lower()
-
-    # ---- PhD (highest first) ----
-    if re.search(
-        r"\b(ph\.?d\.?|phd|doctorate|doctoral)\b",
-        t,
-    ):
-        return "phd"
-
-    # ---- Masters ----
-    if re.search(
-        r"\b(master|masters|m\.?s\.?|m\.?a\.?|mba|m\.?eng\.?)\b",
-        t,
-    ):
-        return "masters"
-
-    # ---- Bachelors ----
-    if re.search(
-        r"\b(bachelor|bachelors|b\.?s\.?|b\.?a\.?|b\.?eng\.?)\b",
-        t,
-    ):
-        return "bachelors"
-
-    return None
 
+    Single pass over the text; stops early once a PhD is seen.
+    """
+    best = None
+    for m in DEGREE.finditer(text.lower()):
+        level = m.lastgroup
+        if level == "phd":
+            return "phd"
+        if best is None or DEGREE_LEVELS.index(level) < DEGREE_LEVELS.index(best):
+            best = level
+    return best
 
 
 def detect_major_keywords(text: str, major_keywords: list[str]) -> set[str]:
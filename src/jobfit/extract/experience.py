@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import re
+from jobfit.extract.patterns import YEAR_RANGE, YEARS_REQUIRED
 
 
 def extract_years_required(jd_text: str) -> int | None:
@@ -17,20 +17,17 @@ def extract_years_required(jd_text: str) -> int | None:
     - int years if found
     - None if no years requirement detected
     """
-    t = jd_text.lower()
-
-    # Range like 3-5 years or 3 to 5 years -> take the minimum
-    range_pat = re.compile(r"\b(\d+)\s*(?:-|–|to)\s*(\d+)\s*(?:years|yrs)\b")
-    m = range_pat.search(t)
-    if m:
-        return int(m.group(1))
-
-    # Single number like 2+ years or 2 years
-    single_pat = re.compile(r"\b(\d+)\s*\+?\s*(?:years|yrs)\b")
-    matches = single_pat.findall(t)
-    if matches:
+    singles = []
+    for m in YEARS_REQUIRED.finditer(jd_text.lower()):
+        # Range like 3-5 years or 3 to 5 years -> take the minimum of the first one
+        if m.group("low") is not None:
+            return int(m.group("low"))
+        # Single number like 2+ years or 2 years
+        singles.append(int(m.group("single")))
+
+    if singles:
         # If multiple appear, take the highest minimum requirement mentioned
-        return max(int(x) for x in matches)
+        return max(singles)
 
     return None
 
@@ -47,10 +44,7 @@ def estimate_resume_years(resume_text: str) -> float:
     We sum durations across all detected ranges.
     We do NOT dedupe overlapping jobs (simple on purpose).
     """
-    t = resume_text.lower()
-
-    year_range_pat = re.compile(r"\b(20\d{2})\s*(?:-|–|to)\s*(20\d{2}|present|current)\b")
-    ranges = year_range_pat.findall(t)
+    ranges = YEAR_RANGE.findall(resume_text.lower())
 
     total_years = 0.0
 
@@ -0,0 +1,152 @@
+# src/jobfit/extract/matcher.py
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from typing import Iterator
+
+_WORD_CHAR = re.compile(r"\w")
+
+
+def _is_word(text: str, i: int) -> bool:
+    return 0 <= i < len(text) and _WORD_CHAR.match(text[i]) is not None
+
+
+def _is_boundary(text: str, i: int) -> bool:
+    # Same definition as the regex `\b`: a word char on exactly one side.
+    return _is_word(text, i - 1) != _is_word(text, i)
+
+
+def needs_word_boundary(phrase: str) -> bool:
+    """
+    Single-token skills are matched on word boundaries, multiword or
+    hyphenated phrases as plain substrings.
+    """
+    return (" " not in phrase) and ("-" not in phrase)
+
+
+class SkillMatcher:
+    """
+    Aho-Corasick automaton over every skill and synonym in the taxonomy.
+
+    Built once, then `extract()` finds all skills in a single left-to-right
+    pass over the text, so the cost grows with the text length and the number
+    of hits rather than with the vocabulary size.
+    """
+
+    def __init__(self, skills: list[str], synonyms: dict[str, str]):
+        # phrase (lowercased) -> canonical names it reports
+        self._canonical: dict[str, set[str]] = {}
+        for skill in skills:
+            self._canonical.setdefault(skill.lower(), set()).add(skill)
+        for alias, canonical in synonyms.items():
+            self._canonical.setdefault(alias.lower(), set()).add(canonical)
+        self._canonical.pop("", None)
+
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[str]] = [[]]
+        for phrase in self._canonical:
+            self._insert(phrase)
+        self._link()
+
+    def __len__(self) -> int:
+        return len(self._canonical)
+
+    def longest_phrase(self) -> int:
+        """Length of the longest known phrase, i.e. of the longest possible match."""
+        return max(map(len, self._canonical), default=0)
+
+    def space_neighbours(self) -> tuple[tuple[str, ...], tuple[str, ...]]:
+        """
+        The words right before and right after a space in multiword phrases.
+        A match can only contain a given space of a text if the token before
+        it ends with one of the first and the token after it starts with one
+        of the second.
+        """
+        before, after = set(), set()
+        for phrase in self._canonical:
+            words = phrase.split(" ")
+            before.update(words[:-1])
+            after.update(words[1:])
+        return tuple(sorted(before)), tuple(sorted(after))
+
+    def state(self) -> tuple:
+        """The compiled tables as plain containers (marshal-able), for from_state()."""
+        return self._canonical, self._goto, self._fail, self._out
+
+    @classmethod
+    def from_state(cls, state: tuple) -> "SkillMatcher":
+        """Rebuild a matcher from state() output without compiling the automaton again."""
+        matcher = cls.__new__(cls)
+        matcher._canonical, matcher._goto, matcher._fail, matcher._out = state
+        return matcher
+
+    def _insert(self, phrase: str) -> None:
+        state = 0
+        for ch in phrase:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append(phrase)
+
+    def _link(self) -> None:
+        # Breadth-first so a state's fail target is always resolved first.
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[nxt] = self._goto[f].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, int, str]]:
+        """
+        Yield (start, end, phrase) for every occurrence of a known phrase,
+        after applying the word-boundary rule to single-token phrases.
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not out[state]:
+                continue
+            end = i + 1
+            for phrase in out[state]:
+                start = end - len(phrase)
+                if needs_word_boundary(phrase) and not (
+                    _is_boundary(text, start) and _is_boundary(text, end)
+                ):
+                    continue
+                yield start, end, phrase
+
+    def canonical(self, phrase: str) -> set[str]:
+        return self._canonical[phrase]
+
+    def find(self, text: str) -> list[tuple[int, int, str]]:
+        """(start, end, canonical skill) for every match, in text order."""
+        return [
+            (start, end, canonical)
+            for start, end, phrase in self.iter_matches(text)
+            for canonical in sorted(self._canonical[phrase])
+        ]
+
+    def extract(self, text: str) -> set[str]:
+        found: set[str] = set()
+        seen: set[str] = set()
+        for _, _, phrase in self.iter_matches(text):
+            if phrase not in seen:
+                seen.add(phrase)
+                found |= self._canonical[phrase]
+        return found
@@ -0,0 +1,39 @@
+# src/jobfit/extract/patterns.py
+
+"""
+Compiled regexes shared by the extractors.
+
+Everything is compiled once at import time. Patterns expect lowercased text.
+"""
+
+from __future__ import annotations
+
+import re
+
+# Ordered from highest to lowest; also the group names in DEGREE.
+DEGREE_LEVELS = ("phd", "masters", "bachelors")
+
+# Small-int codes for compact storage: 0 means "no degree detected" and
+# higher codes are higher degrees.
+DEGREE_CODES = {None: 0, **{level: len(DEGREE_LEVELS) - i for i, level in enumerate(DEGREE_LEVELS)}}
+
+# One scan for every degree level. The lookahead skips positions that cannot
+# start any alternative, and the named group tells which level matched.
+DEGREE = re.compile(
+    r"(?=[bdmp])\b(?:"
+    r"(?P<phd>ph\.?d\.?|phd|doctorate|doctoral)"
+    r"|(?P<masters>master|masters|m\.?s\.?|m\.?a\.?|mba|m\.?eng\.?)"
+    r"|(?P<bachelors>bachelor|bachelors|b\.?s\.?|b\.?a\.?|b\.?eng\.?)"
+    r")\b"
+)
+
+# "3-5 years" / "3 to 5 years" (group "low") or "2+ years" / "2 years" (group "single").
+YEARS_REQUIRED = re.compile(
+    r"\b(?:"
+    r"(?P<low>\d+)\s*(?:-|–|to)\s*\d+\s*(?:years|yrs)"
+    r"|(?P<single>\d+)\s*\+?\s*(?:years|yrs)"
+    r")\b"
+)
+
+# "2023-2024", "2023–present", "2022 to 2023"
+YEAR_RANGE = re.compile(r"\b(20\d{2})\s*(?:-|–|to)\s*(20\d{2}|present|current)\b")
@@ -1,25 +1,170 @@
 from __future__ import annotations
 
-def extract_requirement_lines(jd_text: str) -> list[str]:
-    cues = [
-        "required",
-        "requirements",
-        "must",
-        "experience",
-        "proficient",
-        "proficiency",
-        "familiar",
-        "knowledge of",
-        "ability to",
-        "years",
-    ]
-
-    lines = [line.strip() for line in jd_text.splitlines()]
-    lines = [line for line in lines if line]
-
-    req_lines = []
-    for line in lines:
-        low = line.lower()
-        if any(cue in low for cue in cues):
-            req_lines.append(line)
-    return req_lines
+import re
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Iterable, Iterator, NamedTuple
+
+CUES = [
+    "required",
+    "requirements",
+    "must",
+    "experience",
+    "proficient",
+    "proficiency",
+    "familiar",
+    "knowledge of",
+    "ability to",
+    "years",
+]
+
+# Per-line matcher for streamed input. On whole strings the lines are found
+# with one str.find() scan per cue instead (see _cue_line_indices).
+CUE = re.compile("|".join(re.escape(cue) for cue in CUES))
+
+# Line breaks recognised by str.splitlines(), and whitespace that is not one.
+_BREAKS = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+_SPACE = rf"[^\S{_BREAKS}]"
+
+# Section kinds for headers; lines before the first header have section None.
+HEADER_SECTIONS = {
+    "requirements": (
+        "requirements", "required qualifications", "minimum qualifications",
+        "basic qualifications", "qualifications", "required skills", "skills",
+        "what you bring", "what you'll need", "what you will need", "who you are",
+        "must have", "must haves", "must-haves",
+    ),
+    "preferred": (
+        "nice to have", "nice to haves", "nice-to-have", "nice-to-haves",
+        "preferred qualifications", "preferred skills", "preferred",
+        "bonus points", "pluses",
+    ),
+    "other": (
+        "responsibilities", "key responsibilities", "what you'll do", "what you will do",
+        "duties", "about us", "about the role", "about the company", "about the team",
+        "who we are", "benefits", "perks", "compensation", "salary", "overview",
+        "job description", "the role", "our values", "equal opportunity",
+    ),
+}
+
+_HEADER_KIND = {name: kind for kind, names in HEADER_SECTIONS.items() for name in names}
+
+# A header is a known name alone on its line (optionally bulleted, bold or
+# followed by ':'), or a known name followed by ':' and inline content. The
+# lookbehind/lookahead pin it to line bounds, so it can be matched at a line
+# start inside the whole text.
+HEADER = re.compile(
+    rf"(?<![^{_BREAKS}])(?:{_SPACE}|[#*_>•-])*(?P<name>"
+    + "|".join(re.escape(name).replace("'", "['’]") for name in sorted(_HEADER_KIND, key=len, reverse=True))
+    + rf")(?:(?:{_SPACE}|[*_])*:?(?:{_SPACE}|[*_])*(?=[{_BREAKS}]|\Z)|{_SPACE}*:)",
+    re.IGNORECASE,
+)
+
+# What analyze() reads: requirement blocks plus any text before the first
+# header (postings without headers), skipping responsibilities, benefits etc.
+RELEVANT_SECTIONS = frozenset({None, "requirements", "preferred"})
+
+
+class RequirementLine(NamedTuple):
+    start: int
+    end: int
+    text: str
+    section: str | None
+
+
+def detect_section_header(line: str) -> str | None:
+    """Section kind ('requirements', 'preferred', 'other') if the line is a header."""
+    m = HEADER.match(line.strip())
+    if m is None:
+        return None
+    return _HEADER_KIND[m.group("name").lower().replace("’", "'")]
+
+
+def iter_requirement_lines(lines: Iterable[str], sections=None) -> Iterator[RequirementLine]:
+    """
+    Classify lines in a single pass and yield the requirement lines.
+
+    `lines` can be any iterable of lines (with or without line endings), e.g.
+    an open file, so very large posting dumps are processed as a stream.
+    Offsets count characters from the start of the input.
+
+    A line is a requirement line if it contains a cue word. If `sections` is
+    given, only lines inside those section kinds are kept (None = before the
+    first header); the header line itself belongs to the section it opens.
+    """
+    section = None
+    pos = 0
+    for raw in lines:
+        line = raw.strip()
+        if line:
+            header = detect_section_header(line)
+            if header is not None:
+                section = header
+
+            if (sections is None or section in sections) and CUE.search(line.lower()):
+                start = pos + (len(raw) - len(raw.lstrip()))
+                yield RequirementLine(start, start + len(line), line, section)
+        pos += len(raw)
+
+
+def _cue_line_indices(low: str, ends: list[int]) -> list[int]:
+    """Indices of the lines (ending at `ends`) whose lowercased text contains a cue."""
+    hits = set()
+    for cue in CUES:
+        i = low.find(cue)
+        while i != -1:
+            k = bisect_right(ends, i)
+            hits.add(k)
+            # The line is already classified, resume the search after it.
+            i = low.find(cue, ends[k])
+    return sorted(hits)
+
+
+def extract_requirement_spans(jd_text: str, sections=None) -> list[tuple[int, int]]:
+    """
+    (start, end) offsets in jd_text of every requirement line, stripped of
+    surrounding whitespace. Lines are split like str.splitlines().
+
+    Same result as iter_requirement_lines(); on a whole string the cue and
+    header scans run over the full text rather than line by line.
+    """
+    low = jd_text.lower()
+    if len(low) != len(jd_text):
+        # Lowercasing changed offsets (e.g. 'İ'), classify line by line.
+        return [
+            (line.start, line.end)
+            for line in iter_requirement_lines(jd_text.splitlines(keepends=True), sections)
+        ]
+
+    raws = jd_text.splitlines(keepends=True)
+    ends = list(accumulate(map(len, raws)))
+    indices = _cue_line_indices(low, ends)
+
+    if sections is not None:
+        match = HEADER.match
+        headers = [
+            (k, m.group("name"))
+            for k, (start, end) in enumerate(zip((0, *ends), ends))
+            if (m := match(jd_text, start, end)) is not None
+        ]
+        kept = []
+        h = 0
+        section = None
+        for k in indices:
+            while h < len(headers) and headers[h][0] <= k:
+                section = _HEADER_KIND[headers[h][1].lower().replace("’", "'")]
+                h += 1
+            if section in sections:
+                kept.append(k)
+        indices = kept
+
+    spans = []
+    for k in indices:
+        raw = raws[k]
+        start = ends[k] - len(raw.lstrip())
+        spans.append((start, start + len(raw.strip())))
+    return spans
+
+
+def extract_requirement_lines(jd_text: str, sections=None) -> list[str]:
+    return [jd_text[start:end] for start, end in extract_requirement_spans(jd_text, sections)]
@@ -4,18 +4,25 @@ from __future__ import annotations
 
 import json
 import re
+from functools import lru_cache
 from pathlib import Path
 
+from jobfit.extract.matcher import SkillMatcher, needs_word_boundary
+
 
 def load_skills_seed(seed_path: Path) -> dict:
     return json.loads(seed_path.read_text(encoding="utf-8"))
 
 
 def _contains(text: str, phrase: str) -> bool:
+    """
+    Reference check for a single phrase. `SkillMatcher` applies the same rules
+    to the whole vocabulary at once; this is kept for parity tests and benchmarks.
+    """
     p = phrase.lower()
 
     # Single word skills: word boundary regex
-    if (" " not in p) and ("-" not in p):
+    if needs_word_boundary(p):
         pattern = rf"\b{re.escape(p)}\b"   # IMPORTANT: single backslash
         return re.search(pattern, text) is not None
 
@@ -23,15 +30,21 @@ def _contains(text: str, phrase: str) -> bool:
     return p in text
 
 
-def extract_skills(text: str, skills: list[str], synonyms: dict[str, str]) -> set[str]:
-    found: set[str] = set()
+@lru_cache(maxsize=8)
+def _cached_matcher(skills: tuple[str, ...], synonyms: tuple[tuple[str, str], ...]) -> SkillMatcher:
+    return SkillMatcher(list(skills), dict(synonyms))
+
 
-    for skill in skills:
-        if _contains(text, skill):
-            found.add(skill)
+def build_skill_matcher(skills: list[str], synonyms: dict[str, str]) -> SkillMatcher:
+    """
+    Return the compiled matcher for this vocabulary (built once, then reused).
 
-    for alias, canonical in synonyms.items():
-        if _contains(text, alias):
-            found.add(canonical)
+    The cache is keyed on the whole vocabulary, so each call costs
+    O(vocabulary); hot paths use Taxonomy.extract_skills(), whose matcher is
+    compiled once per taxonomy.
+    """
+    return _cached_matcher(tuple(skills), tuple(synonyms.items()))
 
-    return found
+
+def extract_skills(text: str, skills: list[str], synonyms: dict[str, str]) -> set[str]:
+    return build_skill_matcher(skills, synonyms).extract(text)
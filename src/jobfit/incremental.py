@@ -0,0 +1,329 @@
+# src/jobfit/incremental.py
+"""
+Incremental profiling of documents that are edited in place.
+
+An IncrementalProfiler keeps the lines of the last version of a document
+and what was extracted from each one (normalized text, skill matches, year
+ranges, requirement cues, ...). A new version is diffed against it line by
+line: the unchanged prefix and suffix keep their results, and only the
+lines in between are extracted again. Aggregating the per-line results
+into a DocumentProfile is a cheap pass over the lines; the matching and
+regex work grows with the size of the edit, not of the document.
+
+The profile is identical to profile_resume() / profile_jd() on the whole
+text. Two kinds of match can cross a line break and get extra handling:
+
+- Multiword skills can span lines, since normalization joins lines with a
+  space. Every junction between two lines is scanned in a window of the
+  longest skill phrase on either side, memoized by the window's text.
+- Year expressions can span lines ("2019 -" / "2021"). Lines whose ends
+  could be part of such a match are grouped and scanned together.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+
+from jobfit.extract.education import detect_degree_level, detect_major_keywords
+from jobfit.extract.experience import estimate_resume_years
+from jobfit.extract.patterns import DEGREE_LEVELS, YEARS_REQUIRED
+from jobfit.extract.requirements import CUE, RELEVANT_SECTIONS, detect_section_header
+from jobfit.preprocess.normalize import normalize_text
+from jobfit.profile import DocumentProfile, hash_normalized
+from jobfit.result_cache import CacheStats
+from jobfit.taxonomy import Taxonomy, get_taxonomy
+from jobfit.timing import stage
+
+# Characters that can end / start a line inside a YEAR_RANGE or
+# YEARS_REQUIRED match that spans a line break (digits, dashes, "to",
+# "2+", "years", "present", "current"). Over-grouping is harmless.
+_SOFT_TAIL = frozenset("0123456789-–o+")
+_SOFT_HEAD = frozenset("0123456789-–tpcy+")
+
+
+@dataclass(frozen=True, slots=True)
+class _Line:
+    """What was extracted from one line (with its line break)."""
+
+    norm: str
+    spans: tuple[tuple[int, int, str], ...]
+    skills: frozenset[str]
+    # Whether a multiword skill could run across the break before / after the line.
+    joins_prev: bool
+    joins_next: bool
+    blank: bool
+    # Whether a year expression could run across the break before / after the line.
+    soft_head: bool
+    soft_tail: bool
+    years: object
+    # Resume lines
+    education: bool = False
+    # JD lines
+    header: str | None = None
+    cue: bool = False
+    degree: str | None = None
+    majors: frozenset[str] = frozenset()
+
+
+def _years_required_parts(text: str) -> tuple[int | None, int | None]:
+    """(first range minimum, largest single number) of the years requirements in `text`."""
+    single = None
+    for m in YEARS_REQUIRED.finditer(text.lower()):
+        if m.group("low") is not None:
+            return int(m.group("low")), single
+        value = int(m.group("single"))
+        single = value if single is None else max(single, value)
+    return None, single
+
+
+def line_diff(old: list[str], new: list[str]) -> tuple[int, int, int]:
+    """
+    The edited region between two versions, as (start, old_end, new_end):
+    old[start:old_end] was replaced by new[start:new_end] and everything
+    outside it is unchanged.
+    """
+    n = min(len(old), len(new))
+    start = 0
+    while start < n and old[start] == new[start]:
+        start += 1
+    suffix = 0
+    while suffix < n - start and old[-1 - suffix] == new[-1 - suffix]:
+        suffix += 1
+    return start, len(old) - suffix, len(new) - suffix
+
+
+class IncrementalProfiler:
+    """
+    Profiles successive versions of one document ("resume" or "jd").
+
+    `stats` counts lines reused from the previous version (hits) and lines
+    extracted again (misses). A taxonomy with another version starts over.
+    """
+
+    def __init__(self, kind: str):
+        if kind not in ("resume", "jd"):
+            raise ValueError(f"kind must be 'resume' or 'jd', not {kind!r}")
+        self.kind = kind
+        self.stats = CacheStats()
+        self._version: str | None = None
+        self._lines: list[str] = []
+        self._records: list[_Line] = []
+        # Junction windows and multi-line year blocks of the last version.
+        self._junctions: dict[tuple[str, int], tuple[tuple[int, int, str], ...]] = {}
+        self._blocks: dict[str, object] = {}
+        self._longest = 0
+        self._before: tuple[str, ...] = ()
+        self._after: tuple[str, ...] = ()
+        self._lock = threading.Lock()
+
+    def update(self, text: str, taxonomy: Taxonomy | None = None, requirements: bool = True) -> DocumentProfile:
+        """
+        Profile `text`, re-extracting only the lines that differ from the
+        previous version. For JDs, requirements=False leaves the requirement
+        lines as None, like profile_jd().
+        """
+        if taxonomy is None:
+            taxonomy = get_taxonomy()
+        with self._lock:
+            if taxonomy.version != self._version:
+                self._version = taxonomy.version
+                self._lines, self._records = [], []
+                self._junctions, self._blocks = {}, {}
+                self._longest = taxonomy.matcher.longest_phrase()
+                self._before, self._after = taxonomy.matcher.space_neighbours()
+
+            with stage(f"{self.kind}.diff"):
+                lines = text.splitlines(keepends=True)
+                start, old_end, new_end = line_diff(self._lines, lines)
+                # Lines that only moved within the edited region are reused too.
+                known = dict(zip(self._lines[start:old_end], self._records[start:old_end]))
+
+            with stage(f"{self.kind}.lines"):
+                changed = []
+                for line in lines[start:new_end]:
+                    record = known.get(line)
+                    if record is None:
+                        record = self._extract(line, taxonomy)
+                        self.stats.misses += 1
+                    else:
+                        self.stats.hits += 1
+                    changed.append(record)
+                self.stats.hits += len(lines) - len(changed)
+
+            records = self._records[:start] + changed + self._records[old_end:]
+            self._lines, self._records = lines, records
+
+            with stage(f"{self.kind}.assemble"):
+                return self._assemble(text, lines, records, taxonomy, requirements)
+
+    def _extract(self, line: str, taxonomy: Taxonomy) -> _Line:
+        norm = normalize_text(line)
+        spans = tuple(taxonomy.find_skills(norm)) if norm else ()
+        stripped = line.strip()
+        common = dict(
+            norm=norm,
+            spans=spans,
+            skills=frozenset(skill for _, _, skill in spans),
+            joins_prev=norm.partition(" ")[0].startswith(self._after),
+            joins_next=norm.rpartition(" ")[2].endswith(self._before),
+            blank=not stripped,
+            soft_head=stripped[:1].lower() in _SOFT_HEAD,
+            soft_tail=stripped[-1:].lower() in _SOFT_TAIL,
+        )
+        if self.kind == "resume":
+            return _Line(**common, years=estimate_resume_years(line), education="education" in line.lower())
+        return _Line(
+            **common,
+            years=_years_required_parts(line),
+            header=detect_section_header(stripped) if stripped else None,
+            cue=CUE.search(stripped.lower()) is not None,
+            degree=detect_degree_level(line),
+            majors=frozenset(detect_major_keywords(line, taxonomy.majors)),
+        )
+
+    def _junction(self, window: str, space: int, taxonomy: Taxonomy, seen: dict):
+        """Skill matches in `window` that contain the line-joining space at `space`."""
+        key = (window, space)
+        found = seen.get(key)
+        if found is None:
+            found = self._junctions.get(key)
+            if found is None:
+                found = tuple(m for m in taxonomy.find_skills(window) if m[0] <= space < m[1])
+            seen[key] = found
+        return found
+
+    def _block_years(self, lines: list[str], records: list[_Line], first: int, last: int, seen: dict):
+        if first == last:
+            return records[first].years
+        text = "".join(lines[first : last + 1])
+        value = seen.get(text, self._blocks.get(text))
+        if value is None:
+            value = estimate_resume_years(text) if self.kind == "resume" else _years_required_parts(text)
+        seen[text] = value
+        return value
+
+    def _assemble(self, text, lines, records, taxonomy, requirements) -> DocumentProfile:
+        is_jd = self.kind == "jd"
+        norm = " ".join([record.norm for record in records if record.norm])
+        longest = self._longest
+        junctions: dict = {}
+        blocks: dict = {}
+
+        spans: list[tuple[int, int, str]] = []
+        crossing: list[tuple[int, int, str]] = []
+        years_parts = []
+        pos = 0  # offset in `norm` of the next non-empty line
+        last_space = -1
+        joins = False
+        block: list[int] | None = None  # first and last line of the current year block
+        for i, record in enumerate(records):
+            if record.norm:
+                if pos:
+                    space = pos - 1
+                    if joins and record.joins_prev:
+                        lo = max(last_space + 1, space - longest + 1)
+                        found = self._junction(norm[lo : space + longest], space - lo, taxonomy, junctions)
+                        crossing.extend((lo + start, lo + end, skill) for start, end, skill in found)
+                    last_space = space
+                joins = record.joins_next
+                if is_jd:
+                    spans.extend((pos + start, pos + end, skill) for start, end, skill in record.spans)
+                pos += len(record.norm) + 1
+            if not record.blank:
+                if block is not None and record.soft_head and records[block[1]].soft_tail:
+                    block[1] = i
+                else:
+                    if block is not None:
+                        years_parts.append(self._block_years(lines, records, *block, blocks))
+                    block = [i, i]
+        if block is not None:
+            years_parts.append(self._block_years(lines, records, *block, blocks))
+        self._junctions, self._blocks = junctions, blocks
+
+        skills = frozenset().union(*[record.skills for record in records], (skill for _, _, skill in crossing))
+        if not is_jd:
+            for i, record in enumerate(records):
+                if record.education:
+                    edu_block = "\n".join(line.splitlines()[0] for line in lines[i : i + 12])
+                    break
+            else:
+                edu_block = text[:800]
+            return DocumentProfile(
+                kind="resume",
+                text=text,
+                norm=norm,
+                skills=skills,
+                degree=detect_degree_level(edu_block),
+                majors=frozenset(detect_major_keywords(edu_block, taxonomy.majors)),
+                years=sum(years_parts, 0.0),
+                edu_block=edu_block,
+                norm_hash=hash_normalized(norm),
+            )
+
+        if crossing:
+            # The order find_skills() reports them in: by end, longer phrases first.
+            spans = sorted(spans + crossing, key=lambda m: (m[1], m[0], m[2]))
+
+        years = None
+        for low, single in years_parts:
+            if low is not None:
+                years = low
+                break
+            if single is not None:
+                years = single if years is None else max(years, single)
+
+        levels = {record.degree for record in records}
+        degree = next((level for level in DEGREE_LEVELS if level in levels), None)
+
+        req_lines = req_skills = None
+        if requirements:
+            req_lines, req_skills = [], []
+            section = None
+            for line, record in zip(lines, records):
+                if record.header is not None:
+                    section = record.header
+                if record.cue and section in RELEVANT_SECTIONS:
+                    req_lines.append(line.strip())
+                    req_skills.append(record.skills)
+            req_lines, req_skills = tuple(req_lines), tuple(req_skills)
+
+        return DocumentProfile(
+            kind="jd",
+            text=text,
+            norm=norm,
+            skills=skills,
+            degree=degree,
+            majors=frozenset().union(*[record.majors for record in records]),
+            years=years,
+            norm_hash=hash_normalized(norm),
+            skill_spans=tuple(spans),
+            requirement_lines=req_lines,
+            requirement_skills=req_skills,
+        )
+
+
+class IncrementalProfiles:
+    """
+    Keeps the previous resume and JD and profiles each new version
+    incrementally. Accepted by analyze(profiles=...) like a ProfileCache:
+
+        profiles = IncrementalProfiles()
+        analyze(resume, jd, profiles=profiles)
+        analyze(resume, edited_jd, profiles=profiles)  # only edited lines are re-extracted
+    """
+
+    def __init__(self):
+        self.resume = IncrementalProfiler("resume")
+        self.jd = IncrementalProfiler("jd")
+
+    def profile_resume(self, resume_text: str, taxonomy: Taxonomy | None = None) -> DocumentProfile:
+        return self.resume.update(resume_text, taxonomy)
+
+    def profile_jd(
+        self,
+        jd_text: str,
+        taxonomy: Taxonomy | None = None,
+        requirements: bool = True,
+    ) -> DocumentProfile:
+        return self.jd.update(jd_text, taxonomy, requirements)
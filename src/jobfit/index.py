@@ -0,0 +1,259 @@
+# src/jobfit/index.py
+
+from __future__ import annotations
+
+import json
+import os
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+from jobfit.extract.patterns import DEGREE_CODES
+from jobfit.profile import DocumentProfile
+from jobfit.rank import RankStats, top_k
+from jobfit.score.scoring import skills_points_from_count
+from jobfit.score.education_scoring import education_points_from_matches
+from jobfit.score.experience_scoring import experience_points_from_years
+
+INDEX_FORMAT_VERSION = 1
+
+_DEGREE_NAMES = {code: name for name, code in DEGREE_CODES.items()}
+
+
+def _bit_ids(bits: int) -> Iterator[int]:
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+class _Vocabulary:
+    """Dense ids for the names an index has seen, assigned on first use."""
+
+    def __init__(self):
+        self.ids: dict[str, int] = {}
+        self.names: list[str] = []
+
+    def add(self, name: str) -> int:
+        i = self.ids.get(name)
+        if i is None:
+            i = self.ids[name] = len(self.names)
+            self.names.append(name)
+        return i
+
+    def bits(self, names) -> int:
+        bits = 0
+        for name in names:
+            bits |= 1 << self.add(name)
+        return bits
+
+    def lookup_bits(self, names) -> int:
+        """Like bits(), but names never seen are skipped instead of added."""
+        bits = 0
+        for name in names:
+            i = self.ids.get(name)
+            if i is not None:
+                bits |= 1 << i
+        return bits
+
+    def decode(self, bits: int) -> list[str]:
+        return sorted(self.names[i] for i in _bit_ids(bits))
+
+
+@dataclass(frozen=True, slots=True)
+class CandidateRecord:
+    """
+    What the index keeps per resume: no raw text, only scoring inputs.
+    Skills and majors are int bitsets over the index's own dense ids and
+    degree is a DEGREE_CODES value, so a record is a few machine words.
+    """
+
+    key: str
+    skills: int
+    degree: int
+    majors: int
+    years: float
+
+
+@dataclass(frozen=True, slots=True)
+class Match:
+    key: str
+    total_points: int
+    skills_points: int
+    education_points: int
+    experience_points: int
+    matched_skills: int
+
+
+class SkillIndex:
+    """
+    Inverted index from skill to the resumes that have it.
+
+    Posting lists are sorted `array('I')` of internal resume ids, so a JD query
+    counts matched skills per candidate by walking only the postings of the
+    JD's skills. Education and experience are scored from the stored record.
+    """
+
+    def __init__(self, taxonomy_version: str | None = None):
+        self.taxonomy_version = taxonomy_version
+        self._records: dict[int, CandidateRecord] = {}
+        self._ids: dict[str, int] = {}
+        self._skills = _Vocabulary()
+        self._majors = _Vocabulary()
+        # Indexed by dense skill id.
+        self._postings: list[array] = []
+        self._next_id = 0
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._ids
+
+    def keys(self) -> list[str]:
+        return list(self._ids)
+
+    def postings(self, skill: str) -> array:
+        i = self._skills.ids.get(skill)
+        return self._postings[i] if i is not None else array("I")
+
+    # -------- Updates --------
+    def add(self, key: str, profile: DocumentProfile) -> int:
+        """Add a resume profile under `key`, replacing any previous entry."""
+        return self._add(key, profile.skills, profile.degree, profile.majors, float(profile.years or 0.0))
+
+    def _add(self, key: str, skills, degree: str | None, majors, years: float, rid: int | None = None) -> int:
+        record = CandidateRecord(
+            key=key,
+            skills=self._skills.bits(skills),
+            degree=DEGREE_CODES[degree],
+            majors=self._majors.bits(majors),
+            years=years,
+        )
+        while len(self._postings) < len(self._skills.names):
+            self._postings.append(array("I"))
+        return self._add_record(record, rid)
+
+    def _add_record(self, record: CandidateRecord, rid: int | None = None) -> int:
+        self.remove(record.key)
+        if rid is None:
+            rid = self._next_id
+        self._next_id = max(self._next_id, rid + 1)
+
+        self._records[rid] = record
+        self._ids[record.key] = rid
+        for skill in _bit_ids(record.skills):
+            posting = self._postings[skill]
+            # New ids are always the largest, so this is normally an append.
+            if not posting or posting[-1] < rid:
+                posting.append(rid)
+            else:
+                posting.insert(bisect_left(posting, rid), rid)
+        return rid
+
+    def remove(self, key: str) -> bool:
+        rid = self._ids.pop(key, None)
+        if rid is None:
+            return False
+        record = self._records.pop(rid)
+        for skill in _bit_ids(record.skills):
+            posting = self._postings[skill]
+            del posting[bisect_left(posting, rid)]
+        return True
+
+    # -------- Queries --------
+    def skill_counts(self, jd_skills) -> Counter:
+        """Number of JD skills each candidate id has, from posting lists only."""
+        counts: Counter = Counter()
+        for skill in jd_skills:
+            i = self._skills.ids.get(skill)
+            if i is not None:
+                counts.update(self._postings[i])
+        return counts
+
+    def query(self, jd: DocumentProfile, k: int = 10, stats: RankStats | None = None) -> list[Match]:
+        """
+        Top-k candidates for a JD profile, best first (ties keep insertion order).
+
+        Candidates are visited by matched-skill count, highest first, and
+        only scored while skills points for that count plus full education
+        and experience points could still reach the top k (see jobfit.rank).
+        """
+        counts = self.skill_counts(jd.skills)
+        n_jd_skills = len(jd.skills)
+        jd_degree = DEGREE_CODES[jd.degree]
+        jd_majors = self._majors.lookup_bits(jd.majors)
+
+        def match(rid: int, record: CandidateRecord) -> Match:
+            matched = counts.get(rid, 0)
+            skills_points = skills_points_from_count(matched, n_jd_skills, max_points=50)
+            education_points = education_points_from_matches(
+                degree_ok=not jd_degree or record.degree == jd_degree,
+                major_ok=not jd.majors or bool(record.majors & jd_majors),
+                max_points=15,
+            )
+            experience_points = experience_points_from_years(jd.years, record.years, max_points=35)
+            return Match(
+                key=record.key,
+                total_points=skills_points + education_points + experience_points,
+                skills_points=skills_points,
+                education_points=education_points,
+                experience_points=experience_points,
+                matched_skills=matched,
+            )
+
+        def score(rid: int) -> tuple[int, Match]:
+            m = match(rid, self._records[rid])
+            return m.total_points, m
+
+        def ordered() -> Iterator[tuple[int, int]]:
+            # Record ids only grow, so dict order is id order within each bucket.
+            buckets: dict[int, list[int]] = {}
+            for rid, matched in counts.items():
+                buckets.setdefault(matched, []).append(rid)
+            for matched in range(n_jd_skills, 0, -1):
+                bound = skills_points_from_count(matched, n_jd_skills, max_points=50) + 15 + 35
+                for rid in sorted(buckets.get(matched, ())):
+                    yield bound, rid
+            bound = skills_points_from_count(0, n_jd_skills, max_points=50) + 15 + 35
+            for rid in self._records:
+                if rid not in counts:
+                    yield bound, rid
+
+        if stats is not None:
+            stats.candidates += len(self._records)
+        return [m for _, m in top_k(ordered(), k, score, stats)]
+
+    # -------- Persistence --------
+    def save(self, path: Path | str) -> None:
+        path = Path(path)
+        payload = {
+            "format": INDEX_FORMAT_VERSION,
+            "taxonomy_version": self.taxonomy_version,
+            "next_id": self._next_id,
+            "records": [
+                [
+                    rid, r.key, self._skills.decode(r.skills), _DEGREE_NAMES[r.degree],
+                    self._majors.decode(r.majors), r.years,
+                ]
+                for rid, r in sorted(self._records.items())
+            ],
+        }
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path | str) -> "SkillIndex":
+        payload = json.loads(Path(path).read_text(encoding="utf-8"))
+        if payload.get("format") != INDEX_FORMAT_VERSION:
+            raise ValueError(f"Unsupported index format in {path}: {payload.get('format')!r}")
+
+        index = cls(taxonomy_version=payload.get("taxonomy_version"))
+        for rid, key, skills, degree, majors, years in payload["records"]:
+            index._add(key, skills, degree, majors, years, rid=rid)
+        index._next_id = max(index._next_id, payload.get("next_id", 0))
+        return index
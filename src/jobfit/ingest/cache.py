@@ -0,0 +1,100 @@
+# src/jobfit/ingest/cache.py
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def content_hash(data: bytes | bytearray | memoryview) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def default_cache_dir() -> Path:
+    """$JOBFIT_CACHE_DIR, else jobfit/ under $XDG_CACHE_HOME, else ~/.cache/jobfit."""
+    root = os.environ.get("JOBFIT_CACHE_DIR")
+    if root:
+        return Path(root)
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    # The XDG spec says to ignore relative paths.
+    base = Path(xdg) if xdg and os.path.isabs(xdg) else Path.home() / ".cache"
+    return base / "jobfit"
+
+
+class TextCache:
+    """
+    On-disk cache of extracted text, one file per content hash.
+
+    Hits refresh the file's mtime, and writes evict the least recently used
+    entries once the directory grows past `max_bytes`. The directory is
+    only scanned on the first write and when the running total of entry
+    sizes crosses `max_bytes`, so a write does not cost O(entries).
+    """
+
+    def __init__(self, directory: Path | str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._total: int | None = None  # bytes in entries, as of the last scan plus our own writes
+
+    def _path(self, digest: str) -> Path:
+        return self.directory / f"{digest}.txt"
+
+    def get(self, digest: str) -> str | None:
+        path = self._path(digest)
+        try:
+            text = path.read_text(encoding="utf-8")
+        except (FileNotFoundError, UnicodeDecodeError):
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return text
+
+    def put(self, digest: str, text: str) -> None:
+        import tempfile  # only writers need it; most CLI runs only read
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and rename so readers never see partial entries.
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        size = os.path.getsize(tmp)
+        path = self._path(digest)
+        try:
+            replaced = path.stat().st_size
+        except FileNotFoundError:
+            replaced = 0
+        os.replace(tmp, path)
+
+        if self._total is None:
+            self.evict()
+        else:
+            self._total += size - replaced
+            if self._total > self.max_bytes:
+                self.evict()
+
+    def evict(self) -> None:
+        """Scan the directory and drop the oldest entries until it fits in `max_bytes`."""
+        entries = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(".txt"):
+                continue
+            st = entry.stat()
+            entries.append((st.st_mtime_ns, st.st_size, entry.path))
+            total += st.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+        self._total = total
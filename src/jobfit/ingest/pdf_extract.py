@@ -1,11 +1,108 @@
 from __future__ import annotations
 
+import io
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import BinaryIO, Iterator, Union
+
 from pypdf import PdfReader
 
-def extract_text_from_pdf(pdf_path: Path) -> str:
-    reader = PdfReader(str(pdf_path))
-    parts = []
-    for page in reader.pages:
-        parts.append(page.extract_text() or "")
-    return "\n".join(parts)
+from jobfit.ingest.cache import TextCache, content_hash
+from jobfit.timing import stage
+
+PdfSource = Union[Path, str, bytes, bytearray, memoryview, BinaryIO]
+
+
+def read_pdf_source(source: PdfSource) -> bytes | bytearray | memoryview:
+    """
+    Return the raw bytes of a PDF given as a path, a bytes-like object or a
+    binary file-like object, e.g. to hash them. In-memory buffers (e.g. a
+    Streamlit upload) are exposed through `getbuffer()` without copying.
+    """
+    if isinstance(source, (str, Path)):
+        return Path(source).read_bytes()
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return source
+    if hasattr(source, "getbuffer"):
+        return source.getbuffer()
+    return source.read()
+
+
+def _pdf_stream(data: bytes | bytearray | memoryview | BinaryIO) -> BinaryIO:
+    """
+    A seekable stream over a PDF for PdfReader. File-like objects are used
+    as they are (rewound); BytesIO shares the memory of a bytes object
+    instead of copying it, so only a bytearray or memoryview is copied.
+    """
+    if hasattr(data, "read"):
+        data.seek(0)
+        return data
+    return io.BytesIO(data)
+
+
+def _extract_page_range(data: bytes, start: int, stop: int) -> list[str]:
+    reader = PdfReader(io.BytesIO(data))
+    return [(reader.pages[i].extract_text() or "") for i in range(start, stop)]
+
+
+def iter_pdf_pages(data: bytes | bytearray | memoryview | BinaryIO, workers: int = 1) -> Iterator[str]:
+    """
+    Yield the text of each page in order.
+
+    With workers > 1 the page ranges are extracted in separate processes
+    (pypdf is pure Python, so threads would not help); pages are still
+    yielded in order as soon as their range is done. The workers each get
+    a copy of the bytes.
+    """
+    stream = _pdf_stream(data)
+    reader = PdfReader(stream)
+    n_pages = len(reader.pages)
+
+    if workers <= 1 or n_pages < 2:
+        for page in reader.pages:
+            yield page.extract_text() or ""
+        return
+
+    stream.seek(0)
+    data = bytes(read_pdf_source(stream))  # sent to the workers
+    step = -(-n_pages // workers)
+    ranges = [(i, min(i + step, n_pages)) for i in range(0, n_pages, step)]
+    with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+        futures = [pool.submit(_extract_page_range, data, start, stop) for start, stop in ranges]
+        for future in futures:
+            yield from future.result()
+
+
+def extract_text_from_pdf(
+    source: PdfSource,
+    cache: TextCache | None = None,
+    workers: int = 1,
+) -> str:
+    """
+    Extract the text of a PDF, pages joined by newlines.
+
+    `source` is a path, bytes-like object or binary file-like object, so
+    uploads can be handled without touching the filesystem. In-memory
+    buffers (anything with `getbuffer()`, e.g. a Streamlit upload) are
+    parsed from the object itself and bytes are parsed in place, so neither
+    is copied. When a cache is given, text is looked up by the SHA-256 of
+    the bytes first, so an unchanged PDF is only parsed once.
+    """
+    with stage("pdf.read"):
+        data = read_pdf_source(source)
+
+    digest = None
+    if cache is not None:
+        with stage("pdf.cache_lookup"):
+            digest = content_hash(data)
+            cached = cache.get(digest)
+        if cached is not None:
+            return cached
+
+    with stage("pdf.parse"):
+        text = "\n".join(iter_pdf_pages(source if hasattr(source, "getbuffer") else data, workers=workers))
+
+    if cache is not None:
+        with stage("pdf.cache_store"):
+            cache.put(digest, text)
+    return text
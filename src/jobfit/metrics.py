@@ -0,0 +1,107 @@
+# src/jobfit/metrics.py
+"""
+Sinks for the per-stage timings of analyze(..., metrics=sink).
+
+A sink is any callable taking the "timings" dict of one analysis (see
+StageTimer.to_dict()), so a plain function works as a callback. Two are
+provided: JsonlSink appends one JSON line per analysis, PrometheusSink
+keeps running totals and renders them in the Prometheus text format.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Callable, TextIO
+
+MetricsSink = Callable[[dict], None]
+
+
+class JsonlSink:
+    """Write each timings dict as one JSON line to a text stream or file path."""
+
+    def __init__(self, target: TextIO | Path | str):
+        if isinstance(target, (str, Path)):
+            self._file = open(target, "a", encoding="utf-8")
+            self._owns_file = True
+        else:
+            self._file = target
+            self._owns_file = False
+        self._lock = threading.Lock()
+
+    def __call__(self, timings: dict) -> None:
+        line = json.dumps(timings, separators=(",", ":")) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._owns_file:
+            self._file.close()
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class PrometheusSink:
+    """
+    Running totals per stage, exposed as Prometheus counters:
+
+        jobfit_analyze_total, jobfit_analyze_seconds_total,
+        jobfit_stage_seconds_total{stage=...}, jobfit_stage_calls_total{stage=...}
+
+    render() returns the text exposition format; write() puts it in a file
+    atomically (e.g. for node_exporter's textfile collector).
+    """
+
+    def __init__(self, prefix: str = "jobfit"):
+        self.prefix = prefix
+        self.analyses = 0
+        self.seconds = 0.0
+        self.stage_seconds: dict[str, float] = {}
+        self.stage_calls: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, timings: dict) -> None:
+        with self._lock:
+            self.analyses += 1
+            self.seconds += timings["total_ms"] / 1000
+            for name, row in timings["stages"].items():
+                self.stage_seconds[name] = self.stage_seconds.get(name, 0.0) + row["ms"] / 1000
+                self.stage_calls[name] = self.stage_calls.get(name, 0) + row["calls"]
+
+    def render(self) -> str:
+        p = self.prefix
+        with self._lock:
+            lines = [
+                f"# HELP {p}_analyze_total Analyses recorded.",
+                f"# TYPE {p}_analyze_total counter",
+                f"{p}_analyze_total {self.analyses}",
+                f"# HELP {p}_analyze_seconds_total Wall time of the recorded analyses.",
+                f"# TYPE {p}_analyze_seconds_total counter",
+                f"{p}_analyze_seconds_total {self.seconds:.6f}",
+                f"# HELP {p}_stage_seconds_total Time spent per analysis stage.",
+                f"# TYPE {p}_stage_seconds_total counter",
+            ]
+            lines += [
+                f'{p}_stage_seconds_total{{stage="{_label(name)}"}} {seconds:.6f}'
+                for name, seconds in sorted(self.stage_seconds.items())
+            ]
+            lines += [
+                f"# HELP {p}_stage_calls_total Runs per analysis stage.",
+                f"# TYPE {p}_stage_calls_total counter",
+            ]
+            lines += [
+                f'{p}_stage_calls_total{{stage="{_label(name)}"}} {calls}'
+                for name, calls in sorted(self.stage_calls.items())
+            ]
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: Path | str) -> None:
+        path = Path(path)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(self.render(), encoding="utf-8")
+        os.replace(tmp, path)
@@ -0,0 +1,99 @@
+# src/jobfit/parallel.py
+
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterator
+
+from jobfit.analyze import PairScore, score_compact
+from jobfit.profile import DocumentProfile, compact_profile, profile_resume
+from jobfit.taxonomy import get_taxonomy
+
+# Per-process state filled in by _init_worker (or by score_files when running inline).
+_worker: dict = {}
+
+
+@dataclass
+class WorkerStats:
+    pid: int
+    resumes: int = 0
+    pairs: int = 0
+    busy_seconds: float = 0.0
+
+    @property
+    def resumes_per_second(self) -> float:
+        return self.resumes / self.busy_seconds if self.busy_seconds else 0.0
+
+
+def _init_worker(jds: list[tuple[str, DocumentProfile]], load: Callable[[Path], str]) -> None:
+    # Compile the taxonomy once per process; JD profiles arrive once via initargs
+    # and are scored in their compact (bitset) form.
+    taxonomy = get_taxonomy()
+    _worker["taxonomy"] = taxonomy
+    _worker["jds"] = [(label, compact_profile(jd, taxonomy)) for label, jd in jds]
+    _worker["load"] = load
+
+
+def _score_chunk(paths: list[Path]) -> tuple[int, float, int, list[tuple[str, str, PairScore]]]:
+    start = time.perf_counter()
+    taxonomy, jds, load = _worker["taxonomy"], _worker["jds"], _worker["load"]
+
+    rows = []
+    for path in paths:
+        resume = compact_profile(profile_resume(load(path), taxonomy), taxonomy)
+        for jd_label, jd in jds:
+            rows.append((str(path), jd_label, score_compact(resume, jd)))
+    return os.getpid(), time.perf_counter() - start, len(paths), rows
+
+
+def _chunks(items: list[Path], size: int) -> Iterator[list[Path]]:
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+def score_files(
+    resume_paths: list[Path],
+    jds: list[tuple[str, DocumentProfile]],
+    load: Callable[[Path], str],
+    workers: int = 1,
+    chunk_size: int = 64,
+    stats: dict[int, WorkerStats] | None = None,
+) -> Iterator[tuple[str, str, PairScore]]:
+    """
+    Score every resume file against the given JD profiles.
+
+    Yields (resume, jd, PairScore) rows in input order, one chunk of resumes at a
+    time, so output can be written while later chunks are still running.
+    With workers > 1 the chunks fan out over a process pool. `load` must be a
+    module-level function so it can be sent to the workers.
+    If `stats` is given it is filled with per-worker counters keyed by pid.
+    """
+    if stats is None:
+        stats = {}
+
+    def record(pid: int, seconds: float, n_resumes: int, rows: list) -> None:
+        s = stats.setdefault(pid, WorkerStats(pid))
+        s.resumes += n_resumes
+        s.pairs += len(rows)
+        s.busy_seconds += seconds
+
+    if workers <= 1:
+        _init_worker(jds, load)
+        for chunk in _chunks(resume_paths, chunk_size):
+            pid, seconds, n_resumes, rows = _score_chunk(chunk)
+            record(pid, seconds, n_resumes, rows)
+            yield from rows
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(jds, load),
+    ) as pool:
+        for pid, seconds, n_resumes, rows in pool.map(_score_chunk, _chunks(resume_paths, chunk_size)):
+            record(pid, seconds, n_resumes, rows)
+            yield from rows
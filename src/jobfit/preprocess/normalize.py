@@ -1,16 +1,107 @@
 from __future__ import annotations
 
 import re
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+
+# ASCII fast path: one table lowercases letters, keeps digits and turns
+# everything else into a space, so a single translate() does the whole job.
+_ASCII_TABLE = bytes(
+    c + 32 if 65 <= c <= 90 else c if (48 <= c <= 57 or 97 <= c <= 122) else 32
+    for c in range(256)
+)
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_TOKEN_SPLIT = re.compile(r"([a-z0-9]+)")
 
 
 def normalize_text(text: str) -> str:
-    text = text.lower()
+    """
+    Lowercase, turn anything that is NOT a letter/number into a space and
+    collapse whitespace. This removes commas, bullets, smart quotes, weird
+    unicode dashes, etc.
+    """
+    if text.isascii():
+        return " ".join(text.encode("ascii").translate(_ASCII_TABLE).decode("ascii").split())
+    return " ".join(_TOKEN.findall(text.lower()))
+
+
+def _lower_with_index(text: str) -> tuple[str, list[int] | None]:
+    """
+    Lowercase `text`; if that changes its length (e.g. 'İ'), also return the
+    source index of every lowered character.
+    """
+    low = text.lower()
+    if len(low) == len(text):
+        return low, None
+
+    parts: list[str] = []
+    index: list[int] = []
+    for i, ch in enumerate(text):
+        lc = ch.lower()
+        parts.append(lc)
+        index.extend([i] * len(lc))
+    return "".join(parts), index
+
+
+class NormalizedText:
+    """
+    normalize_text() output plus a token-level offset map back to the source.
+
+    `text` is identical to normalize_text(source). `slice(start, end)` returns
+    normalize_text(source[start:end]) straight from the normalized string, so
+    callers can reuse normalized lines instead of normalizing them again.
+    """
+
+    __slots__ = ("source", "text", "_src_starts", "_src_ends", "_norm_starts", "_norm_ends")
+
+    def __init__(self, source: str):
+        low, index = _lower_with_index(source)
+
+        # Splitting on a capturing group gives [sep, token, sep, token, ..., sep],
+        # so running lengths give every token's span without a Python-level loop.
+        parts = _TOKEN_SPLIT.split(low)
+        bounds = list(accumulate(map(len, parts)))
+        tokens = parts[1::2]
+        src_starts = bounds[0:-1:2]
+        src_ends = bounds[1::2]
+        if index is not None:
+            src_starts = [index[i] for i in src_starts]
+            src_ends = [index[i - 1] + 1 for i in src_ends]
+
+        norm_ends = list(accumulate(len(t) + 1 for t in tokens))
+        norm_ends = [e - 1 for e in norm_ends]
+        norm_starts = [e - len(t) for e, t in zip(norm_ends, tokens)]
+
+        self.source = source
+        self.text = " ".join(tokens)
+        self._src_starts = src_starts
+        self._src_ends = src_ends
+        self._norm_starts = norm_starts
+        self._norm_ends = norm_ends
+
+    def to_source(self, i: int) -> int:
+        """Source offset of normalized character i (a separator maps to the end of the previous token)."""
+        t = bisect_right(self._norm_starts, i) - 1
+        if t < 0:
+            return 0
+        if i >= self._norm_ends[t]:
+            return self._src_ends[t]
+        return min(self._src_starts[t] + (i - self._norm_starts[t]), self._src_ends[t] - 1)
+
+    def slice(self, start: int, end: int) -> str:
+        """Equivalent to normalize_text(self.source[start:end])."""
+        first = bisect_right(self._src_ends, start)
+        last = bisect_left(self._src_starts, end)
+        if first >= last:
+            return ""
+
+        if self._src_starts[first] >= start and self._src_ends[last - 1] <= end:
+            return self.text[self._norm_starts[first] : self._norm_ends[last - 1]]
 
-    # Turn anything that is NOT a letter/number into a space
-    # This removes commas, bullets, smart quotes, weird unicode dashes, etc.
-    text = re.sub(r"[^a-z0-9]+", " ", text)
+        # A token is cut by the range, fall back to normalizing the slice.
+        return normalize_text(self.source[start:end])
 
-    # Collapse whitespace
-    text = re.sub(r"\s+", " ", text).strip()
 
-    return text
+def normalize_with_offsets(text: str) -> NormalizedText:
+    return NormalizedText(text)
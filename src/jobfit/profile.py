@@ -0,0 +1,189 @@
+# src/jobfit/profile.py
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass
+
+from jobfit.ingest.cache import content_hash
+from jobfit.preprocess.normalize import NormalizedText, normalize_text
+from jobfit.extract.requirements import RELEVANT_SECTIONS, extract_requirement_spans
+from jobfit.extract.education import (
+    extract_education_block,
+    detect_degree_level,
+    detect_major_keywords,
+)
+from jobfit.extract.experience import extract_years_required, estimate_resume_years
+from jobfit.extract.patterns import DEGREE_CODES
+from jobfit.taxonomy import Taxonomy, get_taxonomy
+from jobfit.timing import stage
+
+
+@dataclass(frozen=True)
+class DocumentProfile:
+    """
+    Everything analyze() extracts from one side of a pair.
+
+    A profile is built once per document and can then be scored against any
+    number of counterparts; only the scoring step runs per pair.
+
+    For resumes `years` is the estimated experience and `degree`/`majors` come
+    from the education block. For JDs `years` is the required minimum (or None),
+    `skill_spans` holds every (start, end, skill) match in `norm`, and
+    `requirement_lines` / `requirement_skills` hold the requirement-looking
+    lines and the skills found in each (None if they were not extracted).
+    `norm_hash` is the SHA-256 of `norm`, so documents that only differ in
+    layout or punctuation can be recognised as the same content.
+    """
+
+    kind: str
+    text: str
+    norm: str
+    skills: frozenset[str]
+    degree: str | None
+    majors: frozenset[str]
+    years: float | int | None
+    edu_block: str = ""
+    norm_hash: str = ""
+    skill_spans: tuple[tuple[int, int, str], ...] = ()
+    requirement_lines: tuple[str, ...] | None = None
+    requirement_skills: tuple[frozenset[str], ...] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class CompactProfile:
+    """
+    The scoring inputs of a profile in a few machine words, for holding very
+    many documents in memory: skills and majors as int bitsets over the
+    taxonomy's dense ids, degree as a DEGREE_CODES value.
+    """
+
+    skills: int
+    majors: int
+    degree: int
+    years: float | int | None
+
+    @property
+    def n_skills(self) -> int:
+        return self.skills.bit_count()
+
+
+def compact_profile(profile: DocumentProfile, taxonomy: Taxonomy | None = None) -> CompactProfile:
+    if taxonomy is None:
+        taxonomy = get_taxonomy()
+    return CompactProfile(
+        skills=taxonomy.skill_bits(profile.skills),
+        majors=taxonomy.major_bits(profile.majors),
+        degree=DEGREE_CODES[profile.degree],
+        years=profile.years,
+    )
+
+
+def hash_normalized(norm: str) -> str:
+    return content_hash(norm.encode("utf-8"))
+
+
+def profile_resume(resume_text: str, taxonomy: Taxonomy | None = None) -> DocumentProfile:
+    if taxonomy is None:
+        taxonomy = get_taxonomy()
+
+    with stage("resume.normalize"):
+        norm = normalize_text(resume_text)
+        norm_hash = hash_normalized(norm)
+    with stage("resume.skills"):
+        skills = frozenset(taxonomy.extract_skills(norm))
+    with stage("resume.education"):
+        edu_block = extract_education_block(resume_text)
+        degree = detect_degree_level(edu_block)
+        majors = frozenset(detect_major_keywords(edu_block, taxonomy.majors))
+    with stage("resume.years"):
+        years = estimate_resume_years(resume_text)
+
+    return DocumentProfile(
+        kind="resume",
+        text=resume_text,
+        norm=norm,
+        skills=skills,
+        degree=degree,
+        majors=majors,
+        years=years,
+        edu_block=edu_block,
+        norm_hash=norm_hash,
+    )
+
+
+def profile_jd(
+    jd_text: str,
+    taxonomy: Taxonomy | None = None,
+    requirements: bool = True,
+) -> DocumentProfile:
+    """
+    Profile a job description. With requirements=False the requirement lines
+    are left as None; analyze() extracts them later only if coverage is needed.
+    """
+    if taxonomy is None:
+        taxonomy = get_taxonomy()
+
+    with stage("jd.normalize"):
+        # Requirement coverage maps skill matches back to the source, so build
+        # the offset map once here instead of normalizing the JD twice.
+        offsets = NormalizedText(jd_text) if requirements else None
+        norm = offsets.text if offsets is not None else normalize_text(jd_text)
+        norm_hash = hash_normalized(norm)
+    with stage("jd.skills"):
+        # One pass over the JD gives both the skill set and where each skill is.
+        skill_spans = tuple(taxonomy.find_skills(norm))
+    req_lines, req_skills = requirement_skills(jd_text, skill_spans, offsets) if requirements else (None, None)
+    with stage("jd.education"):
+        degree = detect_degree_level(jd_text)
+        majors = frozenset(detect_major_keywords(jd_text, taxonomy.majors))
+    with stage("jd.years"):
+        years = extract_years_required(jd_text)
+
+    return DocumentProfile(
+        kind="jd",
+        text=jd_text,
+        norm=norm,
+        skills=frozenset(skill for _, _, skill in skill_spans),
+        degree=degree,
+        majors=majors,
+        years=years,
+        norm_hash=norm_hash,
+        skill_spans=skill_spans,
+        requirement_lines=req_lines,
+        requirement_skills=req_skills,
+    )
+
+
+def requirement_skills(
+    jd_text: str,
+    skill_spans: tuple[tuple[int, int, str], ...],
+    offsets: NormalizedText | None = None,
+) -> tuple[tuple[str, ...], tuple[frozenset[str], ...]]:
+    """
+    Requirement lines of a JD and the skills matched inside each one.
+
+    Only lines in RELEVANT_SECTIONS are used, so cue words under headers such
+    as "Benefits" or "About us" do not count as requirements.
+
+    Skill matches come from the single scan of the normalized JD; each is
+    mapped back to the source through the normalization offsets and
+    attributed to the requirement line that fully contains it. Pass the
+    JD's NormalizedText as `offsets` if there is one already.
+    """
+    with stage("jd.requirements"):
+        line_spans = extract_requirement_spans(jd_text, RELEVANT_SECTIONS)
+        lines = tuple(jd_text[start:end] for start, end in line_spans)
+        per_line: list[set[str]] = [set() for _ in line_spans]
+
+        if line_spans and skill_spans:
+            if offsets is None:
+                offsets = NormalizedText(jd_text)
+            line_starts = [start for start, _ in line_spans]
+            for start, end, skill in skill_spans:
+                src_start = offsets.to_source(start)
+                i = bisect_right(line_starts, src_start) - 1
+                if i >= 0 and offsets.to_source(end - 1) < line_spans[i][1]:
+                    per_line[i].add(skill)
+
+    return lines, tuple(frozenset(skills) for skills in per_line)
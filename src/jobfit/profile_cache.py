@@ -0,0 +1,260 @@
+# src/jobfit/profile_cache.py
+
+from __future__ import annotations
+
+import os
+import struct
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+from dataclasses import replace
+from pathlib import Path
+
+from jobfit.extract.education import extract_education_block
+from jobfit.extract.patterns import DEGREE_LEVELS
+from jobfit.ingest.cache import content_hash
+from jobfit.preprocess.normalize import normalize_text
+from jobfit.profile import DocumentProfile, hash_normalized, profile_jd, profile_resume, requirement_skills
+from jobfit.result_cache import CacheStats
+from jobfit.taxonomy import Taxonomy, get_taxonomy
+
+PROFILE_FORMAT_VERSION = 2
+FILE_MAGIC = b"JFPC"
+
+KINDS = ("resume", "jd")
+DEGREES = (None, *DEGREE_LEVELS)
+YEARS_NONE, YEARS_INT, YEARS_FLOAT = 0, 1, 2
+
+# kind, degree, years type, has requirements, years,
+# then counts of skills, majors, skill spans and requirement lines.
+_PROFILE = struct.Struct("<BBBBdHHII")
+_FILE_HEADER = struct.Struct("<4sHI")
+# kind, taxonomy version (8 bytes), text digest (32 bytes), payload length
+_RECORD = struct.Struct("<B8s32sI")
+
+
+def _pack(typecode: str, values) -> bytes:
+    a = array(typecode, values)
+    if sys.byteorder == "big":
+        a.byteswap()
+    return a.tobytes()
+
+
+def _unpack(typecode: str, data: bytes, offset: int, count: int) -> tuple[array, int]:
+    a = array(typecode)
+    end = offset + count * a.itemsize
+    a.frombytes(data[offset:end])
+    if sys.byteorder == "big":
+        a.byteswap()
+    return a, end
+
+
+def encode_profile(profile: DocumentProfile, taxonomy: Taxonomy) -> bytes:
+    """
+    Pack a profile into bytes: skills and majors as their dense taxonomy ids
+    (uint16), skill spans as (uint32 start, uint16 length, uint16 id) and
+    requirement lines as uint32 offsets.
+
+    The text itself is not stored. decode_profile() is given the text again
+    (the cache key is its hash) and recomputes `norm` and the education block.
+    """
+    skill_ids = taxonomy.skill_ids
+    major_ids = taxonomy.major_ids
+
+    years = profile.years
+    if years is None:
+        years_type, years = YEARS_NONE, 0.0
+    elif isinstance(years, int):
+        years_type = YEARS_INT
+    else:
+        years_type = YEARS_FLOAT
+
+    lines = profile.requirement_lines
+    parts = [
+        _PROFILE.pack(
+            KINDS.index(profile.kind),
+            DEGREES.index(profile.degree),
+            years_type,
+            lines is not None,
+            float(years),
+            len(profile.skills),
+            len(profile.majors),
+            len(profile.skill_spans),
+            len(lines or ()),
+        ),
+        _pack("H", sorted(skill_ids[s] for s in profile.skills)),
+        _pack("H", sorted(major_ids[m] for m in profile.majors)),
+        _pack("I", (start for start, _, _ in profile.skill_spans)),
+        _pack("H", (v for start, end, skill in profile.skill_spans for v in (end - start, skill_ids[skill]))),
+    ]
+
+    if lines is not None:
+        offsets = []
+        pos = 0
+        for line in lines:
+            # Requirement lines are slices of the text, in order.
+            pos = profile.text.index(line, pos)
+            offsets += (pos, pos + len(line))
+        parts.append(_pack("I", offsets))
+        parts.append(_pack("H", (len(skills) for skills in profile.requirement_skills)))
+        parts.append(_pack("H", (skill_ids[s] for skills in profile.requirement_skills for s in sorted(skills))))
+
+    return b"".join(parts)
+
+
+def decode_profile(data: bytes, text: str, taxonomy: Taxonomy) -> DocumentProfile:
+    """Rebuild the profile of `text` from encode_profile() output."""
+    kind, degree, years_type, has_lines, years, n_skills, n_majors, n_spans, n_lines = _PROFILE.unpack_from(data)
+    pos = _PROFILE.size
+    skills, pos = _unpack("H", data, pos, n_skills)
+    majors, pos = _unpack("H", data, pos, n_majors)
+    span_starts, pos = _unpack("I", data, pos, n_spans)
+    span_rest, pos = _unpack("H", data, pos, 2 * n_spans)
+
+    names = taxonomy.skill_names
+    requirement_lines = requirement_skills = None
+    if has_lines:
+        offsets, pos = _unpack("I", data, pos, 2 * n_lines)
+        counts, pos = _unpack("H", data, pos, n_lines)
+        ids, pos = _unpack("H", data, pos, sum(counts))
+        requirement_lines = tuple(text[offsets[i] : offsets[i + 1]] for i in range(0, len(offsets), 2))
+        per_line = []
+        start = 0
+        for count in counts:
+            per_line.append(frozenset(names[i] for i in ids[start : start + count]))
+            start += count
+        requirement_skills = tuple(per_line)
+
+    norm = normalize_text(text)
+    return DocumentProfile(
+        kind=KINDS[kind],
+        text=text,
+        norm=norm,
+        skills=frozenset(names[i] for i in skills),
+        degree=DEGREES[degree],
+        majors=frozenset(taxonomy.major_names[i] for i in majors),
+        years=None if years_type == YEARS_NONE else int(years) if years_type == YEARS_INT else years,
+        edu_block=extract_education_block(text) if KINDS[kind] == "resume" else "",
+        norm_hash=hash_normalized(norm),
+        skill_spans=tuple(
+            (start, start + span_rest[2 * i], names[span_rest[2 * i + 1]]) for i, start in enumerate(span_starts)
+        ),
+        requirement_lines=requirement_lines,
+        requirement_skills=requirement_skills,
+    )
+
+
+class ProfileCache:
+    """
+    Bounded LRU of document profiles, keyed by (kind, taxonomy version,
+    hash of the text), so each resume or JD is extracted once however many
+    documents it is paired with.
+
+    save() writes every entry in the encode_profile() format. Entries read
+    back by load() stay encoded until their text is looked up again.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._entries: OrderedDict[tuple[str, str, str], DocumentProfile | bytes] = OrderedDict()
+        self._taxonomies: dict[str, Taxonomy] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(kind: str, text: str, taxonomy: Taxonomy) -> tuple[str, str, str]:
+        return kind, taxonomy.version, content_hash(text.encode("utf-8", "surrogatepass"))
+
+    def _get(self, key, text: str, taxonomy: Taxonomy) -> DocumentProfile | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+        if isinstance(value, bytes):
+            value = decode_profile(value, text, taxonomy)
+            with self._lock:
+                if key in self._entries:
+                    self._entries[key] = value
+        return value
+
+    def _put(self, key, profile: DocumentProfile, taxonomy: Taxonomy) -> None:
+        with self._lock:
+            self._taxonomies[taxonomy.version] = taxonomy
+            self._entries[key] = profile
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def profile_resume(self, resume_text: str, taxonomy: Taxonomy | None = None) -> DocumentProfile:
+        if taxonomy is None:
+            taxonomy = get_taxonomy()
+        key = self._key("resume", resume_text, taxonomy)
+        profile = self._get(key, resume_text, taxonomy)
+        if profile is None:
+            profile = profile_resume(resume_text, taxonomy)
+            self._put(key, profile, taxonomy)
+        return profile
+
+    def profile_jd(
+        self,
+        jd_text: str,
+        taxonomy: Taxonomy | None = None,
+        requirements: bool = True,
+    ) -> DocumentProfile:
+        """Cached profile_jd(); a cached profile without requirement lines is completed on demand."""
+        if taxonomy is None:
+            taxonomy = get_taxonomy()
+        key = self._key("jd", jd_text, taxonomy)
+        profile = self._get(key, jd_text, taxonomy)
+        if profile is None:
+            profile = profile_jd(jd_text, taxonomy, requirements)
+            self._put(key, profile, taxonomy)
+        elif requirements and profile.requirement_lines is None:
+            lines, line_skills = requirement_skills(jd_text, profile.skill_spans)
+            profile = replace(profile, requirement_lines=lines, requirement_skills=line_skills)
+            self._put(key, profile, taxonomy)
+        return profile
+
+    def save(self, path: Path | str) -> None:
+        path = Path(path)
+        with self._lock:
+            entries = list(self._entries.items())
+            taxonomies = dict(self._taxonomies)
+
+        parts = [_FILE_HEADER.pack(FILE_MAGIC, PROFILE_FORMAT_VERSION, len(entries))]
+        for (kind, version, digest), value in entries:
+            if not isinstance(value, bytes):
+                value = encode_profile(value, taxonomies[version])
+            parts.append(_RECORD.pack(KINDS.index(kind), bytes.fromhex(version), bytes.fromhex(digest), len(value)))
+            parts.append(value)
+
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_bytes(b"".join(parts))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path | str, max_entries: int = 4096) -> "ProfileCache":
+        data = Path(path).read_bytes()
+        magic, fmt, count = _FILE_HEADER.unpack_from(data)
+        if magic != FILE_MAGIC or fmt != PROFILE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported profile cache format in {path}")
+
+        cache = cls(max_entries=max_entries)
+        pos = _FILE_HEADER.size
+        for _ in range(count):
+            kind, version, digest, size = _RECORD.unpack_from(data, pos)
+            pos += _RECORD.size
+            cache._entries[(KINDS[kind], version.hex(), digest.hex())] = data[pos : pos + size]
+            pos += size
+        # Records are saved oldest first, so the most recent ones survive.
+        while len(cache._entries) > max_entries:
+            cache._entries.popitem(last=False)
+        return cache
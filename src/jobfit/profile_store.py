@@ -0,0 +1,266 @@
+# src/jobfit/profile_store.py
+"""
+Columnar, memory-mapped store of resume scoring inputs.
+
+A store file is a fixed-width header followed by one column per field,
+each starting on a 64-byte boundary:
+
+    skills   (n, skill_words) uint64   bitsets over the taxonomy's dense skill ids
+    majors   (n, major_words) uint64   bitsets over the dense major ids
+    years    (n,)             float32  estimated years (whole numbers, so exact)
+    degree   (n,)             uint8    DEGREE_CODES value
+    offsets  (n + 1,)         uint64   end of each key in the key blob
+    keys                      bytes    UTF-8 keys, back to back
+
+Everything is little-endian. ProfileStore maps the file read-only and the
+columns are numpy views on the mapping, so opening a store of any size
+only reads the header, pages are loaded as they are first touched, and
+every process that opens the same file shares them through the page cache.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from jobfit.profile import CompactProfile, DocumentProfile, compact_profile
+from jobfit.score.vectorized import CandidateMatrix, _popcount_rows
+from jobfit.taxonomy import Taxonomy, get_taxonomy
+
+STORE_FORMAT_VERSION = 1
+STORE_MAGIC = b"JFPS"
+HEADER_SIZE = 128
+ALIGN = 64
+
+# magic, format, taxonomy version (8 bytes), profiles, skill words, major words,
+# then the byte offsets of the skills, majors, years, degree, offsets and keys sections.
+_HEADER = struct.Struct("<4sH8sQII6Q")
+_COLUMNS = ("skills", "majors", "years", "degree", "offsets", "keys")
+
+
+def _aligned(pos: int) -> int:
+    return -(-pos // ALIGN) * ALIGN
+
+
+def _little_endian(a: array) -> bytes:
+    if sys.byteorder == "big":
+        a.byteswap()
+    return a.tobytes()
+
+
+def write_profile_store(
+    path: Path | str,
+    items: Iterable[tuple[str, DocumentProfile | CompactProfile]],
+    taxonomy: Taxonomy | None = None,
+    chunk_size: int = 65536,
+) -> int:
+    """
+    Write (key, profile) pairs to a new store at `path`; returns how many.
+
+    Profiles can be DocumentProfiles or CompactProfiles built with the same
+    taxonomy. Items are consumed in chunks and each column is spilled to a
+    temporary file next to `path`, so memory use does not grow with the
+    number of profiles. The store replaces `path` atomically.
+    """
+    if taxonomy is None:
+        taxonomy = get_taxonomy()
+    path = Path(path)
+    skill_words = max(1, -(-len(taxonomy.skill_names) // 64))
+    major_words = max(1, -(-len(taxonomy.major_names) // 64))
+
+    with tempfile.TemporaryDirectory(dir=path.parent, prefix=f".{path.name}.") as spill:
+        columns = {name: open(Path(spill, name), "w+b") for name in _COLUMNS}
+        try:
+            n = 0
+            key_end = 0
+            columns["offsets"].write(_little_endian(array("Q", [0])))
+            chunk: list[tuple[str, CompactProfile]] = []
+            for key, profile in items:
+                if isinstance(profile, DocumentProfile):
+                    profile = compact_profile(profile, taxonomy)
+                chunk.append((key, profile))
+                if len(chunk) == chunk_size:
+                    key_end = _write_chunk(columns, chunk, skill_words, major_words, key_end)
+                    n += len(chunk)
+                    chunk = []
+            if chunk:
+                _write_chunk(columns, chunk, skill_words, major_words, key_end)
+                n += len(chunk)
+
+            offsets = {}
+            pos = HEADER_SIZE
+            for name in _COLUMNS:
+                pos = offsets[name] = _aligned(pos)
+                pos += columns[name].tell()
+
+            # Assembled inside the spill directory, so a failed write leaves nothing behind.
+            tmp = Path(spill, "store")
+            with open(tmp, "wb") as out:
+                out.write(
+                    _HEADER.pack(
+                        STORE_MAGIC, STORE_FORMAT_VERSION, bytes.fromhex(taxonomy.version), n,
+                        skill_words, major_words, *(offsets[name] for name in _COLUMNS),
+                    ).ljust(HEADER_SIZE, b"\0")
+                )
+                for name in _COLUMNS:
+                    out.write(b"\0" * (offsets[name] - out.tell()))
+                    column = columns[name]
+                    column.seek(0)
+                    while block := column.read(1 << 20):
+                        out.write(block)
+        finally:
+            for column in columns.values():
+                column.close()
+        os.replace(tmp, path)
+    return n
+
+
+def _write_chunk(columns, chunk, skill_words: int, major_words: int, key_end: int) -> int:
+    years = [float(p.years or 0.0) for _, p in chunk]
+    years32 = array("f", years)
+    if years32.tolist() != years:
+        raise ValueError("profile years must be exact in float32 (whole numbers of years)")
+
+    keys = [key.encode("utf-8") for key, _ in chunk]
+    ends = array("Q")
+    for key in keys:
+        key_end += len(key)
+        ends.append(key_end)
+
+    columns["skills"].write(b"".join(p.skills.to_bytes(8 * skill_words, "little") for _, p in chunk))
+    columns["majors"].write(b"".join(p.majors.to_bytes(8 * major_words, "little") for _, p in chunk))
+    columns["years"].write(_little_endian(years32))
+    columns["degree"].write(bytes(p.degree for _, p in chunk))
+    columns["offsets"].write(_little_endian(ends))
+    columns["keys"].write(b"".join(keys))
+    return key_end
+
+
+class ProfileStore:
+    """
+    A store written by write_profile_store(), memory-mapped read-only.
+
+    `skills`, `majors`, `years` and `degree` are numpy views on the mapping
+    (nothing is copied); candidates() slices them into a CandidateMatrix for
+    VectorScorer. Close the store (or use it as a context manager) when done;
+    views handed out before that stay valid until they are dropped.
+    """
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            header = f.read(HEADER_SIZE)
+            if len(header) < _HEADER.size or header[:4] != STORE_MAGIC:
+                raise ValueError(f"Not a profile store: {path}")
+            magic, fmt, version, n, skill_words, major_words, *offsets = _HEADER.unpack_from(header)
+            if fmt != STORE_FORMAT_VERSION:
+                raise ValueError(f"Unsupported profile store format in {path}: {fmt}")
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self.taxonomy_version = version.hex()
+        offsets = dict(zip(_COLUMNS, offsets))
+        sizes = {
+            "skills": 8 * n * skill_words, "majors": 8 * n * major_words,
+            "years": 4 * n, "degree": n, "offsets": 8 * (n + 1),
+        }
+        # Every column has to end before the next one starts, and the key blob
+        # (whose length is only known from the offsets column) at the end of the file.
+        bounds = [offsets[name] for name in _COLUMNS] + [len(self._mmap)]
+        if any(offsets[name] + sizes[name] > nxt for name, nxt in zip(_COLUMNS, bounds[1:]) if name in sizes):
+            self._mmap.close()
+            raise ValueError(f"Truncated or inconsistent profile store: {path}")
+
+        def column(name: str, dtype: str, count: int) -> np.ndarray:
+            return np.frombuffer(self._mmap, dtype=dtype, count=count, offset=offsets[name])
+
+        self.skills = column("skills", "<u8", n * skill_words).reshape(n, skill_words)
+        self.majors = column("majors", "<u8", n * major_words).reshape(n, major_words)
+        self.years = column("years", "<f4", n)
+        self.degree = column("degree", "u1", n)
+        self._key_ends = column("offsets", "<u8", n + 1)
+        self._keys_offset = offsets["keys"]
+        if self._keys_offset + int(self._key_ends[-1]) != len(self._mmap):
+            self.close()
+            raise ValueError(f"Truncated or inconsistent profile store: {path}")
+        self._index: dict[str, int] | None = None
+
+    def __len__(self) -> int:
+        return len(self.degree)
+
+    def __enter__(self) -> "ProfileStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Drop the column views and unmap the file. Matrices from candidates()
+        and iter_candidates() are views on the mapping as well; while one is
+        still alive the file stays mapped, and it is unmapped once the last
+        of them is garbage collected.
+        """
+        self.skills = self.majors = self.years = self.degree = self._key_ends = None
+        try:
+            self._mmap.close()
+        except BufferError:  # views still exported
+            pass
+
+    def key(self, i: int) -> str:
+        start, end = self._key_ends[i : i + 2].tolist()
+        base = self._keys_offset
+        return self._mmap[base + start : base + end].decode("utf-8")
+
+    def keys(self) -> Iterator[str]:
+        for i in range(len(self)):
+            yield self.key(i)
+
+    def index_of(self, key: str) -> int:
+        """Row of `key`; the key table is read into a dict on first use."""
+        if self._index is None:
+            self._index = {key: i for i, key in enumerate(self.keys())}
+        return self._index[key]
+
+    def compact(self, i: int) -> CompactProfile:
+        """Row i as a CompactProfile, e.g. for score_compact()."""
+        return CompactProfile(
+            skills=int.from_bytes(self.skills[i].tobytes(), "little"),
+            majors=int.from_bytes(self.majors[i].tobytes(), "little"),
+            degree=int(self.degree[i]),
+            years=float(self.years[i]),
+        )
+
+    def skill_counts(self, skills: int, chunk_size: int = 65536) -> np.ndarray:
+        """How many of the skills in the bitset `skills` each row has, as int64."""
+        row = np.frombuffer(skills.to_bytes(8 * self.skills.shape[1], "little"), dtype="<u8")
+        counts = np.empty(len(self), dtype=np.int64)
+        for start in range(0, len(self), chunk_size):
+            counts[start : start + chunk_size] = _popcount_rows(self.skills[start : start + chunk_size] & row)
+        return counts
+
+    def candidates(self, start: int = 0, stop: int | None = None) -> CandidateMatrix:
+        """
+        Rows [start, stop) for VectorScorer.score(). Bitsets and degrees are
+        views on the mapping; years are widened to float64 (a copy) so the
+        points are the same as for in-memory profiles.
+        """
+        rows = slice(start, stop)
+        return CandidateMatrix(
+            skills=self.skills[rows],
+            majors=self.majors[rows],
+            degree=self.degree[rows],
+            years=self.years[rows].astype(np.float64),
+        )
+
+    def iter_candidates(self, chunk_size: int = 65536) -> Iterator[tuple[int, CandidateMatrix]]:
+        """(first row, CandidateMatrix) for consecutive chunks of the store."""
+        for start in range(0, len(self), chunk_size):
+            yield start, self.candidates(start, start + chunk_size)
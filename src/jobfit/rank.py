@@ -0,0 +1,179 @@
+# src/jobfit/rank.py
+"""
+Top-k candidates for a job description without scoring every candidate.
+
+Skills points only depend on how many of the JD's skills a candidate has,
+and that count is cheap to get (posting lists, set sizes, bitset
+popcounts). Adding the most education and experience points anyone can
+get gives an upper bound on each candidate's total. Candidates are visited
+from the highest bound down while the best k so far sit in a min-heap; as
+soon as the k-th best total beats every remaining bound, the rest of the
+corpus is never scored.
+
+The result is the same as scoring everyone and taking heapq.nlargest():
+best total first, ties in corpus order.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, TypeVar
+
+from jobfit.analyze import EDUCATION_MAX, EXPERIENCE_MAX, SKILLS_MAX, PairScore, score_compact
+from jobfit.profile import CompactProfile, DocumentProfile, compact_profile
+from jobfit.score.scoring import skills_points_from_count
+from jobfit.taxonomy import Taxonomy, get_taxonomy
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True)
+class RankedCandidate:
+    key: str
+    score: PairScore
+
+
+@dataclass
+class RankStats:
+    """How many candidates a ranking looked at and how many it fully scored."""
+
+    candidates: int = 0
+    scored: int = 0
+
+    @property
+    def pruned(self) -> int:
+        return self.candidates - self.scored
+
+
+def top_k(
+    ordered: Iterable[tuple[int, int]],
+    k: int,
+    score: Callable[[int], tuple[int, T]],
+    stats: RankStats | None = None,
+) -> list[tuple[int, T]]:
+    """
+    The k best candidates as (position, value), best first.
+
+    `ordered` yields (upper bound on the total, position) with the highest
+    bound first and, within one bound, positions in increasing order.
+    `score(position)` returns (total, value) and is only called while the
+    candidate could still make the top k; ties go to the lower position.
+    """
+    if k <= 0:
+        return []
+    heap: list[tuple[int, int, T]] = []  # (total, -position, value); heap[0] is the k-th best
+    scored = 0
+    for bound, position in ordered:
+        if len(heap) == k:
+            worst_total, worst_neg_position, _ = heap[0]
+            if bound < worst_total:
+                break
+            if bound == worst_total and -position < worst_neg_position:
+                continue
+        total, value = score(position)
+        scored += 1
+        entry = (total, -position, value)
+        if len(heap) < k:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+    if stats is not None:
+        stats.scored += scored
+
+    heap.sort(key=lambda entry: entry[:2], reverse=True)
+    return [(-neg_position, value) for _, neg_position, value in heap]
+
+
+def _by_count(counts: list[int], n_jd_skills: int, bonus: int) -> Iterator[tuple[int, int]]:
+    """(upper bound, position) from per-candidate skill counts, highest bound first."""
+    buckets: list[list[int]] = [[] for _ in range(n_jd_skills + 1)]
+    for position, count in enumerate(counts):
+        buckets[count].append(position)
+    for count in range(n_jd_skills, -1, -1):
+        bound = skills_points_from_count(count, n_jd_skills, SKILLS_MAX) + bonus
+        for position in buckets[count]:
+            yield bound, position
+
+
+def _by_store_count(counts, n_jd_skills: int, bonus: int) -> Iterator[tuple[int, int]]:
+    """_by_count() for a numpy array of counts; each count's rows are found only once reached."""
+    import numpy as np
+
+    for count in range(n_jd_skills, -1, -1):
+        bound = skills_points_from_count(count, n_jd_skills, SKILLS_MAX) + bonus
+        for position in np.flatnonzero(counts == count).tolist():
+            yield bound, position
+
+
+def rank(
+    jd: DocumentProfile | str,
+    corpus,
+    k: int = 10,
+    taxonomy: Taxonomy | None = None,
+    stats: RankStats | None = None,
+) -> list[RankedCandidate]:
+    """
+    The k best candidates of `corpus` for `jd` (a profile or JD text), best first.
+
+    `corpus` is a mapping of key to DocumentProfile or CompactProfile, a
+    ProfileStore (see jobfit.profile_store) or a SkillIndex. Scores are the
+    "score" section analyze() would give each pair. Pass a RankStats to see
+    how many candidates were actually scored.
+    """
+    if taxonomy is None:
+        taxonomy = get_taxonomy()
+    if isinstance(jd, str):
+        from jobfit.profile import profile_jd
+
+        jd = profile_jd(jd, taxonomy, requirements=False)
+    if stats is None:
+        stats = RankStats()
+    jd_compact = compact_profile(jd, taxonomy)
+    bonus = EDUCATION_MAX + EXPERIENCE_MAX
+
+    if isinstance(corpus, Mapping):
+        keys = list(corpus)
+        profiles = list(corpus.values())
+        counts = [
+            (p.skills & jd_compact.skills).bit_count() if isinstance(p, CompactProfile) else len(p.skills & jd.skills)
+            for p in profiles
+        ]
+
+        def score(position: int) -> tuple[int, PairScore]:
+            profile = profiles[position]
+            if not isinstance(profile, CompactProfile):
+                profile = compact_profile(profile, taxonomy)
+            s = score_compact(profile, jd_compact)
+            return s.total_points, s
+
+        stats.candidates += len(keys)
+        ordered = _by_count(counts, jd_compact.n_skills, bonus)
+        return [RankedCandidate(keys[i], s) for i, s in top_k(ordered, k, score, stats)]
+
+    from jobfit.index import SkillIndex
+
+    if isinstance(corpus, SkillIndex):
+        return [
+            RankedCandidate(m.key, PairScore(m.skills_points, m.education_points, m.experience_points))
+            for m in corpus.query(jd, k, stats=stats)
+        ]
+
+    from jobfit.profile_store import ProfileStore
+
+    if isinstance(corpus, ProfileStore):
+        if corpus.taxonomy_version != taxonomy.version:
+            raise ValueError(
+                f"store was built with taxonomy {corpus.taxonomy_version}, not {taxonomy.version}; rebuild it"
+            )
+        stats.candidates += len(corpus)
+
+        def score_row(position: int) -> tuple[int, PairScore]:
+            s = score_compact(corpus.compact(position), jd_compact)
+            return s.total_points, s
+
+        ordered = _by_store_count(corpus.skill_counts(jd_compact.skills), jd_compact.n_skills, bonus)
+        return [RankedCandidate(corpus.key(i), s) for i, s in top_k(ordered, k, score_row, stats)]
+
+    raise TypeError(f"cannot rank a {type(corpus).__name__}")
@@ -0,0 +1,47 @@
+# src/jobfit/report.py
+
+from __future__ import annotations
+
+
+def render_report(result: dict, resume_chars: int, jd_chars: int) -> str:
+    """
+    The text report printed by `jobfit --resume ... --jd ...` for an analyze()
+    result. Shared with the daemon (see jobfit.client), so both print the same.
+    """
+    lines = [
+        "Loaded inputs successfully.",
+        f"Resume characters: {resume_chars}",
+        f"Job description characters: {jd_chars}",
+        "",
+        "--- Preview BEFORE normalize (first 120 chars) ---",
+        f"RESUME: {result['previews']['resume_before']}",
+        f"JD: {result['previews']['jd_before']}",
+        "",
+        "--- Preview AFTER normalize (first 120 chars) ---",
+        f"RESUME: {result['previews']['resume_after']}",
+        f"JD: {result['previews']['jd_after']}",
+        "",
+        "--- Skill Matching ---",
+        f"Resume skills: {result['skills']['resume_skills']}",
+        f"JD skills: {result['skills']['jd_skills']}",
+        f"Matched skills: {result['skills']['matched']}",
+        f"Missing skills: {result['skills']['missing']}",
+        "",
+        "--- Score ---",
+    ]
+    s = result["score"]
+    lines.append(f"Skills score: {s['skills_points']}/{s['skills_max']}")
+    lines.append(f"Total score: {s['total_points']}/{s['total_max']} ({s['note']})")
+
+    lines += ["", "--- Requirement coverage (skills-based) ---"]
+    cov = result["requirements"]["coverage"]
+    if not cov:
+        lines.append("No requirement lines matched to known skills yet.")
+    else:
+        for item in cov[:10]:
+            lines.append(f"- {item['line']}")
+            if item["matched"]:
+                lines.append(f"  matched: {item['matched']}")
+            if item["missing"]:
+                lines.append(f"  missing: {item['missing']}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,199 @@
+# src/jobfit/result_cache.py
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Protocol
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResultCache(Protocol):
+    """Anything analyze(cache=...) can read and write results through."""
+
+    stats: CacheStats
+
+    def get(self, key: str) -> dict | None: ...
+
+    def put(self, key: str, result: dict) -> None: ...
+
+
+def result_key(
+    resume_text: str,
+    jd_text: str,
+    sections,
+    taxonomy_version: str,
+    weights: dict[str, int],
+) -> str:
+    """
+    Cache key for one analyze() call.
+
+    The texts are hashed as given (not normalized): degree, years and the
+    previews are read from the raw text, so two documents with the same
+    normalized form can still produce different results.
+    """
+    h = hashlib.sha256()
+    for part in (
+        resume_text.encode("utf-8", "surrogatepass"),
+        jd_text.encode("utf-8", "surrogatepass"),
+        ",".join(sorted(sections)).encode("ascii"),
+        taxonomy_version.encode("ascii"),
+        json.dumps(weights, sort_keys=True).encode("ascii"),
+    ):
+        # Length-prefix every part so no two inputs share a byte stream.
+        h.update(len(part).to_bytes(8, "little"))
+        h.update(part)
+    return h.hexdigest()
+
+
+class MemoryResultCache:
+    """
+    In-process LRU of up to `max_entries` results.
+
+    Results are kept as JSON and decoded on every hit, so callers never share
+    (and cannot corrupt) a cached dict.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            raw = self._entries.get(key)
+            if raw is None:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+        return json.loads(raw)
+
+    def put(self, key: str, result: dict) -> None:
+        raw = json.dumps(result)
+        with self._lock:
+            self._entries[key] = raw
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+
+class SqliteResultCache:
+    """
+    On-disk result cache in a single SQLite file, shared across runs and
+    processes. Hits refresh an entry's last-used time; writes evict the least
+    recently used entries once there are more than `max_entries` (counted
+    per connection, so the limit is approximate with several writers).
+    """
+
+    def __init__(self, path: Path | str, max_entries: int = 100_000):
+        import sqlite3  # only needed once a disk cache is used; keeps `import jobfit.analyze` light
+
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, result TEXT NOT NULL, used INTEGER NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS results_used ON results (used)")
+        (self._count,) = self._db.execute("SELECT COUNT(*) FROM results").fetchone()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        self._db.close()
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            row = self._db.execute("SELECT result FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+            self._db.execute("UPDATE results SET used = ? WHERE key = ?", (time.time_ns(), key))
+            self.stats.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, result: dict) -> None:
+        raw = json.dumps(result)
+        with self._lock:
+            db = self._db
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                cur = db.execute(
+                    "INSERT OR IGNORE INTO results (key, result, used) VALUES (?, ?, ?)",
+                    (key, raw, time.time_ns()),
+                )
+                if cur.rowcount:
+                    self._count += 1
+                else:
+                    db.execute("UPDATE results SET result = ?, used = ? WHERE key = ?", (raw, time.time_ns(), key))
+
+                excess = self._count - self.max_entries
+                if excess > 0:
+                    cur = db.execute(
+                        "DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY used LIMIT ?)",
+                        (excess,),
+                    )
+                    self._count -= cur.rowcount
+                    self.stats.evictions += cur.rowcount
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+
+
+class TieredResultCache:
+    """
+    Memory LRU in front of a slower (usually on-disk) cache. Disk hits are
+    copied into memory; writes go to both. `stats` counts hits and misses of
+    the whole tier; evictions are counted by each backend.
+    """
+
+    def __init__(self, memory: ResultCache, disk: ResultCache):
+        self.memory = memory
+        self.disk = disk
+        self.stats = CacheStats()
+
+    def get(self, key: str) -> dict | None:
+        result = self.memory.get(key)
+        if result is None:
+            result = self.disk.get(key)
+            if result is not None:
+                self.memory.put(key, result)
+        if result is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return result
+
+    def put(self, key: str, result: dict) -> None:
+        self.memory.put(key, result)
+        self.disk.put(key, result)
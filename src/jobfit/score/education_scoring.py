@@ -1,6 +1,11 @@
 from __future__ import annotations
 
 
+def education_points_from_matches(degree_ok: bool, major_ok: bool, max_points: int = 15) -> int:
+    """score_education()["education_total"] when only whether each rule is met is known."""
+    return min((10 if degree_ok else 0) + (5 if major_ok else 0), max_points)
+
+
 def score_education(
     jd_degree: str | None,
     resume_degree: str | None,
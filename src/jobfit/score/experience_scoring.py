@@ -1,6 +1,17 @@
 from __future__ import annotations
 
 
+def experience_points_from_years(
+    jd_years_required: int | None,
+    resume_years_estimate: float,
+    max_points: int = 35,
+) -> int:
+    """score_experience()["experience_total"] without the explanation payload."""
+    if jd_years_required is None or jd_years_required <= 0:
+        return max_points
+    return round(max_points * min(1.0, resume_years_estimate / jd_years_required))
+
+
 def score_experience(
     jd_years_required: int | None,
     resume_years_estimate: float,
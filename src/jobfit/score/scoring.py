@@ -1,8 +1,16 @@
 from __future__ import annotations
 
+
+def skills_points_from_count(matched: int, jd_total: int, max_points: int = 50) -> int:
+    """score_skills() when only the number of matched JD skills is known."""
+    if not jd_total:
+        return 0
+    coverage = matched / jd_total
+    return round(max_points * coverage)
+
+
 def score_skills(jd_skills: set[str], resume_skills: set[str], max_points: int = 50) -> int:
     if not jd_skills:
         return 0
     matched = jd_skills & resume_skills
-    coverage = len(matched) / len(jd_skills)
-    return round(max_points * coverage)
+    return skills_points_from_count(len(matched), len(jd_skills), max_points)
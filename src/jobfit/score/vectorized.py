@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Sequence
+
+import numpy as np
+
+from jobfit.extract.patterns import DEGREE_CODES
+from jobfit.profile import DocumentProfile
+from jobfit.taxonomy import Taxonomy, get_taxonomy
+
+
+def _popcount_rows(words: np.ndarray) -> np.ndarray:
+    """Set bits per row of a (n, w) uint64 matrix."""
+    if hasattr(np, "bitwise_count"):  # numpy >= 2.0
+        return np.bitwise_count(words).sum(axis=1, dtype=np.int64)
+    table = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+    return table[words.view(np.uint8)].sum(axis=1, dtype=np.int64)
+
+
+class BitsetEncoder:
+    """
+    Packs sets of names from a fixed vocabulary into rows of uint64 words,
+    one bit per name. Names outside the vocabulary are ignored.
+    """
+
+    def __init__(self, vocabulary: Sequence[str]):
+        self.vocabulary = tuple(vocabulary)
+        self.index = {name: i for i, name in enumerate(self.vocabulary)}
+        self.n_words = max(1, -(-len(self.vocabulary) // 64))
+
+    def encode(self, names: Iterable[str]) -> np.ndarray:
+        return self.encode_many([names])[0]
+
+    def encode_many(self, name_sets: Iterable[Iterable[str]]) -> np.ndarray:
+        rows: list[int] = []
+        cols: list[int] = []
+        n = 0
+        for n, names in enumerate(name_sets, start=1):
+            for name in names:
+                i = self.index.get(name)
+                if i is not None:
+                    rows.append(n - 1)
+                    cols.append(i)
+
+        out = np.zeros((n, self.n_words), dtype=np.uint64)
+        if cols:
+            r = np.asarray(rows, dtype=np.int64)
+            c = np.asarray(cols, dtype=np.int64)
+            np.bitwise_or.at(out, (r, c >> 6), np.left_shift(np.uint64(1), (c & 63).astype(np.uint64)))
+        return out
+
+    def decode(self, row: np.ndarray) -> set[str]:
+        bits = np.unpackbits(row.astype("<u8", copy=False).view(np.uint8), bitorder="little")
+        return {self.vocabulary[i] for i in np.flatnonzero(bits[: len(self.vocabulary)])}
+
+
+@dataclass
+class CandidateMatrix:
+    """Column-oriented scoring inputs for many resumes."""
+
+    skills: np.ndarray  # (n, skill words) uint64 bitsets
+    majors: np.ndarray  # (n, major words) uint64 bitsets
+    degree: np.ndarray  # (n,) uint8, see DEGREE_CODES
+    years: np.ndarray  # (n,) float64 resume years estimate
+
+    def __len__(self) -> int:
+        return len(self.degree)
+
+
+@dataclass
+class BatchScores:
+    skills_points: np.ndarray
+    education_points: np.ndarray
+    experience_points: np.ndarray
+    total_points: np.ndarray
+
+
+class VectorScorer:
+    """
+    Scores one JD against a CandidateMatrix with whole-array operations.
+
+    Produces exactly the points of score_skills, score_education and
+    score_experience (same float arithmetic, round-half-even like round()).
+    """
+
+    def __init__(self, taxonomy: Taxonomy | None = None):
+        if taxonomy is None:
+            taxonomy = get_taxonomy()
+        # Bit positions are the taxonomy's dense skill / major ids.
+        self.skills = BitsetEncoder(taxonomy.skill_names)
+        self.majors = BitsetEncoder(taxonomy.major_names)
+
+    def encode_profiles(self, profiles: Sequence[DocumentProfile]) -> CandidateMatrix:
+        return CandidateMatrix(
+            skills=self.skills.encode_many(p.skills for p in profiles),
+            majors=self.majors.encode_many(p.majors for p in profiles),
+            degree=np.array([DEGREE_CODES[p.degree] for p in profiles], dtype=np.uint8),
+            years=np.array([float(p.years or 0.0) for p in profiles], dtype=np.float64),
+        )
+
+    def score(
+        self,
+        jd: DocumentProfile,
+        candidates: CandidateMatrix,
+        skills_max: int = 50,
+        education_max: int = 15,
+        experience_max: int = 35,
+    ) -> BatchScores:
+        n = len(candidates)
+
+        # -------- Skills --------
+        n_jd_skills = len(jd.skills)
+        if n_jd_skills:
+            jd_row = self.skills.encode(jd.skills)
+            matched = _popcount_rows(candidates.skills & jd_row)
+            skills_points = np.rint(skills_max * (matched / n_jd_skills)).astype(np.int64)
+        else:
+            skills_points = np.zeros(n, dtype=np.int64)
+
+        # -------- Education --------
+        if jd.degree is None:
+            degree_points = np.full(n, 10, dtype=np.int64)
+        else:
+            degree_points = np.where(candidates.degree == DEGREE_CODES[jd.degree], 10, 0)
+
+        if not jd.majors:
+            major_points = np.full(n, 5, dtype=np.int64)
+        else:
+            jd_majors = self.majors.encode(jd.majors)
+            major_points = np.where((candidates.majors & jd_majors).any(axis=1), 5, 0)
+
+        education_points = np.minimum(degree_points + major_points, education_max)
+
+        # -------- Experience --------
+        if jd.years is None or jd.years <= 0:
+            experience_points = np.full(n, experience_max, dtype=np.int64)
+        else:
+            coverage = np.minimum(1.0, candidates.years / jd.years)
+            experience_points = np.rint(experience_max * coverage).astype(np.int64)
+
+        return BatchScores(
+            skills_points=skills_points,
+            education_points=education_points,
+            experience_points=experience_points,
+            total_points=skills_points + education_points + experience_points,
+        )
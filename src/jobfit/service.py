@@ -0,0 +1,458 @@
+# src/jobfit/service.py
+"""
+Small asyncio HTTP/1.1 API over the analysis pipeline (standard library only).
+
+    POST /analyze  {"resume": text | "resume_pdf": base64, "jd": text | "jd_pdf": base64,
+                    "sections": [...]}
+    POST /report   same inputs as /analyze; {"report": the text `jobfit --resume --jd` prints}
+    POST /rank     {"jd": text, "resumes": {key: text} | [text, ...], "k": 10}
+    GET  /stats    request counts, p50/p99 latency, batch sizes
+    GET  /health
+
+PDF extraction and analysis run in a process pool. Concurrent /analyze
+requests that share a JD (and sections) are collected for at least a few
+milliseconds, and for as long as every worker is busy, then sent to one
+worker call, so the JD is profiled once per batch. Workers keep a
+ProfileCache, so documents seen before are not extracted again. Every
+request has a timeout; a request that runs out gets a 504.
+
+The same service runs on a Unix domain socket (start_unix_server) as the
+daemon behind `jobfit --daemon`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import binascii
+import heapq
+import json
+import multiprocessing
+import os
+import socket
+import stat
+import time
+from collections import Counter, deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+from jobfit.analyze import resolve_sections, score_compact, score_profiles
+from jobfit.ingest.cache import TextCache
+from jobfit.ingest.pdf_extract import extract_text_from_pdf
+from jobfit.profile import compact_profile
+from jobfit.profile_cache import ProfileCache
+from jobfit.report import render_report
+from jobfit.taxonomy import get_taxonomy
+
+MAX_BODY_BYTES = 32 * 1024 * 1024
+MAX_HEADERS = 100
+MAX_HEADER_BYTES = 64 * 1024
+REASONS = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    413: "Payload Too Large", 431: "Request Header Fields Too Large", 500: "Internal Server Error", 504: "Gateway Timeout",
+}
+
+
+class HttpError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+# -------- Worker-side functions (module level so they can be pickled) --------
+# Profiles of the documents this process has seen (thread-safe, bounded).
+_profiles = ProfileCache()
+
+
+def _init_worker() -> None:
+    get_taxonomy()
+
+
+def analyze_batch(jd_text: str, resume_texts: list[str], sections) -> list[dict]:
+    """analyze() for many resumes against one JD, profiling the JD once."""
+    taxonomy = get_taxonomy()
+    sections = resolve_sections(sections)
+    jd = _profiles.profile_jd(jd_text, taxonomy, requirements="requirements" in sections)
+    return [score_profiles(_profiles.profile_resume(text, taxonomy), jd, sections) for text in resume_texts]
+
+
+def rank_chunk(jd_text: str, items: list[tuple[str, str]], k: int) -> list[tuple[str, dict]]:
+    """Top-k (key, score section) of one chunk of resumes, best first."""
+    taxonomy = get_taxonomy()
+    jd = compact_profile(_profiles.profile_jd(jd_text, taxonomy, requirements=False), taxonomy)
+    scored = (
+        (key, score_compact(compact_profile(_profiles.profile_resume(text, taxonomy), taxonomy), jd))
+        for key, text in items
+    )
+    return [(key, s.to_dict()) for key, s in heapq.nlargest(k, scored, key=lambda row: row[1].total_points)]
+
+
+# -------- Service --------
+class LatencyStats:
+    """Request counts and latency percentiles over the most recent requests per endpoint."""
+
+    def __init__(self, window: int = 10_000):
+        self.window = window
+        self._samples: dict[str, deque] = {}
+        self._counts: dict[str, int] = {}
+
+    def record(self, endpoint: str, seconds: float) -> None:
+        self._samples.setdefault(endpoint, deque(maxlen=self.window)).append(seconds)
+        self._counts[endpoint] = self._counts.get(endpoint, 0) + 1
+
+    def summary(self) -> dict:
+        out = {}
+        for endpoint, samples in sorted(self._samples.items()):
+            ordered = sorted(samples)
+            out[endpoint] = {
+                "count": self._counts[endpoint],
+                "p50_ms": round(_percentile(ordered, 50) * 1000, 3),
+                "p99_ms": round(_percentile(ordered, 99) * 1000, 3),
+            }
+        return out
+
+
+def _percentile(ordered: list[float], p: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    rank = max(1, -(-len(ordered) * p // 100))
+    return ordered[int(rank) - 1]
+
+
+class ScoringService:
+    """
+    Request handling, batching and worker dispatch, independent of the
+    transport. `executor` defaults to a process pool of `workers` processes;
+    at most `workers` /analyze batches are in flight at a time. PDFs are
+    looked up in `pdf_cache` (if given) before they are parsed.
+    """
+
+    def __init__(
+        self,
+        workers: int = 1,
+        timeout: float = 30.0,
+        batch_window: float = 0.002,
+        max_batch: int = 32,
+        rank_chunk_size: int = 256,
+        executor: Executor | None = None,
+        pdf_cache: TextCache | None = None,
+    ):
+        self.workers = workers
+        self.pdf_cache = pdf_cache
+        self.timeout = timeout
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.rank_chunk_size = rank_chunk_size
+        self._owns_executor = executor is None
+        # Workers start on demand, while connections are open; forked ones would
+        # inherit those sockets and hold them open after the server closes them.
+        self.executor = executor or ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+        self.latency = LatencyStats()
+        self.statuses: Counter = Counter()
+        self.batches = 0
+        self.batched_requests = 0
+        self._pending: dict[tuple, list[tuple[str, asyncio.Future]]] = {}
+        self._due: dict[tuple, None] = {}  # insertion-ordered set of keys ready to send
+        self._in_flight = 0
+
+    def close(self) -> None:
+        if self._owns_executor:
+            self.executor.shutdown(cancel_futures=True)
+
+    def stats(self) -> dict:
+        return {
+            "latency": self.latency.summary(),
+            "statuses": {str(status): n for status, n in sorted(self.statuses.items())},
+            "batches": self.batches,
+            "mean_batch_size": round(self.batched_requests / self.batches, 2) if self.batches else 0.0,
+        }
+
+    async def _run(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+
+    # -------- Dispatch --------
+    async def dispatch(self, method: str, path: str, body: bytes) -> tuple[int, object]:
+        if path == "/health":
+            return 200, {"status": "ok"}
+        if path == "/stats":
+            return 200, self.stats()
+        handler = {"/analyze": self.analyze, "/report": self.report, "/rank": self.rank}.get(path)
+        if handler is None:
+            return 404, {"error": f"unknown path {path}"}
+        if method != "POST":
+            return 405, {"error": f"{path} only accepts POST"}
+
+        start = time.perf_counter()
+        try:
+            status, result = 200, await asyncio.wait_for(handler(_json_object(body)), self.timeout)
+        except asyncio.TimeoutError:
+            status, result = 504, {"error": f"timed out after {self.timeout}s"}
+        except HttpError as e:
+            status, result = e.status, {"error": str(e)}
+        except ValueError as e:
+            status, result = 400, {"error": str(e)}
+        except Exception as e:
+            status, result = 500, {"error": f"{type(e).__name__}: {e}"}
+        self.latency.record(path, time.perf_counter() - start)
+        self.statuses[status] += 1
+        return status, result
+
+    # -------- /analyze, /report --------
+    async def analyze(self, payload: dict) -> dict:
+        sections = payload.get("sections")
+        if sections is not None:
+            if not isinstance(sections, list) or not all(isinstance(name, str) for name in sections):
+                raise HttpError(400, "'sections' must be a list of section names")
+            sections = tuple(sorted(resolve_sections(sections)))
+        resume_text = await self._document(payload, "resume")
+        jd_text = await self._document(payload, "jd")
+        return await self._batched(jd_text, sections, resume_text)
+
+    async def report(self, payload: dict) -> dict:
+        resume_text = await self._document(payload, "resume")
+        jd_text = await self._document(payload, "jd")
+        result = await self._batched(jd_text, None, resume_text)
+        return {"report": render_report(result, len(resume_text), len(jd_text))}
+
+    async def _document(self, payload: dict, field: str) -> str:
+        """Text under `field`, or the text of the base64 PDF under `field`_pdf."""
+        if f"{field}_pdf" not in payload:
+            return _text_field(payload, field)
+        try:
+            data = base64.b64decode(payload[f"{field}_pdf"], validate=True)
+        except (binascii.Error, TypeError):
+            raise HttpError(400, f"'{field}_pdf' must be base64")
+        return await self._run(extract_text_from_pdf, data, self.pdf_cache)
+
+    def _batched(self, jd_text: str, sections, resume_text: str) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        key = (jd_text, sections)
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = []
+            loop.call_later(self.batch_window, self._mark_due, key)
+        batch.append((resume_text, future))
+        if len(batch) >= self.max_batch:
+            self._mark_due(key)
+        return future
+
+    def _mark_due(self, key: tuple) -> None:
+        if key in self._pending:
+            self._due[key] = None
+            self._drain()
+
+    def _drain(self) -> None:
+        """Send due batches while fewer than `workers` are in flight; the rest keep filling up."""
+        while self._due and self._in_flight < self.workers:
+            key = next(iter(self._due))
+            del self._due[key]
+            waiting = [(text, future) for text, future in self._pending.pop(key) if not future.done()]
+            batch, rest = waiting[: self.max_batch], waiting[self.max_batch :]
+            if rest:
+                self._pending[key] = rest
+                self._due[key] = None
+            if batch:
+                self._send(key, batch)
+
+    def _send(self, key: tuple, batch: list[tuple[str, asyncio.Future]]) -> None:
+        self.batches += 1
+        self.batched_requests += len(batch)
+        self._in_flight += 1
+        jd_text, sections = key
+        task = asyncio.ensure_future(self._run(analyze_batch, jd_text, [text for text, _ in batch], sections))
+
+        def deliver(task: asyncio.Future) -> None:
+            self._in_flight -= 1
+            for i, (_, future) in enumerate(batch):
+                if future.done():  # timed out / cancelled meanwhile
+                    continue
+                if task.cancelled():
+                    future.cancel()
+                elif task.exception() is not None:
+                    future.set_exception(task.exception())
+                else:
+                    future.set_result(task.result()[i])
+            self._drain()
+
+        task.add_done_callback(deliver)
+
+    # -------- /rank --------
+    async def rank(self, payload: dict) -> dict:
+        jd_text = _text_field(payload, "jd")
+        resumes = payload.get("resumes")
+        if isinstance(resumes, list):
+            items = [(str(i), text) for i, text in enumerate(resumes)]
+        elif isinstance(resumes, dict):
+            items = list(resumes.items())
+        else:
+            raise HttpError(400, "'resumes' must be a list or an object of texts")
+        if not all(isinstance(text, str) for _, text in items):
+            raise HttpError(400, "every resume must be a string")
+        k = payload.get("k", 10)
+        if type(k) is not int or k < 1:  # bool is an int subclass
+            raise HttpError(400, "'k' must be a positive integer")
+
+        size = self.rank_chunk_size
+        chunks = [items[i : i + size] for i in range(0, len(items), size)]
+        tops = await asyncio.gather(*(self._run(rank_chunk, jd_text, chunk, k) for chunk in chunks))
+        # Chunks are merged in input order, so ties keep the order resumes were given in.
+        best = heapq.nlargest(k, (row for top in tops for row in top), key=lambda row: row[1]["total_points"])
+        return {"results": [{"key": key, "score": score} for key, score in best]}
+
+    # -------- HTTP transport --------
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    request_line = await reader.readline()
+                except ValueError:  # longer than the reader's limit
+                    await _respond(writer, 400, {"error": "request line too long"}, keep_alive=False)
+                    break
+                if not request_line:
+                    break
+                parts = request_line.decode("latin-1").split()
+                if len(parts) != 3:
+                    await _respond(writer, 400, {"error": "malformed request line"}, keep_alive=False)
+                    break
+                method, target, version = parts
+
+                headers = {}
+                n_headers = header_bytes = 0
+                too_large = None
+                try:
+                    while True:
+                        line = await reader.readline()
+                        if line in (b"\r\n", b"\n", b""):
+                            break
+                        n_headers += 1
+                        header_bytes += len(line)
+                        if n_headers > MAX_HEADERS or header_bytes > MAX_HEADER_BYTES:
+                            too_large = "too many or too large headers"
+                            break
+                        name, _, value = line.decode("latin-1").partition(":")
+                        headers[name.strip().lower()] = value.strip()
+                except ValueError:
+                    too_large = "header line too long"
+                if too_large:
+                    await _respond(writer, 431, {"error": too_large}, keep_alive=False)
+                    break
+
+                try:
+                    length = int(headers.get("content-length") or 0)
+                except ValueError:
+                    length = -1
+                if not 0 <= length <= MAX_BODY_BYTES:
+                    await _respond(writer, 413 if length > 0 else 400, {"error": "bad Content-Length"}, keep_alive=False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                status, payload = await self.dispatch(method, target.split("?", 1)[0], body)
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                await _respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+def _json_object(body: bytes) -> dict:
+    try:
+        payload = json.loads(body)
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise HttpError(400, f"invalid JSON: {e}")
+    if not isinstance(payload, dict):
+        raise HttpError(400, "request body must be a JSON object")
+    return payload
+
+
+def _text_field(payload: dict, name: str) -> str:
+    value = payload.get(name)
+    if not isinstance(value, str):
+        raise HttpError(400, f"'{name}' must be a string")
+    return value
+
+
+async def _respond(writer: asyncio.StreamWriter, status: int, payload, keep_alive: bool) -> None:
+    body = json.dumps(payload).encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    writer.write(head.encode("latin-1") + body)
+    await writer.drain()
+
+
+async def start_server(service: ScoringService, host: str = "127.0.0.1", port: int = 8000) -> asyncio.AbstractServer:
+    return await asyncio.start_server(service.handle_connection, host, port)
+
+
+async def start_unix_server(service: ScoringService, path: str | os.PathLike) -> asyncio.AbstractServer:
+    """
+    Serve on a Unix domain socket, readable and writable by the owner only.
+    A socket file left behind by a daemon that is gone is replaced; one that
+    still has a listener raises OSError.
+    """
+    path = os.fspath(path)
+    if os.path.exists(path):
+        if not stat.S_ISSOCK(os.stat(path).st_mode):
+            raise OSError(f"{path} exists and is not a socket")
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+        except ConnectionRefusedError:
+            os.unlink(path)
+        else:
+            raise OSError(f"a daemon is already listening on {path}")
+        finally:
+            probe.close()
+
+    old_umask = os.umask(0o177)
+    try:
+        return await asyncio.start_unix_server(service.handle_connection, path)
+    finally:
+        os.umask(old_umask)
+
+
+# -------- Client (load tests, other services) --------
+class ServiceClient:
+    """Minimal keep-alive JSON client for the service, over TCP or (with `unix_path`) a Unix socket."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int | None = None, unix_path: str | None = None):
+        self.host = host
+        self.port = port
+        self.unix_path = unix_path
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+
+    async def request(self, method: str, path: str, payload=None) -> tuple[int, object]:
+        if self._writer is None:
+            if self.unix_path is not None:
+                self._reader, self._writer = await asyncio.open_unix_connection(self.unix_path)
+            else:
+                self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+        head = f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\nContent-Length: {len(body)}\r\n\r\n"
+        self._writer.write(head.encode("latin-1") + body)
+        await self._writer.drain()
+
+        status = int((await self._reader.readline()).split()[1])
+        length = 0
+        while (line := await self._reader.readline()) not in (b"\r\n", b""):
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.strip().lower() == "content-length":
+                length = int(value)
+        return status, json.loads(await self._reader.readexactly(length))
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
@@ -0,0 +1,101 @@
+# src/jobfit/stream.py
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, TextIO
+
+from jobfit.analyze import resolve_sections, score_profiles
+from jobfit.profile import profile_jd, profile_resume
+from jobfit.taxonomy import Taxonomy, get_taxonomy
+
+
+def read_records(lines: Iterable[str]) -> Iterator[dict]:
+    """Parse JSONL lazily; blank lines are skipped, bad lines become error records."""
+    for lineno, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield {"_error": f"line {lineno}: invalid JSON ({e.msg})"}
+            continue
+        if not isinstance(record, dict):
+            yield {"_error": f"line {lineno}: expected a JSON object"}
+            continue
+        yield record
+
+
+def _record_text(record: dict, field: str, load: Callable[[Path], str]) -> str:
+    """Inline text under `field`, or a file under `field`_path."""
+    if isinstance(record.get(field), str):
+        return record[field]
+    path = record.get(f"{field}_path")
+    if isinstance(path, str):
+        return load(Path(path))
+    raise ValueError(f"record needs '{field}' (text) or '{field}_path'")
+
+
+def analyze_records(
+    records: Iterable[dict],
+    load: Callable[[Path], str],
+    sections=None,
+    taxonomy: Taxonomy | None = None,
+) -> Iterator[dict]:
+    """
+    Analyze (resume, jd) records one at a time.
+
+    Records are pulled from `records` only as results are consumed, so memory
+    stays flat for any input size. The JD profile is reused while consecutive
+    records share the same JD, which is the common "many resumes, one JD" case.
+    Each output carries the record's "id" (if any); failures produce an
+    {"id", "error"} object instead of stopping the stream.
+    """
+    if taxonomy is None:
+        taxonomy = get_taxonomy()
+    sections = resolve_sections(sections)
+    with_requirements = "requirements" in sections
+
+    last_jd_text = None
+    jd = None
+    for record in records:
+        out = {"id": record.get("id")} if "id" in record else {}
+        if "_error" in record:
+            out["error"] = record["_error"]
+            yield out
+            continue
+
+        try:
+            resume_text = _record_text(record, "resume", load)
+            jd_text = _record_text(record, "jd", load)
+        except (Exception, SystemExit) as e:
+            # Anything the loader raises (missing file, bad encoding, a corrupt
+            # PDF from pypdf, ...) only fails this record.
+            out["error"] = str(e) or type(e).__name__
+            yield out
+            continue
+
+        if jd_text != last_jd_text:
+            jd = profile_jd(jd_text, taxonomy, with_requirements)
+            last_jd_text = jd_text
+
+        out.update(score_profiles(profile_resume(resume_text, taxonomy), jd, sections))
+        yield out
+
+
+def write_records(results: Iterable[dict], out: TextIO, line_buffered: bool = False) -> int:
+    """
+    Write each result as one JSON line as soon as it is produced. Output is
+    flushed once at the end, or after every line with line_buffered=True
+    (e.g. when a person or a downstream process is waiting on each result).
+    """
+    n = 0
+    for result in results:
+        out.write(json.dumps(result, ensure_ascii=False))
+        out.write("\n")
+        if line_buffered:
+            out.flush()
+        n += 1
+    out.flush()
+    return n
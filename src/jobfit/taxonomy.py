@@ -0,0 +1,285 @@
+# src/jobfit/taxonomy.py
+
+from __future__ import annotations
+
+import hashlib
+import json
+import marshal
+import os
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+
+from jobfit.extract.matcher import SkillMatcher
+
+SKILLS_SEED = "skills_seed.json"
+MAJORS_SEED = "majors_seed.json"
+SNAPSHOT = "taxonomy.marshal"
+# Bump when the snapshot layout, Taxonomy or SkillMatcher.state() changes.
+SNAPSHOT_FORMAT = 1
+
+
+_DATA_DIR = Path(__file__).with_name("data")
+
+
+def default_seed_path(name: str):
+    """
+    Locate a bundled seed file (independent of the CWD): in the package
+    directory when it is on disk, else through package resources (e.g. when
+    installed as a zip). importlib.resources is only imported in that case,
+    as it adds noticeably to CLI startup.
+    """
+    if _DATA_DIR.is_dir():
+        return _DATA_DIR / name
+    from importlib import resources
+
+    return resources.files("jobfit").joinpath("data", name)
+
+
+@dataclass(frozen=True)
+class Taxonomy:
+    """
+    Validated skills/majors seeds plus the compiled skill matcher.
+
+    `version` is a fingerprint of the seed contents, so anything derived from
+    a taxonomy can tell when the seeds have been edited.
+
+    Every canonical skill and major also has a dense integer id: its position
+    in `skill_names` / `major_names`, which are sorted by name. Sets of them
+    can be held as int bitsets (`skill_bits`), and decoding a bitset yields
+    names already in sorted order.
+
+    `synonyms` is a read-only view. It is left out of the hash, as its
+    contents are already covered by `version`.
+    """
+
+    skills: tuple[str, ...]
+    synonyms: Mapping[str, str] = field(hash=False)
+    majors: tuple[str, ...]
+    version: str
+    matcher: SkillMatcher = field(repr=False, compare=False)
+    skill_names: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    skill_ids: dict[str, int] = field(init=False, repr=False, compare=False)
+    major_names: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    major_ids: dict[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "synonyms", MappingProxyType(dict(self.synonyms)))
+        for kind, names in (("skill", self.skills), ("major", self.majors)):
+            ordered = tuple(sorted(set(names)))
+            object.__setattr__(self, f"{kind}_names", ordered)
+            object.__setattr__(self, f"{kind}_ids", {name: i for i, name in enumerate(ordered)})
+
+    def __reduce__(self):
+        # A mappingproxy cannot be pickled; rebuild from the plain fields instead.
+        return Taxonomy, (self.skills, dict(self.synonyms), self.majors, self.version, self.matcher)
+
+    def extract_skills(self, text: str) -> set[str]:
+        return self.matcher.extract(text)
+
+    def find_skills(self, text: str) -> list[tuple[int, int, str]]:
+        return self.matcher.find(text)
+
+    def skill_bits(self, skills) -> int:
+        return _to_bits(self.skill_ids, skills)
+
+    def skills_from_bits(self, bits: int) -> list[str]:
+        return _from_bits(self.skill_names, bits)
+
+    def major_bits(self, majors) -> int:
+        return _to_bits(self.major_ids, majors)
+
+    def majors_from_bits(self, bits: int) -> list[str]:
+        return _from_bits(self.major_names, bits)
+
+
+def _to_bits(ids: dict[str, int], names) -> int:
+    bits = 0
+    for name in names:
+        bits |= 1 << ids[name]
+    return bits
+
+
+def _from_bits(names: tuple[str, ...], bits: int) -> list[str]:
+    out = []
+    while bits:
+        low = bits & -bits
+        out.append(names[low.bit_length() - 1])
+        bits ^= low
+    return out
+
+
+def _validate_skills(seed: object) -> tuple[list[str], dict[str, str]]:
+    if not isinstance(seed, dict):
+        raise ValueError("skills seed must be a JSON object")
+    skills = seed.get("skills")
+    synonyms = seed.get("synonyms", {})
+    if not isinstance(skills, list) or not all(isinstance(s, str) and s for s in skills):
+        raise ValueError("skills seed: 'skills' must be a list of non-empty strings")
+    if not isinstance(synonyms, dict) or not all(
+        isinstance(k, str) and isinstance(v, str) for k, v in synonyms.items()
+    ):
+        raise ValueError("skills seed: 'synonyms' must map strings to strings")
+    unknown = sorted(v for v in set(synonyms.values()) if v not in set(skills))
+    if unknown:
+        raise ValueError(f"skills seed: synonyms point to unknown skills: {unknown}")
+    return skills, synonyms
+
+
+def _validate_majors(seed: object) -> list[str]:
+    majors = seed.get("majors") if isinstance(seed, dict) else None
+    if not isinstance(majors, list) or not all(isinstance(m, str) and m for m in majors):
+        raise ValueError("majors seed: 'majors' must be a list of non-empty strings")
+    return majors
+
+
+def seed_version(skills_bytes: bytes, majors_bytes: bytes) -> str:
+    digest = hashlib.sha256()
+    digest.update(skills_bytes)
+    digest.update(b"\0")
+    digest.update(majors_bytes)
+    return digest.hexdigest()[:16]
+
+
+def build_taxonomy(skills_bytes: bytes, majors_bytes: bytes) -> Taxonomy:
+    skills, synonyms = _validate_skills(json.loads(skills_bytes))
+    majors = _validate_majors(json.loads(majors_bytes))
+
+    return Taxonomy(
+        skills=tuple(skills),
+        synonyms=synonyms,
+        majors=tuple(majors),
+        version=seed_version(skills_bytes, majors_bytes),
+        matcher=SkillMatcher(skills, synonyms),
+    )
+
+
+# -------- Precompiled snapshot --------
+def dump_snapshot(taxonomy: Taxonomy) -> bytes:
+    """The validated seeds and the compiled matcher tables, marshalled."""
+    return marshal.dumps(
+        (
+            SNAPSHOT_FORMAT,
+            taxonomy.version,
+            taxonomy.skills,
+            dict(taxonomy.synonyms),
+            taxonomy.majors,
+            taxonomy.matcher.state(),
+        )
+    )
+
+
+def load_snapshot(data: bytes, version: str) -> Taxonomy | None:
+    """
+    The taxonomy in a dump_snapshot() blob, or None if the blob is unreadable,
+    has another SNAPSHOT_FORMAT or was made from other seeds than `version`.
+    """
+    try:
+        fmt, snapshot_version, skills, synonyms, majors, matcher_state = marshal.loads(data)
+    except (EOFError, ValueError, TypeError):
+        return None
+    if fmt != SNAPSHOT_FORMAT or snapshot_version != version:
+        return None
+    return Taxonomy(
+        skills=skills,
+        synonyms=synonyms,
+        majors=majors,
+        version=version,
+        matcher=SkillMatcher.from_state(matcher_state),
+    )
+
+
+def write_snapshot(taxonomy: Taxonomy, path: Path | str) -> None:
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(dump_snapshot(taxonomy))
+    os.replace(tmp, path)
+
+
+def _mtime(path) -> float | None:
+    # Resources inside a zip have no mtime; those are never reloaded.
+    return path.stat().st_mtime_ns if isinstance(path, Path) else None
+
+
+class TaxonomyRegistry:
+    """
+    Loads, validates and compiles the seed files once, then hands out the same
+    Taxonomy until one of the files changes on disk.
+
+    If a snapshot (default: SNAPSHOT next to the skills seed) was written
+    from the current seeds, it is loaded instead of validating the JSON and
+    compiling the matcher. A missing or stale snapshot is ignored.
+    """
+
+    def __init__(self, skills_path=None, majors_path=None, snapshot_path=None):
+        self.skills_path = Path(skills_path) if skills_path else default_seed_path(SKILLS_SEED)
+        self.majors_path = Path(majors_path) if majors_path else default_seed_path(MAJORS_SEED)
+        if snapshot_path:
+            self.snapshot_path = Path(snapshot_path)
+        elif skills_path:
+            self.snapshot_path = self.skills_path.with_name(SNAPSHOT)
+        else:
+            self.snapshot_path = default_seed_path(SNAPSHOT)
+        self._lock = threading.Lock()
+        self._taxonomy: Taxonomy | None = None
+        self._stamp: tuple | None = None
+
+    def _current_stamp(self) -> tuple:
+        return (_mtime(self.skills_path), _mtime(self.majors_path))
+
+    def get(self) -> Taxonomy:
+        stamp = self._current_stamp()
+        taxonomy = self._taxonomy
+        if taxonomy is not None and stamp == self._stamp:
+            return taxonomy
+
+        with self._lock:
+            if self._taxonomy is None or stamp != self._stamp:
+                self._taxonomy = self._load(self.skills_path.read_bytes(), self.majors_path.read_bytes())
+                self._stamp = stamp
+            return self._taxonomy
+
+    def _load(self, skills_bytes: bytes, majors_bytes: bytes) -> Taxonomy:
+        try:
+            snapshot = self.snapshot_path.read_bytes()
+        except OSError:
+            snapshot = None
+        if snapshot is not None:
+            taxonomy = load_snapshot(snapshot, seed_version(skills_bytes, majors_bytes))
+            if taxonomy is not None:
+                return taxonomy
+        return build_taxonomy(skills_bytes, majors_bytes)
+
+
+_default_registry = TaxonomyRegistry()
+
+
+def get_taxonomy() -> Taxonomy:
+    """The process-wide taxonomy built from the bundled seeds."""
+    return _default_registry.get()
+
+
+def main(argv: list[str] | None = None) -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m jobfit.taxonomy",
+        description="Write the precompiled taxonomy snapshot (run after editing the seeds).",
+    )
+    parser.add_argument("--skills", type=Path, default=None, help="Skills seed (default: the bundled one).")
+    parser.add_argument("--majors", type=Path, default=None, help="Majors seed (default: the bundled one).")
+    parser.add_argument("--output", type=Path, default=None, help=f"Snapshot file (default: {SNAPSHOT} next to the skills seed).")
+    args = parser.parse_args(argv)
+
+    skills_path = args.skills or default_seed_path(SKILLS_SEED)
+    majors_path = args.majors or default_seed_path(MAJORS_SEED)
+    taxonomy = build_taxonomy(skills_path.read_bytes(), majors_path.read_bytes())
+    output = args.output or Path(skills_path).with_name(SNAPSHOT)
+    write_snapshot(taxonomy, output)
+    print(f"wrote {output} (taxonomy {taxonomy.version})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+# src/jobfit/timing.py
+"""
+Per-stage timers for the analysis pipeline.
+
+Library code marks its stages with `with stage("resume.skills"): ...`.
+Nothing is measured unless a StageTimer is active in the current context
+(see recording()); otherwise stage() returns a shared no-op context
+manager, so the cost of an instrumented stage is one ContextVar lookup.
+
+Stages do not nest: each name covers its own span of work, and sub-steps
+use dotted names ("pdf.parse", "jd.requirements").
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from time import perf_counter_ns
+from typing import Iterator
+
+_ACTIVE: ContextVar["StageTimer | None"] = ContextVar("jobfit_stage_timer", default=None)
+_OFF = nullcontext()
+
+
+class _Stage:
+    __slots__ = ("timer", "name", "start", "mem")
+
+    def __init__(self, timer: "StageTimer", name: str):
+        self.timer = timer
+        self.name = name
+
+    def __enter__(self) -> None:
+        tracemalloc = self.timer._tracemalloc
+        if tracemalloc is not None:
+            tracemalloc.reset_peak()
+            self.mem = tracemalloc.get_traced_memory()[0]
+        self.start = perf_counter_ns()
+
+    def __exit__(self, *exc) -> None:
+        elapsed = perf_counter_ns() - self.start
+        tracemalloc = self.timer._tracemalloc
+        peak = tracemalloc.get_traced_memory()[1] - self.mem if tracemalloc is not None else None
+        self.timer.add(self.name, elapsed, peak)
+
+
+class StageTimer:
+    """
+    Accumulated nanoseconds and call counts per stage.
+
+    With allocations=True, tracemalloc is started (if it was not tracing
+    already) and each stage also records its peak allocation in bytes above
+    what was allocated when it started. That costs far more than the timers,
+    so it is off by default.
+    """
+
+    def __init__(self, allocations: bool = False):
+        self.allocations = allocations
+        self.ns: dict[str, int] = {}
+        self.calls: dict[str, int] = {}
+        self.peak_bytes: dict[str, int] = {}
+        self.total_ns: int | None = None
+        self._started_tracing = False
+        self._tracemalloc = None
+        if allocations:
+            import tracemalloc
+
+            self._tracemalloc = tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+
+    def stage(self, name: str) -> _Stage:
+        return _Stage(self, name)
+
+    def add(self, name: str, ns: int, peak_bytes: int | None = None) -> None:
+        self.ns[name] = self.ns.get(name, 0) + ns
+        self.calls[name] = self.calls.get(name, 0) + 1
+        if peak_bytes is not None:
+            self.peak_bytes[name] = max(self.peak_bytes.get(name, 0), peak_bytes)
+
+    def close(self) -> None:
+        """Stop tracemalloc if this timer started it."""
+        if self._started_tracing:
+            self._tracemalloc.stop()
+            self._started_tracing = False
+
+    def to_dict(self) -> dict:
+        """The "timings" section: total and per-stage milliseconds, in the order stages first ran."""
+        stages = {}
+        for name, ns in self.ns.items():
+            row = {"ms": round(ns / 1e6, 3), "calls": self.calls[name]}
+            if name in self.peak_bytes:
+                row["peak_kb"] = round(self.peak_bytes[name] / 1024, 1)
+            stages[name] = row
+        total = self.total_ns if self.total_ns is not None else sum(self.ns.values())
+        return {"total_ms": round(total / 1e6, 3), "stages": stages}
+
+
+def stage(name: str):
+    """Context manager timing `name` into the active StageTimer, or a no-op if there is none."""
+    timer = _ACTIVE.get()
+    return _OFF if timer is None else _Stage(timer, name)
+
+
+def active_timer() -> StageTimer | None:
+    return _ACTIVE.get()
+
+
+@contextmanager
+def recording(timer: StageTimer) -> Iterator[StageTimer]:
+    """Make `timer` collect every stage() run in this context (thread / task) until exit."""
+    token = _ACTIVE.set(timer)
+    start = perf_counter_ns()
+    try:
+        yield timer
+    finally:
+        timer.total_ns = (timer.total_ns or 0) + perf_counter_ns() - start
+        _ACTIVE.reset(token)
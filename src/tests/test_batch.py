@@ -0,0 +1,36 @@
+from pathlib import Path
+
+import pytest
+
+from jobfit.analyze import analyze, analyze_many, analyze_matrix
+from jobfit.cli import main
+
+FIXTURES = Path("src/tests/fixtures")
+RESUME = (FIXTURES / "sample_resume.txt").read_text(encoding="utf-8")
+JD = (FIXTURES / "sample_jd.txt").read_text(encoding="utf-8")
+OTHER_JD = "Must have 5+ years of Java and Spark. Master's degree in Computer Science."
+
+
+def test_analyze_many_matches_pairwise():
+    assert analyze_many(RESUME, [JD, OTHER_JD]) == [analyze(RESUME, JD), analyze(RESUME, OTHER_JD)]
+
+
+def test_analyze_matrix_shape_and_values():
+    out = analyze_matrix([RESUME, JD], [JD, OTHER_JD])
+    assert len(out) == 2 and all(len(row) == 2 for row in out)
+    assert out[1][1] == analyze(JD, OTHER_JD)
+
+
+def test_batch_cli_prints_one_row_per_pair(capsys):
+    main(["batch", "--resume", str(FIXTURES / "sample_resume.txt"), "--jd", str(FIXTURES), "--no-pdf-cache"])
+    rows = capsys.readouterr().out.strip().splitlines()
+    assert rows[0].startswith("resume\tjd\ttotal")
+    assert len(rows) == 1 + len(list(FIXTURES.glob("*.txt")) + list(FIXTURES.glob("*.pdf")))
+
+
+def test_batch_cli_rejects_non_positive_workers_and_chunks(capsys):
+    for flag in ("--workers", "--chunk-size"):
+        with pytest.raises(SystemExit) as exc:
+            main(["batch", "--resume", str(FIXTURES), "--jd", str(FIXTURES), flag, "0"])
+        assert exc.value.code == 2
+        assert "must be at least 1" in capsys.readouterr().err
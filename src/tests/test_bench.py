@@ -0,0 +1,49 @@
+import json
+
+from jobfit.bench.corpus import CorpusSpec, generate_corpus
+from jobfit.bench.suite import compare, main, run_suite
+from jobfit.profile import profile_jd, profile_resume
+
+
+def test_corpus_is_deterministic_and_follows_spec():
+    spec = CorpusSpec(n_resumes=5, n_jds=3, degree_mix={"masters": 1.0}, jd_years=(4, 4), seed=7)
+    corpus = generate_corpus(spec)
+    assert corpus == generate_corpus(spec)
+    assert corpus.resumes != generate_corpus(CorpusSpec(n_resumes=5, n_jds=3, seed=8)).resumes
+    # More JDs leave the resumes as they were.
+    assert generate_corpus(CorpusSpec(n_resumes=5, n_jds=4, degree_mix={"masters": 1.0}, seed=7)).resumes == corpus.resumes
+
+    for text in corpus.resumes:
+        profile = profile_resume(text)
+        assert profile.degree == "masters"
+        assert profile.skills
+    for text in corpus.jds:
+        profile = profile_jd(text)
+        assert (profile.degree, profile.years) == ("masters", 4)
+        assert any(profile.requirement_skills)
+
+
+def test_suite_reports_every_stage_and_compares():
+    stages = run_suite(generate_corpus(CorpusSpec(n_resumes=3, n_jds=2, resume_words=60, jd_words=60)), repeat=1)
+    assert stages["score_profiles"]["items"] == 6
+    assert all(row["us_per_item"] > 0 for row in stages.values())
+
+    baseline = {"stages": {"normalize_text": {"us_per_item": 10.0}, "gone": {"us_per_item": 1.0}}}
+    current = {"stages": {"normalize_text": {"us_per_item": 12.5}, "new": {"us_per_item": 1.0}}}
+    assert compare(current, baseline) == [
+        {"stage": "normalize_text", "baseline_us": 10.0, "current_us": 12.5, "change_pct": 25.0}
+    ]
+
+
+def test_suite_report_handles_stages_without_items(tmp_path, capsys):
+    argv = ["--resumes", "2", "--jds", "1", "--resume-words", "40", "--jd-words", "40", "--repeat", "1", "--pairs", "0"]
+    out = tmp_path / "run.json"
+    main([*argv, "--output", str(out)])
+    result = json.loads(out.read_text(encoding="utf-8"))
+    assert result["stages"]["analyze_end_to_end"]["us_per_item"] is None
+    assert result["pairs_per_sec"] is None
+
+    main([*argv, "--baseline", str(out), "--max-regression", "50"])
+    report = capsys.readouterr().out
+    assert "end to end: - pairs/s" in report
+    assert [line.split()[-1] for line in report.splitlines() if line.startswith("analyze_end_to_end")] == ["-", "-", "-"]
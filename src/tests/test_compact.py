@@ -0,0 +1,34 @@
+import random
+
+from jobfit.analyze import analyze, score_compact
+from jobfit.profile import compact_profile, profile_jd, profile_resume
+from jobfit.taxonomy import get_taxonomy
+
+RESUMES = [
+    "Education: M.S. Statistics\nSkills: Python, SQL, pandas\nAnalyst 2019-2023",
+    "Skills: Java, Spark\nEngineer 2021-2022",
+    "B.S. Computer Science. Python and Tableau. Intern 2023-2024",
+    "",
+]
+JDS = [
+    "Requirements: Python, SQL, Tableau\n3+ years of experience\nMaster's in Statistics",
+    "Java developer, 2-4 years. Bachelor's degree in computer science.",
+    "No requirements listed.",
+]
+
+
+def test_skill_bits_round_trip_in_name_order():
+    taxonomy = get_taxonomy()
+    names = random.Random(0).sample(taxonomy.skills, 25)
+    bits = taxonomy.skill_bits(names)
+    assert bits.bit_count() == 25
+    assert taxonomy.skills_from_bits(bits) == sorted(names)
+    assert taxonomy.skill_names[taxonomy.skill_ids["python"]] == "python"
+
+
+def test_compact_scores_match_analyze():
+    for resume_text in RESUMES:
+        resume = compact_profile(profile_resume(resume_text))
+        for jd_text in JDS:
+            score = score_compact(resume, compact_profile(profile_jd(jd_text)))
+            assert score.to_dict() == analyze(resume_text, jd_text, sections=["score"])["score"]
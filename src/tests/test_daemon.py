@@ -0,0 +1,101 @@
+import asyncio
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from jobfit.cli import main
+from jobfit.service import ScoringService, start_unix_server
+
+RESUME = "Skills: Python, SQL\nEducation\nB.S. Statistics\nAnalyst 2019-2023"
+JD = "Requirements: Python, SQL and Tableau\n2+ years of experience"
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    """A ScoringService on a Unix socket, served from a background event loop."""
+    path = tmp_path / "jobfit.sock"
+    service = ScoringService(executor=ThreadPoolExecutor(1), batch_window=0)
+    loop = asyncio.new_event_loop()
+    server = loop.run_until_complete(start_unix_server(service, path))
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield path, service
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    server.close()
+    loop.run_until_complete(server.wait_closed())
+    loop.close()
+    service.close()
+
+
+def _inputs(tmp_path):
+    resume, jd = tmp_path / "resume.txt", tmp_path / "jd.txt"
+    resume.write_text(RESUME, encoding="utf-8")
+    jd.write_text(JD, encoding="utf-8")
+    return ["--resume", str(resume), "--jd", str(jd), "--no-pdf-cache"]
+
+
+def test_daemon_report_matches_in_process(tmp_path, daemon, capsys):
+    path, service = daemon
+    args = _inputs(tmp_path)
+
+    main(args)
+    local = capsys.readouterr().out
+    main([*args, "--daemon", str(path)])
+    remote = capsys.readouterr().out
+
+    assert remote == local
+    assert service.statuses[200] == 1
+
+
+def test_missing_daemon_falls_back_to_in_process(tmp_path, capsys):
+    args = _inputs(tmp_path)
+    main(args)
+    local = capsys.readouterr().out
+    main([*args, "--daemon", str(tmp_path / "absent.sock")])
+    assert capsys.readouterr().out == local
+
+
+def test_daemon_that_hangs_up_falls_back_to_in_process(tmp_path, capsys):
+    args = _inputs(tmp_path)
+    main(args)
+    local = capsys.readouterr().out
+
+    path = tmp_path / "broken.sock"
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(path))
+    listener.listen()
+
+    def hang_up():
+        conn, _ = listener.accept()
+        conn.close()
+
+    thread = threading.Thread(target=hang_up)
+    thread.start()
+    main([*args, "--daemon", str(path)])
+    thread.join()
+    listener.close()
+    assert capsys.readouterr().out == local
+
+
+def test_live_socket_is_kept_and_stale_one_replaced(tmp_path, daemon):
+    path, _ = daemon
+    service = ScoringService(executor=ThreadPoolExecutor(1))
+    with pytest.raises(OSError, match="already listening"):
+        asyncio.run(start_unix_server(service, path))
+    assert oct(path.stat().st_mode & 0o777) == oct(0o600)
+
+    stale = tmp_path / "stale.sock"
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(str(stale))  # bound but never listening: connections are refused
+    sock.close()
+
+    async def serve_once():
+        server = await start_unix_server(service, stale)
+        server.close()
+        await server.wait_closed()
+
+    asyncio.run(serve_once())
+    service.close()
@@ -0,0 +1,14 @@
+from jobfit.extract.education import detect_degree_level
+from jobfit.extract.experience import extract_years_required
+
+
+def test_detect_degree_level_picks_highest():
+    assert detect_degree_level("B.S. in Statistics, M.S. in Data Science") == "masters"
+    assert detect_degree_level("MBA; later a Ph.D. in Economics") == "phd"
+    assert detect_degree_level("Bachelor of Arts") == "bachelors"
+    assert detect_degree_level("No formal degree, mostly bootcamps") is None
+
+
+def test_years_required_prefers_first_range():
+    assert extract_years_required("2+ years of SQL, 5-7 years overall") == 5
+    assert extract_years_required("2+ years of SQL and 4 yrs of Python") == 4
@@ -0,0 +1,44 @@
+from jobfit.analyze import analyze
+from jobfit.incremental import IncrementalProfiler, IncrementalProfiles, line_diff
+from jobfit.profile import profile_jd, profile_resume
+
+RESUME = "Skills: Python, SQL\nEducation\nB.S. Statistics\nAnalyst 2019-2023\nIntern 2018"
+JD = "About us\nWe like data.\nRequirements:\nPython and SQL\n3+ years of experience\nBenefits\nMust love dogs"
+
+
+def test_matches_full_profile_across_edits():
+    versions = [
+        JD,
+        JD.replace("Python and SQL", "Python, SQL and machine\nlearning"),  # skill across a break
+        JD.replace("3+ years", "3 -\n5 years"),  # years across a break
+        JD + "\nPreferred\nExperience with Tableau",
+        "",
+        JD,
+    ]
+    profiler = IncrementalProfiler("jd")
+    for text in versions:
+        assert profiler.update(text) == profile_jd(text)
+    assert profiler.update(JD, requirements=False) == profile_jd(JD, requirements=False)
+
+    profiler = IncrementalProfiler("resume")
+    for text in (RESUME, RESUME.replace("Intern 2018", "Intern 2018 -\n2019"), RESUME.replace("B.S.", "M.S.")):
+        assert profiler.update(text) == profile_resume(text)
+
+
+def test_only_changed_lines_are_extracted():
+    assert line_diff(["a", "b", "c"], ["a", "x", "y", "c"]) == (1, 2, 3)
+
+    profiler = IncrementalProfiler("jd")
+    profiler.update(JD)
+    assert (profiler.stats.hits, profiler.stats.misses) == (0, 7)
+    profiler.update(JD.replace("Must love dogs", "Must know Tableau"))
+    assert (profiler.stats.hits, profiler.stats.misses) == (6, 8)
+
+
+def test_analyze_with_incremental_profiles():
+    profiles = IncrementalProfiles()
+    edited = JD.replace("Python and SQL", "Python and Spark")
+    for jd in (JD, edited):
+        assert analyze(RESUME, jd, profiles=profiles) == analyze(RESUME, jd)
+    assert profiles.jd.stats.misses == 8
+    assert profiles.resume.stats.misses == 5
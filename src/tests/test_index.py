@@ -0,0 +1,50 @@
+from jobfit.analyze import score_profiles
+from jobfit.index import SkillIndex
+from jobfit.profile import profile_jd, profile_resume
+
+RESUMES = {
+    "a": "Education: M.S. Statistics\nSkills: Python, SQL, pandas\nAnalyst 2019-2023",
+    "b": "Skills: Java, Spark\nEngineer 2021-2022",
+    "c": "B.S. Computer Science. Python and Tableau. Intern 2023-2024",
+}
+JD = "Requirements: Python, SQL, Tableau\n3+ years of experience\nMaster's in Statistics"
+
+
+def _index():
+    index = SkillIndex()
+    for key, text in RESUMES.items():
+        index.add(key, profile_resume(text))
+    return index
+
+
+def test_query_scores_match_score_profiles():
+    jd = profile_jd(JD)
+    expected = {
+        key: score_profiles(profile_resume(text), jd)["score"]["total_points"]
+        for key, text in RESUMES.items()
+    }
+    top = _index().query(jd, k=3)
+    assert {m.key: m.total_points for m in top} == expected
+    assert [m.total_points for m in top] == sorted(expected.values(), reverse=True)
+
+
+def test_remove_updates_postings():
+    index = _index()
+    assert len(index.postings("python")) == 2
+    assert index.remove("a")
+    assert not index.remove("a")
+    assert len(index.postings("python")) == 1
+    assert "a" not in index
+
+
+def test_save_and_load_round_trip(tmp_path):
+    index = _index()
+    index.remove("b")
+    index.add("d", profile_resume("Python and SQL, 2020-2024"))
+    path = tmp_path / "index.json"
+    index.save(path)
+
+    loaded = SkillIndex.load(path)
+    jd = profile_jd(JD)
+    assert loaded.query(jd, k=5) == index.query(jd, k=5)
+    assert list(loaded.postings("python")) == list(index.postings("python"))
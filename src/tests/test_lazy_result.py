@@ -0,0 +1,31 @@
+from pathlib import Path
+
+import pytest
+
+from jobfit.analyze import SECTIONS, AnalysisResult, analyze
+
+FIXTURES = Path("src/tests/fixtures")
+RESUME = (FIXTURES / "sample_resume.txt").read_text(encoding="utf-8")
+JD = (FIXTURES / "sample_jd.txt").read_text(encoding="utf-8")
+
+
+def test_lazy_result_matches_eager():
+    lazy = analyze(RESUME, JD, lazy=True)
+    assert isinstance(lazy, AnalysisResult)
+    assert lazy.to_dict() == analyze(RESUME, JD)
+    assert dict(lazy) == analyze(RESUME, JD)
+
+
+def test_sections_are_computed_on_first_access():
+    lazy = analyze(RESUME, JD, lazy=True)
+    assert lazy.total_points == analyze(RESUME, JD)["score"]["total_points"]
+    assert not any(key in lazy._cache for key in SECTIONS)
+
+    first = lazy["requirements"]
+    assert lazy["requirements"] is first
+    assert "previews" not in lazy._cache
+
+
+def test_lazy_rejects_sections():
+    with pytest.raises(ValueError, match="sections"):
+        analyze(RESUME, JD, lazy=True, sections=["score"])
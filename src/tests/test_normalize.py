@@ -1,6 +1,20 @@
-from jobfit.preprocess.normalize import normalize_text
+from jobfit.preprocess.normalize import normalize_text, normalize_with_offsets
 
 def test_normalize_text_basic():
     raw = "Hello\n\tWorld   "
     out = normalize_text(raw)
     assert out == "hello world"
+
+
+def test_normalize_text_unicode_punctuation():
+    assert normalize_text("Café – “Python”, SQL &  C++") == "caf python sql c"
+
+
+def test_offsets_slice_matches_normalizing_the_slice():
+    raw = "Requirements:\n  - Python, SQL\nNice to have: Tableau"
+    norm = normalize_with_offsets(raw)
+    assert norm.text == normalize_text(raw)
+    start = raw.index("  - Python")
+    end = raw.index("\nNice")
+    assert norm.slice(start, end) == normalize_text(raw[start:end]) == "python sql"
+    assert raw[norm.to_source(norm.text.index("tableau"))] == "T"
@@ -0,0 +1,20 @@
+from pathlib import Path
+
+from jobfit.cli import read_input_file
+from jobfit.parallel import score_files
+from jobfit.profile import profile_jd
+
+FIXTURES = Path("src/tests/fixtures")
+
+
+def test_process_pool_matches_inline():
+    jd_path = FIXTURES / "sample_jd.txt"
+    jds = [(str(jd_path), profile_jd(read_input_file(jd_path)))]
+    resumes = [FIXTURES / "sample_resume.txt", jd_path] * 3
+
+    inline = list(score_files(resumes, jds, read_input_file, workers=1, chunk_size=2))
+    stats: dict = {}
+    pooled = list(score_files(resumes, jds, read_input_file, workers=2, chunk_size=2, stats=stats))
+
+    assert pooled == inline
+    assert sum(w.resumes for w in stats.values()) == len(resumes)
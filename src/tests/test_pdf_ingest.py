@@ -0,0 +1,76 @@
+import io
+import os
+from pathlib import Path
+
+import jobfit.ingest.pdf_extract as pdf_extract
+from jobfit.cli import build_arg_parser, pdf_cache_from_args
+from jobfit.ingest.cache import TextCache, content_hash, default_cache_dir
+from jobfit.ingest.pdf_extract import extract_text_from_pdf, iter_pdf_pages
+
+PDF = Path("src/tests/fixtures/sample_resume.pdf")
+PAGES = ["Python and SQL", "Masters in statistics", "2019-2022"]
+
+
+def test_pages_stream_in_order():
+    data = PDF.read_bytes()
+    assert list(iter_pdf_pages(data)) == PAGES
+    assert list(iter_pdf_pages(data, workers=2)) == PAGES
+
+
+def test_cached_pdf_skips_pypdf(tmp_path, monkeypatch):
+    cache = TextCache(tmp_path)
+    text = extract_text_from_pdf(PDF, cache=cache)
+    assert text == "\n".join(PAGES)
+
+    def boom(*args, **kwargs):
+        raise AssertionError("pypdf should not run on a cache hit")
+
+    monkeypatch.setattr(pdf_extract, "PdfReader", boom)
+    assert extract_text_from_pdf(PDF, cache=cache) == text
+    assert cache.get(content_hash(PDF.read_bytes())) == text
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = TextCache(tmp_path, max_bytes=25)
+    cache.put("a", "x" * 10)
+    cache.put("b", "y" * 10)
+    os.utime(tmp_path / "a.txt", ns=(0, 0))
+    os.utime(tmp_path / "b.txt", ns=(0, 1))
+    cache.put("c", "z" * 10)
+    assert cache.get("a") is None
+    assert cache.get("b") == "y" * 10
+    assert cache.get("c") == "z" * 10
+
+
+def test_cache_scans_only_when_full(tmp_path, monkeypatch):
+    cache = TextCache(tmp_path, max_bytes=25)
+    cache.put("a", "x" * 10)
+    scans = []
+    monkeypatch.setattr(os, "scandir", lambda path: scans.append(path) or iter(()))
+    cache.put("b", "y" * 10)
+    cache.put("b", "y" * 12)
+    assert scans == []
+    cache.put("c", "z" * 10)
+    assert len(scans) == 1
+
+
+def test_pdf_cache_is_opt_in(tmp_path, monkeypatch):
+    monkeypatch.delenv("JOBFIT_CACHE_DIR", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert default_cache_dir() == tmp_path / "jobfit"
+
+    def cache(*flags):
+        return pdf_cache_from_args(build_arg_parser().parse_args(["--resume", "r", "--jd", "j", *flags]))
+
+    assert cache() is None
+    assert cache("--pdf-cache").directory == tmp_path / "jobfit" / "pdf_text"
+    assert cache("--pdf-cache", str(tmp_path / "pdf")).directory == tmp_path / "pdf"
+    assert cache("--pdf-cache", "--no-pdf-cache") is None
+
+
+def test_extract_from_in_memory_sources():
+    data = PDF.read_bytes()
+    expected = "\n".join(PAGES)
+    assert extract_text_from_pdf(data) == expected
+    assert extract_text_from_pdf(memoryview(data)) == expected
+    assert extract_text_from_pdf(io.BytesIO(data)) == expected
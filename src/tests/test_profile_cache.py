@@ -0,0 +1,64 @@
+import jobfit.profile_cache as profile_cache
+from jobfit.analyze import analyze, analyze_matrix
+from jobfit.profile import profile_jd, profile_resume
+from jobfit.profile_cache import ProfileCache, decode_profile, encode_profile
+from jobfit.taxonomy import get_taxonomy
+
+RESUME = "Skills: Python, SQL, Tableau\nEducation\nMasters in statistics\nAnalyst 2018-2023"
+JD = "Requirements: 3+ years of Python and SQL.\nMust know sklearn.\nBachelors in computer science."
+
+
+def test_encoded_profiles_round_trip():
+    taxonomy = get_taxonomy()
+    for profile in (
+        profile_resume(RESUME, taxonomy),
+        profile_jd(JD, taxonomy),
+        profile_jd(JD, taxonomy, requirements=False),
+    ):
+        data = encode_profile(profile, taxonomy)
+        assert len(data) < len(profile.text) * 2
+        assert decode_profile(data, profile.text, taxonomy) == profile
+
+
+def test_norm_hash_ignores_layout():
+    assert profile_resume("Python, SQL!").norm_hash == profile_resume("python   sql").norm_hash
+    assert profile_resume("Python, SQL!").norm_hash != profile_resume("python").norm_hash
+
+
+def test_new_pairing_only_runs_scoring(monkeypatch):
+    cache = ProfileCache()
+    expected = analyze_matrix([RESUME], [JD, "Tableau and SQL"], profiles=cache)
+    assert expected == analyze_matrix([RESUME], [JD, "Tableau and SQL"])
+
+    def boom(*args, **kwargs):
+        raise AssertionError("a cached document should not be profiled again")
+
+    monkeypatch.setattr(profile_cache, "profile_resume", boom)
+    monkeypatch.setattr(profile_cache, "profile_jd", boom)
+    assert analyze(RESUME, "Tableau and SQL", profiles=cache) == expected[0][1]
+    assert (cache.stats.hits, cache.stats.misses) == (2, 3)
+
+
+def test_jd_profile_without_requirements_is_completed():
+    cache = ProfileCache()
+    bare = cache.profile_jd(JD, requirements=False)
+    assert bare.requirement_lines is None
+    full = cache.profile_jd(JD)
+    assert full == profile_jd(JD)
+    assert cache.profile_jd(JD, requirements=False) is full
+
+
+def test_saved_cache_decodes_on_lookup(tmp_path):
+    cache = ProfileCache(max_entries=2)
+    cache.profile_resume("old resume, python")
+    cache.profile_resume(RESUME)
+    cache.profile_jd(JD)
+    assert len(cache) == 2 and cache.stats.evictions == 1
+
+    path = tmp_path / "profiles.bin"
+    cache.save(path)
+    loaded = ProfileCache.load(path)
+    assert len(loaded) == 2
+    assert loaded.profile_jd(JD) == profile_jd(JD)
+    assert loaded.profile_resume(RESUME) == profile_resume(RESUME)
+    assert (loaded.stats.hits, loaded.stats.misses) == (2, 0)
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from jobfit.profile import compact_profile, profile_jd, profile_resume
+from jobfit.profile_store import ProfileStore, write_profile_store
+from jobfit.score.vectorized import VectorScorer
+from jobfit.taxonomy import get_taxonomy
+
+RESUMES = {
+    "a": "Skills: Python, SQL, Tableau\nEducation\nMasters in statistics\nAnalyst 2018-2023",
+    "b": "Skills: Java\nEngineer 2022-2023",
+    "ü/c": "Python, Spark. Ph.D. computer science. Intern 2023-2024",
+}
+JD = "Requirements: 3+ years of Python and SQL.\nMasters in statistics."
+
+
+def test_store_round_trip_and_scores(tmp_path):
+    taxonomy = get_taxonomy()
+    profiles = {key: profile_resume(text, taxonomy) for key, text in RESUMES.items()}
+    path = tmp_path / "resumes.jfps"
+    assert write_profile_store(path, profiles.items(), taxonomy, chunk_size=2) == 3
+
+    scorer = VectorScorer(taxonomy)
+    jd = profile_jd(JD, taxonomy)
+    with ProfileStore(path) as store:
+        assert len(store) == 3
+        assert store.taxonomy_version == taxonomy.version
+        assert list(store.keys()) == list(RESUMES)
+        assert store.index_of("ü/c") == 2
+        for i, profile in enumerate(profiles.values()):
+            assert store.compact(i) == compact_profile(profile, taxonomy)
+
+        in_memory = scorer.score(jd, scorer.encode_profiles(list(profiles.values())))
+        mapped = scorer.score(jd, store.candidates())
+        assert np.array_equal(mapped.total_points, in_memory.total_points)
+        assert [start for start, _ in store.iter_candidates(chunk_size=2)] == [0, 2]
+
+
+def test_empty_and_invalid_stores(tmp_path):
+    path = tmp_path / "empty.jfps"
+    write_profile_store(path, [])
+    with ProfileStore(path) as store:
+        assert len(store) == 0
+        assert store.skills.shape[0] == 0
+
+    path.write_bytes(b"not a store")
+    with pytest.raises(ValueError, match="Not a profile store"):
+        ProfileStore(path)
+
+    fractional = compact_profile(profile_resume(RESUMES["a"]))
+    fractional = type(fractional)(fractional.skills, fractional.majors, fractional.degree, 1.1)
+    with pytest.raises(ValueError, match="float32"):
+        write_profile_store(path, [("x", fractional)])
+    assert [p.name for p in tmp_path.iterdir()] == ["empty.jfps"]
+
+    write_profile_store(path, [(key, compact_profile(profile_resume(text))) for key, text in RESUMES.items()])
+    data = path.read_bytes()
+    path.write_bytes(data[:-2])  # cut inside the key blob
+    with pytest.raises(ValueError, match="Truncated"):
+        ProfileStore(path)
+    path.write_bytes(data[:14] + (2).to_bytes(8, "little") + data[22:])  # wrong profile count
+    with pytest.raises(ValueError, match="Truncated"):
+        ProfileStore(path)
+
+
+def test_close_while_a_view_is_held(tmp_path):
+    path = tmp_path / "resumes.jfps"
+    write_profile_store(path, [(key, profile_resume(text)) for key, text in RESUMES.items()])
+    with ProfileStore(path) as store:
+        candidates = store.candidates()
+        expected = candidates.skills.copy()
+    assert store.skills is None
+    assert np.array_equal(candidates.skills, expected)
@@ -0,0 +1,74 @@
+import heapq
+import random
+
+import pytest
+
+from jobfit.analyze import score_compact
+from jobfit.extract.patterns import DEGREE_CODES
+from jobfit.index import SkillIndex
+from jobfit.profile import CompactProfile, compact_profile, profile_jd, profile_resume
+from jobfit.profile_store import ProfileStore, write_profile_store
+from jobfit.rank import RankedCandidate, RankStats, rank
+from jobfit.taxonomy import get_taxonomy
+
+JD = "Requirements: Python, SQL, Tableau\n3+ years of experience\nMaster's in Statistics"
+
+
+def _exhaustive(jd, profiles, k):
+    jd_compact = compact_profile(jd)
+    scored = (RankedCandidate(key, score_compact(p, jd_compact)) for key, p in profiles.items())
+    return heapq.nlargest(k, scored, key=lambda c: c.score.total_points)
+
+
+def test_rank_matches_exhaustive_and_prunes(tmp_path):
+    taxonomy = get_taxonomy()
+    jd = profile_jd(JD, taxonomy)
+    jd_compact = compact_profile(jd, taxonomy)
+    # A handful of skills, majors and years, so there are many ties on every score.
+    rng = random.Random(3)
+    jd_bits = [1 << i for i in range(jd_compact.skills.bit_length()) if jd_compact.skills >> i & 1]
+    pool = [1 << i for i in range(8)] + jd_bits
+    profiles = {
+        f"r{i}": CompactProfile(
+            skills=rng.choice(pool) | rng.choice(pool),
+            majors=rng.choice([0, jd_compact.majors]),
+            degree=rng.choice(list(DEGREE_CODES.values())),
+            years=float(rng.randint(0, 4)),
+        )
+        for i in range(2000)
+    }
+    write_profile_store(tmp_path / "profiles.jfps", profiles.items(), taxonomy)
+
+    with ProfileStore(tmp_path / "profiles.jfps") as store:
+        for k in (0, 1, 7, 100, 2500):
+            expected = _exhaustive(jd, profiles, k)
+            stats = RankStats()
+            assert rank(jd, profiles, k, taxonomy, stats) == expected
+            assert rank(jd, store, k, taxonomy) == expected
+            assert stats.candidates == 2000
+            if 0 < k <= 7:
+                assert stats.scored < 2000
+                assert stats.pruned > 0
+
+
+def test_rank_documents_and_index_agree():
+    resumes = {
+        "a": "Education: M.S. Statistics\nSkills: Python, SQL, pandas\nAnalyst 2019-2023",
+        "b": "Skills: Java, Spark\nEngineer 2021-2022",
+        "c": "B.S. Computer Science. Python and Tableau. Intern 2023-2024",
+        "d": "Skills: Java\nEngineer 2021-2022",
+    }
+    profiles = {key: profile_resume(text) for key, text in resumes.items()}
+    index = SkillIndex()
+    for key, profile in profiles.items():
+        index.add(key, profile)
+
+    expected = _exhaustive(profile_jd(JD), {key: compact_profile(p) for key, p in profiles.items()}, 3)
+    assert [c.key for c in expected] == ["a", "c", "b"]
+    assert rank(JD, profiles, k=3) == expected
+    stats = RankStats()
+    assert rank(JD, index, k=3, stats=stats) == expected
+    assert stats.candidates == 4
+
+    with pytest.raises(TypeError):
+        rank(JD, list(profiles.values()))
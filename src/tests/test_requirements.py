@@ -4,3 +4,54 @@ def test_extract_requirement_lines_basic():
     jd = "Requirements: Python\nNice to have: Tableau\nOther: blah"
     lines = extract_requirement_lines(jd)
     assert any("Requirements" in l for l in lines)
+
+
+def test_coverage_uses_skill_matches_not_substrings():
+    from jobfit.analyze import analyze
+
+    jd = "Requirements: strong programming in Python\nMust know sklearn\nNice: tableau"
+    cov = analyze("Python and scikit-learn", jd)["requirements"]["coverage"]
+    assert cov == [
+        {"line": "Requirements: strong programming in Python", "matched": ["python"], "missing": []},
+        {"line": "Must know sklearn", "matched": ["scikit-learn"], "missing": []},
+    ]
+
+
+def test_section_headers_limit_requirement_lines():
+    from jobfit.extract.requirements import RELEVANT_SECTIONS, detect_section_header
+
+    jd = (
+        "Data analyst, 2+ years of experience\n"
+        "## Responsibilities\n"
+        "- Share your experience with the team\n"
+        "**Qualifications:**\n"
+        "- 3 years of SQL\n"
+        "Nice to have: familiar with Tableau\n"
+        "Benefits\n"
+        "- 5 years vesting\n"
+    )
+    assert detect_section_header("**Qualifications:**") == "requirements"
+    assert detect_section_header("Must have 3 years of SQL") is None
+
+    assert len(extract_requirement_lines(jd)) == 5
+    assert extract_requirement_lines(jd, RELEVANT_SECTIONS) == [
+        "Data analyst, 2+ years of experience",
+        "- 3 years of SQL",
+        "Nice to have: familiar with Tableau",
+    ]
+
+
+def test_iter_requirement_lines_streams_with_offsets():
+    import io
+
+    from jobfit.extract.requirements import extract_requirement_spans, iter_requirement_lines
+
+    jd = "About us\n  We value experience.\r\nRequirements\n\tMust know Python  \n"
+    lines = list(iter_requirement_lines(io.StringIO(jd, newline="")))
+    assert [(l.text, l.section) for l in lines] == [
+        ("We value experience.", "other"),
+        ("Requirements", "requirements"),
+        ("Must know Python", "requirements"),
+    ]
+    assert [(l.start, l.end) for l in lines] == extract_requirement_spans(jd)
+    assert all(jd[l.start : l.end] == l.text for l in lines)
@@ -0,0 +1,80 @@
+import json
+
+import pytest
+
+import jobfit.analyze as analyze_module
+from jobfit.analyze import analyze
+from jobfit.result_cache import MemoryResultCache, SqliteResultCache, TieredResultCache
+from jobfit.taxonomy import build_taxonomy
+
+RESUME = "Python, SQL and Tableau. Masters in statistics. 2018-2023"
+JD = "Requirements: 3+ years of Python and SQL. Masters degree required."
+
+
+def _taxonomy(skills):
+    return build_taxonomy(
+        json.dumps({"skills": skills, "synonyms": {}}).encode(),
+        json.dumps({"majors": ["statistics"]}).encode(),
+    )
+
+
+def test_hit_skips_analysis_and_returns_same_result(monkeypatch):
+    cache = MemoryResultCache()
+    first = analyze(RESUME, JD, cache=cache)
+    assert first == analyze(RESUME, JD)
+
+    def boom(*args, **kwargs):
+        raise AssertionError("a cache hit should not re-run scoring")
+
+    monkeypatch.setattr(analyze_module, "score_profiles", boom)
+    again = analyze(RESUME, JD, cache=cache)
+    assert again == first and again is not first
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+def test_key_covers_sections_and_taxonomy_version():
+    cache = MemoryResultCache()
+    analyze(RESUME, JD, cache=cache)
+    assert set(analyze(RESUME, JD, sections=["score"], cache=cache)) == {"score"}
+
+    small = _taxonomy(["python"])
+    large = _taxonomy(["python", "sql"])
+    assert analyze(RESUME, JD, taxonomy=small, cache=cache)["skills"]["jd_skills"] == ["python"]
+    assert analyze(RESUME, JD, taxonomy=large, cache=cache)["skills"]["jd_skills"] == ["python", "sql"]
+    assert (cache.stats.hits, cache.stats.misses) == (0, 4)
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryResultCache(max_entries=2)
+    cache.put("a", {"n": 1})
+    cache.put("b", {"n": 2})
+    assert cache.get("a") == {"n": 1}
+    cache.put("c", {"n": 3})
+    assert cache.get("b") is None
+    assert cache.get("a") == {"n": 1}
+    assert cache.stats.evictions == 1
+
+
+def test_sqlite_cache_persists_and_evicts(tmp_path):
+    path = tmp_path / "results.sqlite"
+    cache = SqliteResultCache(path, max_entries=2)
+    cache.put("a", {"n": 1})
+    cache.put("b", {"n": 2})
+    cache.put("c", {"n": 3})
+    assert len(cache) == 2 and cache.stats.evictions == 1
+    cache.close()
+
+    reopened = SqliteResultCache(path, max_entries=2)
+    assert reopened.get("a") is None
+    assert reopened.get("c") == {"n": 3}
+    assert (reopened.stats.hits, reopened.stats.misses) == (1, 1)
+
+    tiered = TieredResultCache(MemoryResultCache(), reopened)
+    assert tiered.get("b") == {"n": 2}
+    assert tiered.memory.get("b") == {"n": 2}
+    assert (tiered.stats.hits, tiered.stats.misses) == (1, 0)
+
+
+def test_lazy_results_are_not_cached():
+    with pytest.raises(ValueError):
+        analyze(RESUME, JD, lazy=True, cache=MemoryResultCache())
@@ -0,0 +1,94 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from jobfit.analyze import analyze
+from jobfit.service import ScoringService, ServiceClient, start_server
+
+JD = "Requirements: Python, SQL and Tableau\n3+ years of experience\nBachelor's in statistics"
+RESUMES = [
+    "Skills: Python, SQL\nB.S. Statistics\nAnalyst 2018-2023",
+    "Skills: Java\nEngineer 2022-2023",
+    "Python, Tableau. Intern 2023-2024",
+]
+
+
+async def _with_client(service: ScoringService, scenario):
+    server = await start_server(service, port=0)
+    client = ServiceClient("127.0.0.1", server.sockets[0].getsockname()[1])
+    try:
+        return await scenario(client)
+    finally:
+        await client.close()
+        server.close()
+        await server.wait_closed()
+        service.close()
+
+
+def _service(**kwargs) -> ScoringService:
+    return ScoringService(executor=ThreadPoolExecutor(1), **kwargs)
+
+
+def test_analyze_and_rank_match_library():
+    async def scenario(client):
+        analyzed = [await client.request("POST", "/analyze", {"resume": r, "jd": JD}) for r in RESUMES]
+        ranked = await client.request("POST", "/rank", {"jd": JD, "resumes": RESUMES, "k": 2})
+        return analyzed, ranked
+
+    service = _service(rank_chunk_size=2)
+    analyzed, (status, ranked) = asyncio.run(_with_client(service, scenario))
+    expected = [json.loads(json.dumps(analyze(r, JD))) for r in RESUMES]
+    assert analyzed == [(200, e) for e in expected]
+
+    assert status == 200
+    best = sorted(range(len(RESUMES)), key=lambda i: -expected[i]["score"]["total_points"])[:2]
+    assert [row["key"] for row in ranked["results"]] == [str(i) for i in best]
+    assert [row["score"] for row in ranked["results"]] == [expected[i]["score"] for i in best]
+
+
+def test_concurrent_requests_for_one_jd_are_batched():
+    async def scenario(client):
+        clients = [ServiceClient(client.host, client.port) for _ in range(8)]
+        results = await asyncio.gather(
+            *(c.request("POST", "/analyze", {"resume": RESUMES[i % 3], "jd": JD}) for i, c in enumerate(clients))
+        )
+        for c in clients:
+            await c.close()
+        return results, (await client.request("GET", "/stats"))[1]
+
+    service = _service(batch_window=0.05)
+    results, stats = asyncio.run(_with_client(service, scenario))
+    assert all(status == 200 for status, _ in results)
+    assert stats["batches"] < 8
+    assert stats["latency"]["/analyze"]["count"] == 8
+
+
+def test_errors_and_timeouts():
+    async def scenario(client):
+        return [
+            await client.request("POST", "/analyze", {"resume": "python", "jd": JD}),
+            await client.request("POST", "/analyze", {"resume": "python"}),
+            await client.request("POST", "/analyze", {"resume": "python", "jd": JD, "sections": 5}),
+            await client.request("POST", "/rank", {"jd": JD, "resumes": RESUMES, "k": 0}),
+            await client.request("POST", "/rank", {"jd": JD, "resumes": RESUMES, "k": True}),
+            await client.request("GET", "/analyze"),
+            await client.request("GET", "/nope"),
+        ]
+
+    service = _service(timeout=0.01, batch_window=1.0)
+    statuses = [status for status, _ in asyncio.run(_with_client(service, scenario))]
+    assert statuses == [504, 400, 400, 400, 400, 405, 404]
+
+
+def test_oversized_header_line_gets_a_response():
+    async def scenario(client):
+        statuses = []
+        for headers in (b"X-Padding: " + b"a" * 100_000 + b"\r\n", b"X-A: b\r\n" * 1000):
+            reader, writer = await asyncio.open_connection(client.host, client.port)
+            writer.write(b"GET /stats HTTP/1.1\r\n" + headers + b"\r\n")
+            await writer.drain()
+            statuses.append((await reader.readline()).split()[1])
+            writer.close()
+        return statuses
+
+    assert asyncio.run(_with_client(_service(), scenario)) == [b"431", b"431"]
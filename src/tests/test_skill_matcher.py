@@ -0,0 +1,23 @@
+from jobfit.extract.matcher import SkillMatcher
+
+
+def test_single_token_needs_word_boundary():
+    m = SkillMatcher(["r", "go"], {})
+    assert m.extract("experience in r and go") == {"r", "go"}
+    assert m.extract("strong programming background") == set()
+
+
+def test_multiword_and_hyphenated_are_substrings():
+    m = SkillMatcher(["machine learning", "scikit-learn"], {})
+    assert m.extract("deepmachine learningx with scikit-learner") == {"machine learning", "scikit-learn"}
+
+
+def test_overlapping_phrases_and_synonyms():
+    m = SkillMatcher(["deep learning", "learning", "tensorflow"], {"tf": "tensorflow"})
+    assert m.extract("deep learning with tf") == {"deep learning", "learning", "tensorflow"}
+
+
+def test_iter_matches_reports_spans():
+    m = SkillMatcher(["python", "sql"], {})
+    text = "python and sql"
+    assert [(text[s:e], p) for s, e, p in m.iter_matches(text)] == [("python", "python"), ("sql", "sql")]
@@ -0,0 +1,20 @@
+import os
+
+import pytest
+
+from jobfit.bench.startup import DEFERRED_MODULES, import_times
+
+
+def test_cli_import_defers_heavy_modules():
+    times = import_times("jobfit.cli")
+    assert "jobfit.cli" in times
+    assert sorted(m for m in DEFERRED_MODULES if m in times) == []
+
+
+# Wall-clock budgets flake on slow or loaded machines, so the budget is only
+# checked when one is asked for, e.g. JOBFIT_STARTUP_BUDGET_MS=150.
+@pytest.mark.skipif("JOBFIT_STARTUP_BUDGET_MS" not in os.environ, reason="set JOBFIT_STARTUP_BUDGET_MS to check")
+def test_cli_import_fits_budget():
+    budget_ms = float(os.environ["JOBFIT_STARTUP_BUDGET_MS"])
+    runs = [import_times("jobfit.cli") for _ in range(3)]
+    assert min(times["jobfit.cli"][1] for times in runs) / 1000 < budget_ms
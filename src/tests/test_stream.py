@@ -0,0 +1,55 @@
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+import jobfit.profile
+from jobfit.analyze import analyze
+from jobfit.cli import read_input_file
+from jobfit.stream import analyze_records, read_records, write_records
+
+JD_PATH = "src/tests/fixtures/sample_jd.txt"
+RESUME = "Education: B.S. Statistics\nSkills: Python, SQL\nAnalyst 2020-2023"
+
+
+def _run(lines, sections=None):
+    out = io.StringIO()
+    write_records(analyze_records(read_records(lines), read_input_file, sections=sections), out)
+    return [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+def test_stream_matches_analyze_and_keeps_ids():
+    jd_text = read_input_file(Path(JD_PATH))
+    lines = [json.dumps({"id": 1, "resume": RESUME, "jd_path": JD_PATH}), ""]
+    [result] = _run(lines)
+    assert result == {"id": 1, **json.loads(json.dumps(analyze(RESUME, jd_text)))}
+
+
+def test_fields_projection_skips_unrequested_work(monkeypatch):
+    def boom(*args, **kwargs):
+        raise AssertionError("requirement lines should not be extracted")
+
+    monkeypatch.setattr(jobfit.profile, "requirement_skills", boom)
+    [result] = _run([json.dumps({"resume": RESUME, "jd": "Python, 2+ years"})], sections=["score"])
+    assert list(result) == ["score"]
+
+
+def test_bad_records_become_errors(tmp_path):
+    corrupt = tmp_path / "corrupt.pdf"
+    corrupt.write_bytes(b"%PDF-1.4\n not really a pdf")
+    results = _run([
+        "{not json",
+        json.dumps({"id": "x", "resume": RESUME}),
+        json.dumps({"id": "pdf", "resume_path": str(corrupt), "jd": "Python"}),
+        json.dumps({"id": "ok", "resume": RESUME, "jd": "Python"}),
+    ])
+    assert "invalid JSON" in results[0]["error"]
+    assert results[1]["id"] == "x" and "jd" in results[1]["error"]
+    assert results[2]["id"] == "pdf" and results[2]["error"]
+    assert results[3]["id"] == "ok" and "score" in results[3]
+
+
+def test_unknown_section_is_rejected():
+    with pytest.raises(ValueError):
+        analyze(RESUME, "Python", sections=["score", "bogus"])
@@ -0,0 +1,91 @@
+import json
+import os
+import pickle
+
+import pytest
+
+import jobfit.taxonomy as taxonomy_module
+from jobfit.analyze import analyze
+from jobfit.taxonomy import (
+    SNAPSHOT,
+    TaxonomyRegistry,
+    build_taxonomy,
+    default_seed_path,
+    get_taxonomy,
+    load_snapshot,
+    write_snapshot,
+)
+
+
+def _write_seeds(tmp_path, skills, majors=("statistics",)):
+    skills_path = tmp_path / "skills.json"
+    majors_path = tmp_path / "majors.json"
+    skills_path.write_text(json.dumps({"skills": skills, "synonyms": {}}), encoding="utf-8")
+    majors_path.write_text(json.dumps({"majors": list(majors)}), encoding="utf-8")
+    return skills_path, majors_path
+
+
+def test_default_taxonomy_is_cached():
+    assert get_taxonomy() is get_taxonomy()
+    assert "python" in get_taxonomy().skills
+
+
+def test_taxonomy_is_hashable_and_read_only():
+    taxonomy = get_taxonomy()
+    copy = load_snapshot(default_seed_path(SNAPSHOT).read_bytes(), taxonomy.version)
+    assert copy == taxonomy and hash(copy) == hash(taxonomy)
+    assert pickle.loads(pickle.dumps(taxonomy)) == taxonomy
+    with pytest.raises(TypeError):
+        taxonomy.synonyms["py"] = "python"
+
+
+def test_registry_reloads_when_seed_changes(tmp_path):
+    skills_path, majors_path = _write_seeds(tmp_path, ["python"])
+    registry = TaxonomyRegistry(skills_path, majors_path)
+    first = registry.get()
+    assert registry.get() is first
+
+    skills_path.write_text(json.dumps({"skills": ["python", "sql"], "synonyms": {}}), encoding="utf-8")
+    st = skills_path.stat()
+    os.utime(skills_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    second = registry.get()
+    assert second is not first
+    assert second.skills == ("python", "sql")
+    assert second.version != first.version
+
+
+def test_synonyms_must_point_to_known_skills():
+    skills = json.dumps({"skills": ["python"], "synonyms": {"py": "pyhton"}}).encode()
+    with pytest.raises(ValueError):
+        build_taxonomy(skills, json.dumps({"majors": []}).encode())
+
+
+def test_analyze_with_injected_taxonomy_outside_repo_root(tmp_path, monkeypatch):
+    skills_path, majors_path = _write_seeds(tmp_path, ["haskell"])
+    taxonomy = TaxonomyRegistry(skills_path, majors_path).get()
+    monkeypatch.chdir(tmp_path)
+    result = analyze("I write haskell", "We need haskell and python", taxonomy=taxonomy)
+    assert result["skills"]["jd_skills"] == ["haskell"]
+
+
+def test_snapshot_replaces_build_only_for_the_same_seeds(tmp_path, monkeypatch):
+    skills_path, majors_path = _write_seeds(tmp_path, ["python", "sql"])
+    built = TaxonomyRegistry(skills_path, majors_path).get()
+    write_snapshot(built, tmp_path / SNAPSHOT)
+
+    with monkeypatch.context() as m:
+        m.setattr(taxonomy_module, "build_taxonomy", None)  # a snapshot hit must not build
+        loaded = TaxonomyRegistry(skills_path, majors_path).get()
+    assert loaded == built
+    assert loaded.find_skills("python and sql") == built.find_skills("python and sql")
+
+    # Snapshots of other seeds, or unreadable ones, are ignored.
+    write_snapshot(build_taxonomy(json.dumps({"skills": ["java"]}).encode(), majors_path.read_bytes()), tmp_path / SNAPSHOT)
+    assert TaxonomyRegistry(skills_path, majors_path).get().skills == ("python", "sql")
+    (tmp_path / SNAPSHOT).write_bytes(b"not a snapshot")
+    assert TaxonomyRegistry(skills_path, majors_path).get().skills == ("python", "sql")
+
+
+def test_bundled_snapshot_is_current():
+    # After editing the seeds, regenerate it with `python -m jobfit.taxonomy`.
+    assert load_snapshot(default_seed_path(SNAPSHOT).read_bytes(), get_taxonomy().version) is not None
@@ -0,0 +1,66 @@
+import io
+import json
+import tracemalloc
+
+from jobfit.analyze import SECTIONS, WEIGHTS, analyze
+from jobfit.metrics import JsonlSink, PrometheusSink
+from jobfit.result_cache import MemoryResultCache, result_key
+from jobfit.taxonomy import get_taxonomy
+from jobfit.timing import StageTimer, recording, stage
+
+RESUME = "Skills: Python, SQL\nEducation\nB.S. Statistics\nAnalyst 2019-2023"
+JD = "Requirements: Python and Tableau\n2+ years of experience"
+
+
+def test_timings_section_is_optional_and_covers_stages():
+    plain = analyze(RESUME, JD)
+    timed = analyze(RESUME, JD, timings=True)
+    assert "timings" not in plain
+    assert {k: v for k, v in timed.items() if k != "timings"} == plain
+
+    report = timed["timings"]
+    assert {"resume.normalize", "resume.skills", "jd.skills", "jd.requirements", "score"} <= set(report["stages"])
+    assert report["total_ms"] >= sum(row["ms"] for row in report["stages"].values())
+
+    timer = StageTimer(allocations=True)
+    try:
+        with_allocations = analyze(RESUME, JD, timings=timer)["timings"]
+    finally:
+        timer.close()  # a caller-supplied timer is not closed by analyze()
+    assert all("peak_kb" in row for row in with_allocations["stages"].values())
+    assert not tracemalloc.is_tracing()
+
+
+def test_stage_is_a_no_op_without_a_timer():
+    assert stage("a") is stage("b")
+    timer = StageTimer()
+    with recording(timer):
+        with stage("a"):
+            pass
+        with stage("a"):
+            pass
+    with stage("a"):
+        pass
+    assert timer.calls == {"a": 2}
+
+
+def test_metrics_sinks_and_cache_hits():
+    out = io.StringIO()
+    jsonl = JsonlSink(out)
+    prometheus = PrometheusSink()
+    seen = []
+    cache = MemoryResultCache()
+
+    for sink in (jsonl, prometheus, seen.append):
+        analyze(RESUME, JD, cache=cache, metrics=sink)
+
+    # Only the first call computed anything; the others were cache hits.
+    key = result_key(RESUME, JD, frozenset(SECTIONS), get_taxonomy().version, WEIGHTS)
+    assert "timings" not in cache.get(key)
+    first = json.loads(out.getvalue())
+    assert "score" in first["stages"]
+    assert set(seen[0]["stages"]) == {"cache.lookup"}
+
+    text = prometheus.render()
+    assert "jobfit_analyze_total 1\n" in text
+    assert 'jobfit_stage_calls_total{stage="cache.lookup"} 1\n' in text
@@ -0,0 +1,51 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from jobfit.profile import DocumentProfile
+from jobfit.score.education_scoring import score_education
+from jobfit.score.experience_scoring import score_experience
+from jobfit.score.scoring import score_skills
+from jobfit.score.vectorized import VectorScorer
+from jobfit.taxonomy import get_taxonomy
+
+
+def _profile(rng, kind, taxonomy):
+    years = rng.choice([None, 0, 1, 2, 3, 5, 7]) if kind == "jd" else float(rng.randint(0, 12))
+    return DocumentProfile(
+        kind=kind,
+        text="",
+        norm="",
+        skills=frozenset(rng.sample(taxonomy.skills, rng.randint(0, 12))),
+        degree=rng.choice([None, "bachelors", "masters", "phd"]),
+        majors=frozenset(rng.sample(taxonomy.majors, rng.randint(0, 2))),
+        years=years,
+    )
+
+
+def test_vectorized_scores_match_scalar_functions():
+    rng = random.Random(0)
+    taxonomy = get_taxonomy()
+    scorer = VectorScorer(taxonomy)
+    resumes = [_profile(rng, "resume", taxonomy) for _ in range(300)]
+    matrix = scorer.encode_profiles(resumes)
+
+    for _ in range(30):
+        jd = _profile(rng, "jd", taxonomy)
+        out = scorer.score(jd, matrix)
+        for i, r in enumerate(resumes):
+            skills = score_skills(jd.skills, r.skills, max_points=50)
+            edu = score_education(jd.degree, r.degree, jd.majors, r.majors, max_points=15)["education_total"]
+            exp = score_experience(jd.years, r.years, max_points=35)["experience_total"]
+            assert out.skills_points[i] == skills
+            assert out.education_points[i] == edu
+            assert out.experience_points[i] == exp
+            assert out.total_points[i] == skills + edu + exp
+
+
+def test_bitset_round_trip():
+    scorer = VectorScorer()
+    names = {"python", "sql", "tableau"}
+    assert scorer.skills.decode(scorer.skills.encode(names)) == names